@@ -93,6 +93,19 @@ from opteryx.__version__ import __author__
 from opteryx.__version__ import __build__
 from opteryx.__version__ import __version__
 
+# the joins and sorts allocate and free a lot of short-lived buffers, which some allocators
+# handle better than others, Arrow's ARROW_DEFAULT_MEMORY_POOL does the same for all of Arrow
+if config.ARROW_MEMORY_POOL is not None:  # pragma: no cover
+    if config.ARROW_MEMORY_POOL in pyarrow.supported_memory_backends():
+        pyarrow.set_memory_pool(getattr(pyarrow, f"{config.ARROW_MEMORY_POOL}_memory_pool")())
+    else:
+        warnings.warn(
+            f"ARROW_MEMORY_POOL '{config.ARROW_MEMORY_POOL}' isn't available, this build of "
+            f"pyarrow supports {', '.join(pyarrow.supported_memory_backends())}. Using "
+            f"'{pyarrow.default_memory_pool().backend_name}'.",
+            stacklevel=2,
+        )
+
 
 __all__ = [
     "apilevel",
@@ -1,3 +1,4 @@
+from .hash_table import FlatHashTable
 from .hash_table import HashSet
 from .hash_table import HashTable
 from .hash_table import anti_join
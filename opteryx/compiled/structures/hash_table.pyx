@@ -10,7 +10,7 @@
 from libcpp.unordered_map cimport unordered_map
 from libcpp.unordered_set cimport unordered_set
 from libcpp.vector cimport vector
-from libc.stdint cimport int64_t, int32_t, uint8_t
+from libc.stdint cimport int64_t, int32_t, uint8_t, uint64_t
 from libcpp.pair cimport pair
 from libc.math cimport isnan
 
@@ -43,6 +43,163 @@ cdef class HashTable:
         return vector[int64_t]()
 
 
+cdef class FlatHashTable:
+    """
+    A hash table of row ids held in flat arrays.
+
+    Each bucket holds the first row of a chain and `next_rows` links each row
+    to the next one in the same bucket, so the table is a few contiguous int64
+    arrays rather than a vector per key. Rows in a chain are compared on their
+    full hash, so buckets can be shared by different keys.
+    """
+    cdef:
+        int64_t[::1] heads
+        int64_t[::1] next_rows
+        int64_t[::1] hashes
+        uint64_t mask
+
+    def __init__(self, int64_t[::1] hashes, uint8_t[::1] null_keys, int workers=1):
+        """
+        Parameters:
+            hashes: The hash of the join key for each row.
+            null_keys: Flags (as uint8) the rows with a null in the join key,
+                these can never match so are left out of the table.
+            workers: The number of threads to fill the table with, each fills
+                its own contiguous range of buckets so they never contend.
+        """
+        cdef Py_ssize_t n = hashes.shape[0]
+        cdef uint64_t num_buckets = 16, shard_size, num_shards
+        cdef int64_t[::1] rows
+        cdef int64_t[::1] shard_starts
+
+        while num_buckets < <uint64_t>(n * 2):
+            num_buckets <<= 1
+
+        self.mask = num_buckets - 1
+        self.hashes = hashes
+        self.heads = numpy.full(num_buckets, -1, dtype=numpy.int64)
+        self.next_rows = numpy.full(n, -1, dtype=numpy.int64)
+
+        num_shards = max(1, min(workers, num_buckets))
+        shard_size = (num_buckets + num_shards - 1) // num_shards
+        num_shards = (num_buckets + shard_size - 1) // shard_size
+
+        # group the rows by the shard of buckets they land in, one pass over the rows,
+        # so each worker only visits its own rows
+        rows = numpy.empty(n, dtype=numpy.int64)
+        shard_starts = numpy.zeros(num_shards + 1, dtype=numpy.int64)
+        with nogil:
+            self._partition(null_keys, shard_size, rows, shard_starts)
+
+        if num_shards == 1:
+            with nogil:
+                self._insert(rows, shard_starts[0], shard_starts[1])
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=num_shards) as pool:
+            shards = [
+                pool.submit(self._insert_shard, rows, shard_starts[shard], shard_starts[shard + 1])
+                for shard in range(num_shards)
+            ]
+            for future in shards:
+                future.result()
+
+    cdef void _partition(
+        self,
+        uint8_t[::1] null_keys,
+        uint64_t shard_size,
+        int64_t[::1] rows,
+        int64_t[::1] shard_starts,
+    ) noexcept nogil:
+        cdef Py_ssize_t i, shard, num_shards = shard_starts.shape[0] - 1
+        cdef vector[int64_t] cursors
+
+        # count the rows in each shard, then turn the counts into the start offsets
+        for i in range(self.hashes.shape[0]):
+            if not null_keys[i]:
+                shard_starts[((<uint64_t>self.hashes[i] & self.mask) // shard_size) + 1] += 1
+        for shard in range(num_shards):
+            shard_starts[shard + 1] += shard_starts[shard]
+
+        # the rows are written backwards so inserting them in order gives each chain its
+        # rows in ascending order
+        cursors.resize(num_shards)
+        for shard in range(num_shards):
+            cursors[shard] = shard_starts[shard]
+        for i in range(self.hashes.shape[0] - 1, -1, -1):
+            if not null_keys[i]:
+                shard = (<uint64_t>self.hashes[i] & self.mask) // shard_size
+                rows[cursors[shard]] = i
+                cursors[shard] += 1
+
+    def _insert_shard(self, int64_t[::1] rows, int64_t start, int64_t end):
+        with nogil:
+            self._insert(rows, start, end)
+
+    cdef void _insert(self, int64_t[::1] rows, int64_t start, int64_t end) noexcept nogil:
+        cdef Py_ssize_t i
+        cdef int64_t row
+        cdef uint64_t bucket
+
+        for i in range(start, end):
+            row = rows[i]
+            bucket = <uint64_t>self.hashes[row] & self.mask
+            self.next_rows[row] = self.heads[bucket]
+            self.heads[bucket] = row
+
+    cpdef tuple probe(self, int64_t[::1] keys):
+        """
+        Look up a batch of keys in one call.
+
+        Parameters:
+            keys: The hashes to look up.
+
+        Returns:
+            A tuple of two int64 arrays, the position in `keys` and the
+            matching row id (-1 where there's no match).
+        """
+        cdef:
+            Py_ssize_t i, n = keys.shape[0]
+            Py_ssize_t cursor = 0, total = 0, matches
+            int64_t key, row
+            cnp.ndarray[int64_t, ndim=1] key_positions
+            cnp.ndarray[int64_t, ndim=1] row_ids
+
+        with nogil:
+            for i in range(n):
+                key = keys[i]
+                matches = 0
+                row = self.heads[<uint64_t>key & self.mask]
+                while row >= 0:
+                    if self.hashes[row] == key:
+                        matches += 1
+                    row = self.next_rows[row]
+                total += matches if matches > 0 else 1
+
+        key_positions = numpy.empty(total, dtype=numpy.int64)
+        row_ids = numpy.empty(total, dtype=numpy.int64)
+
+        for i in range(n):
+            key = keys[i]
+            matches = 0
+            row = self.heads[<uint64_t>key & self.mask]
+            while row >= 0:
+                if self.hashes[row] == key:
+                    key_positions[cursor] = i
+                    row_ids[cursor] = row
+                    cursor += 1
+                    matches += 1
+                row = self.next_rows[row]
+            if matches == 0:
+                key_positions[cursor] = i
+                row_ids[cursor] = -1
+                cursor += 1
+
+        return key_positions, row_ids
+
+
 cdef class HashSet:
     cdef unordered_set[int64_t] c_set
 
@@ -292,65 +449,76 @@ cpdef HashSet filter_join_set(relation, list join_columns, HashSet seen_hashes):
 
     return seen_hashes
 
-cpdef anti_join(relation, list join_columns, HashSet seen_hashes):
+cdef cnp.ndarray _non_null_rows(relation, list join_columns):
+    # the rows where none of the join columns are null, in row order
+    cdef cnp.ndarray valid = numpy.ones(relation.num_rows, dtype=numpy.bool_)
+    for column_name in join_columns:
+        column = relation.column(column_name)
+        if column.null_count > 0:
+            valid &= column.is_valid().to_numpy(zero_copy_only=False)
+    return numpy.flatnonzero(valid)
+
+
+cdef cnp.ndarray _filter_join_matches(relation, list join_columns, HashSet seen_hashes):
+    """
+    Flag (as uint8) the rows of the relation whose join key is in the set,
+    rows with a null in the join key never match.
+    """
     cdef int64_t num_columns = len(join_columns)
-    cdef int64_t num_rows = relation.shape[0]
     cdef int64_t hash_value, i
-    cdef cnp.ndarray[int64_t, ndim=1] index_buffer = numpy.empty(num_rows, dtype=numpy.int64)
-    cdef int64_t idx_count = 0
+    cdef cnp.ndarray[uint8_t, ndim=1] matches = numpy.zeros(relation.num_rows, dtype=numpy.uint8)
+    cdef cnp.ndarray[int64_t, ndim=1] non_null_rows
 
+    if seen_hashes is None or relation.num_rows == 0:
+        return matches
+
+    # the values are taken from the non-null rows only, so map them back to
+    # their row in the relation
+    non_null_rows = _non_null_rows(relation, join_columns)
     cdef object[:, ::1] values_array = numpy.array(list(relation.select(join_columns).drop_null().itercolumns()), dtype=object)
 
     if num_columns == 1:
         col = values_array[0, :]
         for i in range(len(col)):
             hash_value = <int64_t>hash(col[i])
-            if not seen_hashes.contains(hash_value):
-                index_buffer[idx_count] = i
-                idx_count += 1
+            if seen_hashes.contains(hash_value):
+                matches[non_null_rows[i]] = 1
     else:
         for i in range(values_array.shape[1]):
             # Combine the hashes of each value in the row
             hash_value = 0
             for value in values_array[:, i]:
                 hash_value = <int64_t>(hash_value * 31 + hash(value))
-            if not seen_hashes.contains(hash_value):
-                index_buffer[idx_count] = i
-                idx_count += 1
+            if seen_hashes.contains(hash_value):
+                matches[non_null_rows[i]] = 1
 
-    if idx_count > 0:
-        return relation.take(index_buffer[:idx_count])
-    else:
-        return relation.slice(0, 0)
+    return matches
 
 
-cpdef semi_join(relation, list join_columns, HashSet seen_hashes):
-    cdef int64_t num_columns = len(join_columns)
-    cdef int64_t num_rows = relation.shape[0]
-    cdef int64_t hash_value, i
-    cdef cnp.ndarray[int64_t, ndim=1] index_buffer = numpy.empty(num_rows, dtype=numpy.int64)
-    cdef int64_t idx_count = 0
+cpdef anti_join(relation, list join_columns, HashSet seen_hashes):
+    """
+    Keep the rows of the relation with no match in the set, including those
+    with nulls in their join key.
+    """
+    cdef cnp.ndarray matches = _filter_join_matches(relation, join_columns, seen_hashes)
+    cdef cnp.ndarray index_buffer = numpy.flatnonzero(matches == 0)
 
-    cdef object[:, ::1] values_array = numpy.array(list(relation.select(join_columns).drop_null().itercolumns()), dtype=object)
+    if len(index_buffer) == relation.num_rows:
+        return relation
+    if len(index_buffer) > 0:
+        return relation.take(index_buffer)
+    return relation.slice(0, 0)
 
-    if num_columns == 1:
-        col = values_array[0, :]
-        for i in range(len(col)):
-            hash_value = <int64_t>hash(col[i])
-            if seen_hashes.contains(hash_value):
-                index_buffer[idx_count] = i
-                idx_count += 1
-    else:
-        for i in range(values_array.shape[1]):
-            # Combine the hashes of each value in the row
-            hash_value = 0
-            for value in values_array[:, i]:
-                hash_value = <int64_t>(hash_value * 31 + hash(value))
-            if seen_hashes.contains(hash_value):
-                index_buffer[idx_count] = i
-                idx_count += 1
 
-    if idx_count > 0:
-        return relation.take(index_buffer[:idx_count])
-    else:
-        return relation.slice(0, 0)
\ No newline at end of file
+cpdef semi_join(relation, list join_columns, HashSet seen_hashes):
+    """
+    Keep the rows of the relation with a match in the set.
+    """
+    cdef cnp.ndarray matches = _filter_join_matches(relation, join_columns, seen_hashes)
+    cdef cnp.ndarray index_buffer = numpy.flatnonzero(matches)
+
+    if len(index_buffer) == relation.num_rows:
+        return relation
+    if len(index_buffer) > 0:
+        return relation.take(index_buffer)
+    return relation.slice(0, 0)
@@ -178,4 +178,6 @@ ENABLE_RESOURCE_LOGGING: bool = bool(get("ENABLE_RESOURCE_LOGGING", False))
 MORSEL_SIZE: int = int(get("MORSEL_SIZE", 64 * 1024 * 1024))
 # not GA
 PROFILE_LOCATION:str = get("PROFILE_LOCATION")
+# the Arrow allocator to use ('jemalloc', 'mimalloc' or 'system'), by default Arrow's own choice is left alone
+ARROW_MEMORY_POOL: Optional[str] = get("ARROW_MEMORY_POOL")
 # fmt:on
@@ -70,7 +70,10 @@ class Connection:
 
     @property
     def history(self):
-        """Returns a list of queries previously run on this connection"""
+        """
+        Returns the queries previously run on this connection, as (statement, success,
+        start) tuples. Only the most recent MAX_HISTORY_ITEMS queries are kept.
+        """
         return self.context.history
 
     @staticmethod
@@ -7,8 +7,12 @@
 The BaseConnector provides a common interface for all storage connectors.
 """
 
+import queue
+import threading
+from itertools import islice
 from typing import Any
 from typing import Dict
+from typing import Generator
 from typing import Iterable
 from typing import Optional
 
@@ -20,6 +24,76 @@ from opteryx.models import QueryStatistics
 MIN_CHUNK_SIZE: int = 500
 INITIAL_CHUNK_SIZE: int = 500
 DEFAULT_MORSEL_SIZE: int = 16 * 1024 * 1024
+PREFETCH_BATCH_SIZE: int = 500
+PREFETCH_BATCHES: int = 2
+
+_END = object()
+
+
+def prefetch_records(
+    records: Iterable[dict], batch_size: int = PREFETCH_BATCH_SIZE
+) -> Generator[dict, None, None]:
+    """
+    Pull records from an iterable on a background thread.
+
+    Document stores fetch records one (or a page) at a time, this allows the fetching of
+    the next batch of records to overlap with the consumer building morsels from the
+    previous batch. At most PREFETCH_BATCHES batches are held waiting to be consumed.
+
+    The first batch is read in the consumer's thread, if that's all there is no thread
+    is started.
+    """
+    records = iter(records)
+    first_batch = list(islice(records, batch_size))
+    if len(first_batch) < batch_size:
+        yield from first_batch
+        return
+
+    buffer: queue.Queue = queue.Queue(maxsize=PREFETCH_BATCHES)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # don't block forever if the consumer has stopped reading
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch():
+        try:
+            batch = []
+            for record in records:
+                batch.append(record)
+                if len(batch) == batch_size:
+                    if not _put(batch):
+                        return
+                    batch = []
+            if batch:
+                _put(batch)
+        except BaseException as err:
+            # errors are raised in the consumer's thread, this includes the likes of
+            # SystemExit, otherwise the consumer would take a partial read as complete
+            _put(err)
+        finally:
+            _put(_END)
+
+    fetcher = threading.Thread(target=_fetch, name="opteryx-prefetch", daemon=True)
+    fetcher.start()
+
+    try:
+        yield from first_batch
+        while True:
+            batch = buffer.get()
+            if batch is _END:
+                break
+            if isinstance(batch, BaseException):
+                raise batch
+            yield from batch
+    finally:
+        stop.set()
 
 
 class BaseConnector:
@@ -83,11 +157,16 @@ class BaseConnector:
         columns: Optional[list] = None,
         morsel_size: int = DEFAULT_MORSEL_SIZE,
         initial_chunk_size: int = INITIAL_CHUNK_SIZE,
+        prefetch: bool = False,
     ) -> pyarrow.Table:
         chunk = []
         self.chunk_size = initial_chunk_size  # we reset each time
         morsel = None
 
+        # remote stores opt in to fetching the next records while we build morsels
+        if prefetch:
+            dictset = prefetch_records(dictset)
+
         for index, record in enumerate(dictset):
             _id = record.pop("_id", None)
             # column selection
@@ -153,6 +153,7 @@ class CqlConnector(BaseConnector, PredicatePushable):
         for morsel in self.chunk_dictset(
             (doc._asdict() for doc in results),
             initial_chunk_size=chunk_size,
+            prefetch=True,
         ):
             at_least_once = True
             yield morsel
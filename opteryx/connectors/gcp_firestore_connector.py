@@ -113,6 +113,7 @@ class GcpFireStoreConnector(BaseConnector, PredicatePushable):
             ({**doc.to_dict(), "_id": doc.id} for doc in documents),
             columns=columns,
             initial_chunk_size=chunk_size,
+            prefetch=True,
         ):
             if collected_predicates:
                 morsel = filter_records(collected_predicates, morsel)
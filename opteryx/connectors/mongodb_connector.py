@@ -65,7 +65,9 @@ class MongoDbConnector(BaseConnector):
         client = pymongo.MongoClient(self.connection)  # type:ignore
         database = client[self.database]
         documents = database[self.dataset].find()
-        for morsel in self.chunk_dictset(documents, columns=columns, initial_chunk_size=chunk_size):
+        for morsel in self.chunk_dictset(
+            documents, columns=columns, initial_chunk_size=chunk_size, prefetch=True
+        ):
             yield morsel
 
     def get_dataset_schema(self) -> RelationSchema:
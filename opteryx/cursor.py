@@ -33,64 +33,61 @@ from opteryx.exceptions import MissingSqlStatement
 from opteryx.exceptions import SqlError
 from opteryx.exceptions import UnsupportedSyntaxError
 from opteryx.models import QueryStatistics
+from opteryx.models.connection_context import HistoryItem
 from opteryx.utils import sql
 
 PROFILE_LOCATION = config.PROFILE_LOCATION
 
+# The planner and executor import this module, so these are bound on first use rather
+# than at import time, this saves resolving the imports for every statement.
+_query_planner = None
+_execute = None
+_system_statistics = None
 
-class CursorState(Enum):
-    INITIALIZED = auto()
-    EXECUTED = auto()
-    CLOSED = auto()
 
+def _bind_execution_functions():
+    global _query_planner, _execute, _system_statistics
 
-def require_state(required_state):
-    """
-    Decorator to enforce a required state before a Cursor method is called.
+    from opteryx import system_statistics
+    from opteryx.managers.execution import execute
+    from opteryx.planner import query_planner
 
-    The decorator takes a required_state parameter which is the state the Cursor
-    must be in before the decorated method can be called. If the state condition
-    is not met, an InvalidCursorStateError is raised.
+    _query_planner = query_planner
+    _system_statistics = system_statistics
+    # callers only check _execute, so bind it last, once everything else is set
+    _execute = execute
 
-    Parameters:
-        required_state: The state that the cursor must be in to execute the method.
 
-    Returns:
-        A wrapper function that checks the state and calls the original function.
-    """
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(obj, *args, **kwargs):
-            if obj._state != required_state:
-                raise InvalidCursorStateError(f"Cursor must be in {required_state} state.")
-            return func(obj, *args, **kwargs)
-
-        return wrapper
-
-    return decorator
+class CursorState(Enum):
+    INITIALIZED = auto()
+    EXECUTED = auto()
+    CLOSED = auto()
 
 
-def transition_to(new_state):
+def state_transition(required_state, new_state):
     """
-    Decorator to transition the Cursor to a new state after a method call.
+    Decorator to enforce a required state before a Cursor method is called and to
+    transition the Cursor to a new state after the call.
 
-    The decorator takes a new_state parameter which is the state the Cursor
-    will transition to after the decorated method is called.
+    If the Cursor isn't in the required state an InvalidCursorStateError is raised. If
+    the method raises an error the state is not changed.
 
     Parameters:
+        required_state: The state that the cursor must be in to execute the method.
         new_state: The new state to transition to after the method is called.
 
     Returns:
-        A wrapper function that executes the original function and then updates the state.
+        A wrapper function that checks the state, calls the original function and then
+        updates the state.
     """
 
     def decorator(func):
         @wraps(func)
         def wrapper(obj, *args, **kwargs):
-            # Execute the original method.
+            # states are enum members, so we can compare identities
+            if obj._state is not required_state:
+                raise InvalidCursorStateError(f"Cursor must be in {required_state} state.")
             result = func(obj, *args, **kwargs)
-            # Transition to the new state.
             obj._state = new_state
             return result
 
@@ -103,7 +100,7 @@ class Cursor(DataFrame):
     """
     This class inherits from the orso DataFrame library to provide features such as fetch.
 
-    This class includes custom decorators @require_state and @transition_to for state management.
+    This class includes a custom decorator @state_transition for state management.
     """
 
     def __init__(self, connection):
@@ -116,6 +113,7 @@ class Cursor(DataFrame):
         """
         self.arraysize = 1
         self._connection = connection
+        self._history_append = connection.context.history.append
         self._query_planner = None
         self._collected_stats = None
         self._plan = None
@@ -153,18 +151,20 @@ class Cursor(DataFrame):
         Returns:
             Results of the query execution.
         """
-        from opteryx import system_statistics
-        from opteryx.managers.execution import execute
-        from opteryx.planner import query_planner
+        if _execute is None:
+            _bind_execution_functions()
 
         if not operation:  # pragma: no cover
             raise MissingSqlStatement("SQL provided was empty.")
 
-        self._connection.context.history.append((operation, True, datetime.datetime.utcnow()))
+        history_item = HistoryItem(
+            operation, False, datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        )
+        self._history_append(history_item)
 
         try:
             start = time.time_ns()
-            plan = query_planner(
+            plan = _query_planner(
                 operation=operation,
                 parameters=params,
                 visibility_filters=visibility_filters,
@@ -176,17 +176,19 @@ class Cursor(DataFrame):
         except RuntimeError as err:  # pragma: no cover
             raise SqlError(f"Error Executing SQL Statement ({err})") from err
 
-        results = execute(plan, statistics=self._statistics)
+        results = _execute(plan, statistics=self._statistics)
         start = time.time_ns()
 
-        system_statistics.queries_executed += 1
+        _system_statistics.queries_executed += 1
 
         if results is not None:
-            # we can't update tuples directly
-            self._connection.context.history[-1] = tuple(
-                True if i == 1 else value
-                for i, value in enumerate(self._connection.context.history[-1])
-            )
+            # history items are tuples, so swap ours for a completed copy, it's almost
+            # always the last item unless another cursor on the connection has run since
+            history = self._connection.context.history
+            for index in range(len(history) - 1, -1, -1):
+                if history[index] is history_item:
+                    history[index] = history_item._replace(completed=True)
+                    break
             return results
 
     def _execute_statements(
@@ -231,8 +233,7 @@ class Cursor(DataFrame):
         # we only return the last result set
         return results
 
-    @require_state(CursorState.INITIALIZED)
-    @transition_to(CursorState.EXECUTED)
+    @state_transition(CursorState.INITIALIZED, CursorState.EXECUTED)
     def execute(
         self,
         operation: str,
@@ -248,8 +249,8 @@ class Cursor(DataFrame):
             params: Iterable, optional
                 Parameters for the SQL operation, defaults to None.
         """
-        if hasattr(operation, "decode"):
-            operation = operation.decode()
+        if isinstance(operation, (bytes, bytearray, memoryview)):
+            operation = bytes(operation).decode()
         results = self._execute_statements(operation, params, visibility_filters)
         if results is not None:
             result_data, self._result_type = results
@@ -291,8 +292,7 @@ class Cursor(DataFrame):
             return self._rowcount
         raise InvalidCursorStateError("Cursor not in valid state to return a row count.")
 
-    @require_state(CursorState.INITIALIZED)
-    @transition_to(CursorState.EXECUTED)
+    @state_transition(CursorState.INITIALIZED, CursorState.EXECUTED)
     def execute_to_arrow(
         self,
         operation: str,
@@ -314,8 +314,8 @@ class Cursor(DataFrame):
         Returns:
             The query results in Arrow table format.
         """
-        if hasattr(operation, "decode"):
-            operation = operation.decode()
+        if isinstance(operation, (bytes, bytearray, memoryview)):
+            operation = bytes(operation).decode()
         results = self._execute_statements(operation, params, visibility_filters)
         if results is not None:
             result_data, self._result_type = results
@@ -337,7 +337,14 @@ class Cursor(DataFrame):
         if isinstance(result_data, pyarrow.Table):
             return result_data
         try:
-            return pyarrow.concat_tables(result_data, promote_options="permissive")
+            tables = list(result_data)
+            if len(tables) == 1:
+                return tables[0]
+            # only reconcile the schemas if they're different
+            first_schema = tables[0].schema if tables else None
+            if first_schema is not None and all(t.schema.equals(first_schema) for t in tables):
+                return pyarrow.concat_tables(tables, promote_options="none")
+            return pyarrow.concat_tables(tables, promote_options="permissive")
         except (
             pyarrow.ArrowInvalid,
             pyarrow.ArrowTypeError,
@@ -373,8 +380,7 @@ class Cursor(DataFrame):
         """
         return self._statistics.messages
 
-    @require_state(CursorState.EXECUTED)
-    @transition_to(CursorState.CLOSED)
+    @state_transition(CursorState.EXECUTED, CursorState.CLOSED)
     def close(self):
         """
         Closes the cursor, releasing any resources and closing the associated connection.
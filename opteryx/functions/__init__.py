@@ -53,8 +53,11 @@ def _get(array, key):
     if isinstance(key, str):
         import simdjson
 
+        # reuse one parser, creating a parser for each document is expensive
+        parser = simdjson.Parser()
+
         def extract(doc, elem):
-            value = simdjson.Parser().parse(doc).get(elem)  # type:ignore
+            value = parser.parse(doc).get(elem)  # type:ignore
             if hasattr(value, "as_list"):
                 return value.as_list()
             if hasattr(value, "as_dict"):
@@ -399,12 +402,12 @@ FUNCTIONS = {
 
     # HASHING & ENCODING
     "HASH": _iterate_single_parameter(lambda x: hex(CityHash64(str(x)))[2:]),
-    "MD5": _iterate_single_parameter(string_functions.get_md5),
-    "SHA1": _iterate_single_parameter(string_functions.get_sha1),
-    "SHA224": _iterate_single_parameter(string_functions.get_sha224),
-    "SHA256": _iterate_single_parameter(string_functions.get_sha256),
-    "SHA384": _iterate_single_parameter(string_functions.get_sha384),
-    "SHA512": _iterate_single_parameter(string_functions.get_sha512),
+    "MD5": string_functions.hash_digests("md5"),
+    "SHA1": string_functions.hash_digests("sha1"),
+    "SHA224": string_functions.hash_digests("sha224"),
+    "SHA256": string_functions.hash_digests("sha256"),
+    "SHA384": string_functions.hash_digests("sha384"),
+    "SHA512": string_functions.hash_digests("sha512"),
     "RANDOM": number_functions.random_number,
     "RAND": number_functions.random_number,
     "NORMAL": number_functions.random_normal,
@@ -67,64 +67,25 @@ def soundex(arr):
     return numpy.array(interim, dtype=numpy.str_)
 
 
-def get_md5(item):
-    """calculate MD5 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
-
-    if item is None:
-        return None
-
-    return hashlib.md5(str(item).encode()).hexdigest()  # nosec - meant to be MD5
-
-
-def get_sha1(item):
-    """calculate SHA1 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
-
-    if item is None:
-        return None
-
-    return hashlib.sha1(str(item).encode()).hexdigest()
-
-
-def get_sha224(item):
-    """calculate SHA256 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
-
-    if item is None:
-        return None
-
-    return hashlib.sha224(str(item).encode()).hexdigest()
-
-
-def get_sha256(item):
-    """calculate SHA256 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
-
-    if item is None:
-        return None
-
-    return hashlib.sha256(str(item).encode()).hexdigest()
-
-
-def get_sha384(item):
-    """calculate SHA256 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
-
-    if item is None:
-        return None
-
-    return hashlib.sha384(str(item).encode()).hexdigest()
-
+def hash_digests(algorithm: str):
+    """
+    Build a function returning the hex digest of each value in an array using a hashlib
+    algorithm, hashlib calls into OpenSSL which uses hardware acceleration where available.
+    """
+    import hashlib
 
-def get_sha512(item):
-    """calculate SHA512 hash of a value"""
-    import hashlib  # delay the import - it's rarely needed
+    constructor = getattr(hashlib, algorithm)
 
-    if item is None:
-        return None
+    def _inner(arr):
+        # MD5 is one of the digests users can ask for, it isn't used for security
+        digests = [
+            None if item is None else constructor(str(item).encode()).hexdigest()  # nosec
+            for item in arr
+        ]
+        # always object, so the type doesn't depend on whether there are nulls
+        return numpy.array(digests, dtype=object)
 
-    return hashlib.sha512(str(item).encode()).hexdigest()
+    return _inner
 
 
 def get_base64_encode(item):
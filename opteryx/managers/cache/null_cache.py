@@ -4,6 +4,8 @@
 # Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
 
 from typing import Any
+from typing import Dict
+from typing import List
 
 
 class NullCache:
@@ -13,5 +15,11 @@ class NullCache:
     def set(self, key: bytes, value: Any) -> None:
         return None
 
+    def get_many(self, keys: List[bytes]) -> List[None]:
+        return [None] * len(keys)
+
+    def set_many(self, items: Dict[bytes, Any]) -> None:
+        return None
+
     def touch(self, key: str):
         pass
@@ -4,7 +4,10 @@ This implements an interface to Valkey
 If we have 10 failures in a row, stop trying to use the cache.
 """
 
+import datetime
 import os
+from typing import Dict
+from typing import List
 from typing import Union
 
 from orso.tools import single_item_cache
@@ -48,8 +51,6 @@ class ValkeyCache(BaseKeyValueStore):
         """
         self._server = _valkey_server(**kwargs)
         if self._server is None:
-            import datetime
-
             print(f"{datetime.datetime.now()} [CACHE] Unable to set up valkey cache.")
             self._consecutive_failures: int = MAXIMUM_CONSECUTIVE_FAILURES
         else:
@@ -61,28 +62,38 @@ class ValkeyCache(BaseKeyValueStore):
         self.sets: int = 0
 
     def get(self, key: bytes) -> Union[bytes, None]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[bytes]) -> List[Union[bytes, None]]:
+        if not keys:
+            return []
         if self._consecutive_failures >= MAXIMUM_CONSECUTIVE_FAILURES:
-            self.skips += 1
-            return None
+            self.skips += len(keys)
+            return [None] * len(keys)
         try:
-            response = self._server.get(key)  # Adjust based on Valkey's API
+            # MGET retrieves all of the keys in a single round trip
+            responses = self._server.mget(keys)
             self._consecutive_failures = 0
-            if response:
-                self.hits += 1
-                return bytes(response)
         except Exception as err:  # pragma: no cover
+            # a failed batch counts as a single failure
             self._consecutive_failures += 1
-            if self._consecutive_failures >= MAXIMUM_CONSECUTIVE_FAILURES:
-                import datetime
-
+            # only report when we trip the circuit breaker
+            if self._consecutive_failures == MAXIMUM_CONSECUTIVE_FAILURES:
                 print(
                     f"{datetime.datetime.now()} [CACHE] Disabling remote Valkey cache due to persistent errors ({err})."
                 )
             self.errors += 1
-            return None
+            return [None] * len(keys)
 
-        self.misses += 1
-        return None
+        results: List[Union[bytes, None]] = []
+        for response in responses:
+            if response:
+                self.hits += 1
+                results.append(response if type(response) is bytes else bytes(response))
+            else:
+                self.misses += 1
+                results.append(None)
+        return results
 
     def set(self, key: bytes, value: bytes) -> None:
         if self._consecutive_failures < MAXIMUM_CONSECUTIVE_FAILURES:
@@ -93,14 +104,33 @@ class ValkeyCache(BaseKeyValueStore):
                 # if we fail to set, stop trying
                 self._consecutive_failures = MAXIMUM_CONSECUTIVE_FAILURES
                 self.errors += 1
-                import datetime
-
                 print(
                     f"{datetime.datetime.now()} [CACHE] Disabling remote Valkey cache due to persistent errors ({err}) [SET]."
                 )
         else:
             self.skips += 1
 
+    def set_many(self, items: Dict[bytes, bytes]) -> None:
+        if not items:
+            return
+        if self._consecutive_failures < MAXIMUM_CONSECUTIVE_FAILURES:
+            try:
+                # pipeline the writes, we don't need them to be atomic
+                pipeline = self._server.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipeline.set(key, value)
+                pipeline.execute()
+                self.sets += len(items)
+            except Exception as err:  # pragma: no cover
+                # if we fail to set, stop trying
+                self._consecutive_failures = MAXIMUM_CONSECUTIVE_FAILURES
+                self.errors += 1
+                print(
+                    f"{datetime.datetime.now()} [CACHE] Disabling remote Valkey cache due to persistent errors ({err}) [SET]."
+                )
+        else:
+            self.skips += len(items)
+
     def __del__(self):
         pass
         # DEBUG: log(f"Valkey <hits={self.hits} misses={self.misses} sets={self.sets} skips={self.skips} errors={self.errors}>")
@@ -46,7 +46,7 @@ def execute(
     # Special case handling
     if isinstance(head_node, SetVariableNode):
         # Set the variables and return a non-tabular result
-        return head_node(None), ResultType.NON_TABULAR
+        return head_node.run(), ResultType.NON_TABULAR
     if isinstance(head_node, (ShowValueNode, ShowCreateNode)):
         # There's no execution plan to execute, just return the result
         return head_node(None, None), ResultType.TABULAR
@@ -100,6 +100,51 @@ LOGICAL_OPERATIONS: Dict[NodeType, Callable] = {
     NodeType.XOR: pyarrow.compute.xor,
 }
 
+LITERAL_COMPARISONS: Dict[str, Callable] = {
+    "Eq": pyarrow.compute.equal,
+    "NotEq": pyarrow.compute.not_equal,
+    "Gt": pyarrow.compute.greater,
+    "GtEq": pyarrow.compute.greater_equal,
+    "Lt": pyarrow.compute.less,
+    "LtEq": pyarrow.compute.less_equal,
+}
+
+# functions bound to Arrow kernels, these are given the Arrow column rather than a numpy copy,
+# HOUR, MINUTE and SECOND aren't here, Arrow has no kernels for them over date columns
+ARROW_COLUMN_FUNCTIONS = frozenset(
+    {"UPPER", "LOWER", "ROUND", "YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}
+)
+
+# the Arrow column types each literal type can be compared to directly, floats are left out
+# because the general path treats NaN as null
+LITERAL_COMPARABLE_TYPES: Dict[OrsoTypes, Callable] = {
+    OrsoTypes.BOOLEAN: pyarrow.types.is_boolean,
+    OrsoTypes.INTEGER: pyarrow.types.is_integer,
+    OrsoTypes.DOUBLE: pyarrow.types.is_integer,
+    OrsoTypes.VARCHAR: lambda t: pyarrow.types.is_string(t) or pyarrow.types.is_large_string(t),
+    OrsoTypes.BLOB: lambda t: pyarrow.types.is_binary(t) or pyarrow.types.is_large_binary(t),
+}
+
+
+def _subset(root, table, indices):
+    """
+    Take the rows another part of an expression needs evaluating for, only taking the
+    columns that part of the expression reads rather than every column in the table.
+    """
+    columns = [
+        identity
+        for identity in dict.fromkeys(
+            node.schema_column.identity
+            for node in get_all_nodes_of_type(root, tuple(NodeType))
+            if node.schema_column is not None
+        )
+        if identity in table.column_names
+    ]
+    # a table without columns loses its row count when rows are taken from it
+    if columns:
+        table = table.select(columns)
+    return table.take(indices)
+
 
 def short_cut_and(root, table):
     # Convert to NumPy arrays
@@ -117,7 +162,7 @@ def short_cut_and(root, table):
     subset_indices = true_indices[left_result]
 
     # Create a subset table for evaluating the right expression
-    subset_table = table.take(subset_indices)
+    subset_table = _subset(root.right, table, subset_indices)
 
     # Evaluate right expression on the subset table
     right_result = numpy.array(evaluate(root.right, subset_table))
@@ -143,7 +188,7 @@ def short_cut_or(root, table):
         return left_result
 
     # Create a subset table for evaluating the right expression
-    subset_table = table.take(subset_indices)
+    subset_table = _subset(root.right, table, subset_indices)
 
     # Evaluate right expression on the subset table
     right_result = numpy.array(evaluate(root.right, subset_table), dtype=numpy.bool_)
@@ -155,6 +200,121 @@ def short_cut_or(root, table):
     return left_result
 
 
+def compare_to_literal(root, table):
+    """
+    Compare a column to a literal with the Arrow kernel and a scalar, rather than converting
+    the column to numpy and building a full length array of the literal.
+
+    Returns None if the comparison needs the general path.
+    """
+    literal = root.right
+    if (
+        root.value not in LITERAL_COMPARISONS
+        or literal.node_type != NodeType.LITERAL
+        or literal.value is None
+        or root.left.schema_column is None
+    ):
+        return None
+
+    identity = root.left.schema_column.identity
+    if identity not in table.column_names:
+        return None
+
+    column = table[identity]
+    is_comparable = LITERAL_COMPARABLE_TYPES.get(literal.type)
+    if is_comparable is None or not is_comparable(column.type):
+        return None
+
+    return LITERAL_COMPARISONS[root.value](column, literal.value).combine_chunks()
+
+
+def lookup_in_literal_list(root, table):
+    """
+    Test a column for membership of a literal list with Arrow's hashed set lookup, rather
+    than testing each of the values against a Python set.
+
+    Returns None if the lookup needs the general path.
+    """
+    literal = root.right
+    if (
+        root.value not in ("InList", "NotInList")
+        or literal.node_type != NodeType.LITERAL
+        or literal.type != OrsoTypes.ARRAY
+        or root.left.schema_column is None
+    ):
+        return None
+
+    identity = root.left.schema_column.identity
+    if identity not in table.column_names:
+        return None
+
+    column = table[identity]
+    # DOUBLE lists are left to the general path, they would need to be truncated to
+    # compare to integer columns
+    is_comparable = LITERAL_COMPARABLE_TYPES.get(literal.sub_type)
+    if (
+        literal.sub_type == OrsoTypes.DOUBLE
+        or is_comparable is None
+        or not is_comparable(column.type)
+    ):
+        return None
+
+    try:
+        value_set = pyarrow.array(list(literal.value)).cast(column.type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # values which can't be held by the column's type, e.g. large values and int8
+        return None
+
+    # like the general path, nulls aren't in the list (unless it has a null in it)
+    result = pyarrow.compute.is_in(column, value_set=value_set).combine_chunks()
+    if root.value == "NotInList":
+        return pyarrow.compute.invert(result)
+    return result
+
+
+def subscript_column(root, table):
+    """
+    GET a field from a STRUCT column, or an element from an ARRAY column, working on the
+    Arrow column rather than looping over the values after converting them to numpy.
+
+    Returns None if the subscript needs the general path.
+    """
+    if len(root.parameters) != 2:
+        return None
+    column_node, key_node = root.parameters
+    if key_node.node_type != NodeType.LITERAL or column_node.schema_column is None:
+        return None
+
+    identity = column_node.schema_column.identity
+    if identity not in table.column_names:
+        return None
+
+    column = table[identity].combine_chunks()
+    key = key_node.value
+
+    if pyarrow.types.is_struct(column.type) and isinstance(key, str):
+        # the general path converts values to strings, so only string fields match it
+        index = column.type.get_field_index(key)
+        if index == -1 or not pyarrow.types.is_string(column.type.field(index).type):
+            return None
+        return pyarrow.compute.struct_field(column, [index])
+
+    if (
+        pyarrow.types.is_list(column.type)
+        and isinstance(key, int)
+        and not isinstance(key, bool)
+        and key >= 0
+    ):
+        # lists too short to have the element, and null lists, get a null
+        lengths = pyarrow.compute.list_value_length(column).fill_null(0).to_numpy()
+        has_element = lengths > key
+        positions = column.offsets.to_numpy()[:-1] + key
+        positions = numpy.where(has_element, positions, 0)
+        return column.values.take(pyarrow.array(positions, mask=~has_element))
+
+    return None
+
+
 def prioritize_evaluation(expressions):
     non_dependent_expressions = []
     dependent_expressions = []
@@ -221,7 +381,21 @@ def _inner_evaluate(root: Node, table: Table):
     # INTERAL IDENTIFIERS
     if node_type & INTERNAL_TYPE == INTERNAL_TYPE:  # type:ignore
         if node_type == NodeType.FUNCTION:
-            parameters = [_inner_evaluate(param, table) for param in root.parameters]
+            if root.value == "GET":
+                result = subscript_column(root, table)
+                if result is not None:
+                    return result
+            parameters = [
+                (
+                    table[param.schema_column.identity].combine_chunks()
+                    if index == 0
+                    and root.value in ARROW_COLUMN_FUNCTIONS
+                    and param.schema_column is not None
+                    and param.schema_column.identity in table.column_names
+                    else _inner_evaluate(param, table)
+                )
+                for index, param in enumerate(root.parameters)
+            ]
             # zero parameter functions get the number of rows as the parameter
             if len(parameters) == 0:
                 parameters = [table.num_rows]
@@ -240,6 +414,11 @@ def _inner_evaluate(root: Node, table: Table):
                 raise ColumnReferencedBeforeEvaluationError(column=root.schema_column.name)
             return table[root.schema_column.identity].to_numpy()
         if node_type == NodeType.COMPARISON_OPERATOR:
+            result = compare_to_literal(root, table)
+            if result is None:
+                result = lookup_in_literal_list(root, table)
+            if result is not None:
+                return result
             left = _inner_evaluate(root.left, table)
             right = _inner_evaluate(root.right, table)
             result = filter_operations(
@@ -334,7 +513,9 @@ def evaluate_and_append(expressions, table: Table):
             continue
 
         if should_evaluate(statement):
-            if table.num_rows > 0:
+            if table.num_rows > 0 and statement.node_type == NodeType.LITERAL:
+                new_column = repeat_literal(statement, table)
+            elif table.num_rows > 0:
                 new_column = evaluate_statement(statement, table)
             else:
                 # we make all unknown fields int64s, this can be cast to _most_ other types
@@ -367,6 +548,20 @@ def should_evaluate(statement):
     return statement.node_type in valid_node_types
 
 
+def repeat_literal(statement, table):
+    """
+    Evaluate a literal for a single row and repeat that value in Arrow, rather than building
+    a full length array and converting it.
+    """
+    value = evaluate(statement, table.slice(0, 1))
+    if not isinstance(value, pyarrow.Array):
+        value = pyarrow.array(value)
+    if len(value) != 1:
+        # ARRAY literals aren't expanded per row, let the general path handle them
+        return evaluate_statement(statement, table)
+    return pyarrow.repeat(value[0], table.num_rows)
+
+
 def evaluate_statement(statement, table):
     """Evaluate a statement and return the corresponding column."""
     new_column = evaluate(statement, table)
@@ -8,7 +8,9 @@ This is a Base class for KV Value Storage adapter.
 This is used by the metadata store and in-memory buffer cache.
 """
 
+from typing import Dict
 from typing import Iterable
+from typing import List
 from typing import Union
 
 
@@ -33,6 +35,22 @@ class BaseKeyValueStore:
         """
         raise NotImplementedError("`set` method on cache object not overridden.")
 
+    def get_many(self, keys: List[bytes]) -> List[Union[bytes, None]]:
+        """
+        Retrieve a set of values from the cache, in the same order as the keys, with None
+        for values not in the cache. Overwrite this method if the store can retrieve
+        multiple values in a single call.
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Dict[bytes, bytes]) -> None:
+        """
+        Place a set of values in the cache. Overwrite this method if the store can write
+        multiple values in a single call.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
     def contains(self, keys: Iterable) -> Iterable:
         """
         Overwrite this method to return a list of itmes which are in the cache from
@@ -4,11 +4,12 @@
 # Distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND.
 
 import datetime
+from collections import deque
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Deque
 from typing import Iterable
-from typing import List
-from typing import Tuple
+from typing import NamedTuple
 
 from orso.tools import random_int
 from orso.types import OrsoTypes
@@ -19,7 +20,25 @@ from opteryx.shared.variables import VariableOwner
 from opteryx.shared.variables import Visibility
 
 # History Item = [statement, success, execution start]
-HistoryItem = Tuple[str, bool, datetime.datetime]
+MAX_HISTORY_ITEMS: int = 1024
+
+
+class HistoryItem(NamedTuple):
+    """
+    A statement executed on a connection, this unpacks as (statement, success, start).
+
+    Attributes:
+        operation: str
+            The SQL statement.
+        completed: bool
+            Whether the statement executed successfully.
+        executed_at: datetime.datetime
+            When the statement was run, as a naive UTC datetime.
+    """
+
+    operation: str
+    completed: bool
+    executed_at: datetime.datetime
 
 
 @dataclass
@@ -38,8 +57,9 @@ class ConnectionContext:
             Schema to be used in the connection, defaults to None.
         variables: dict
             System variables available during the connection.
-        history: List[HistoryItem]
-            A history of queries executed in this connection.
+        history: Deque[HistoryItem]
+            A history of the queries executed in this connection, only the most recent
+            MAX_HISTORY_ITEMS are kept.
     """
 
     connection_id: int = field(default_factory=random_int, init=False)
@@ -48,7 +68,9 @@ class ConnectionContext:
     schema: str = None
     memberships: Iterable[str] = None
     variables: SystemVariablesContainer = field(init=False)
-    history: List[HistoryItem] = field(default_factory=list, init=False)
+    history: Deque[HistoryItem] = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY_ITEMS), init=False
+    )
 
     def __post_init__(self):
         """
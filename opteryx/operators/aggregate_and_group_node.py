@@ -24,6 +24,7 @@ from opteryx.managers.expression import evaluate_and_append
 from opteryx.managers.expression import get_all_nodes_of_type
 from opteryx.models import QueryProperties
 from opteryx.operators.aggregate_node import build_aggregations
+from opteryx.operators.aggregate_node import evaluated_identities
 from opteryx.operators.aggregate_node import extract_evaluations
 from opteryx.operators.aggregate_node import project
 
@@ -60,6 +61,7 @@ class AggregateAndGroupNode(BasePlanNode):
 
         # Get any functions we need to execute before aggregating
         self.evaluatable_nodes = extract_evaluations(self.aggregates)
+        self.evaluated_identities = evaluated_identities(self.groups + self.evaluatable_nodes)
 
         # get the aggregated groupings and functions
         self.group_by_columns = list({node.schema_column.identity for node in self.groups})
@@ -119,7 +121,10 @@ class AggregateAndGroupNode(BasePlanNode):
             yield EOS
             return
 
-        morsel = project(morsel, self.all_identifiers)
+        columns = self.all_identifiers + [
+            identity for identity in self.evaluated_identities if identity in morsel.column_names
+        ]
+        morsel = project(morsel, columns)
         # Add a "*" column, this is an int because when a bool it miscounts
         if "*" not in morsel.column_names:
             morsel = morsel.append_column(
@@ -63,8 +63,7 @@ def _is_count_star(aggregates):
     return aggregates[0].parameters[0].node_type == NodeType.WILDCARD
 
 
-def _count_star(morsel_promise, column_name):
-    count = sum(morsel.num_rows for morsel in morsel_promise)
+def _count_star(count, column_name):
     table = pyarrow.Table.from_pylist([{column_name: count}])
     return table
 
@@ -78,6 +77,20 @@ def project(table: pyarrow.Table, column_names: list) -> pyarrow.Table:
         return pyarrow.Table.from_pydict({"*": numpy.full(row_count, 1, dtype=numpy.int8)})
 
 
+def evaluated_identities(nodes) -> list:
+    """
+    Identities of the expressions which an earlier step, such as a filter, may already have
+    evaluated; keeping these columns means they are not evaluated again.
+    """
+    return list(
+        dict.fromkeys(
+            node.schema_column.identity
+            for node in nodes
+            if node.node_type not in (NodeType.IDENTIFIER, NodeType.LITERAL)
+        )
+    )
+
+
 def build_aggregations(aggregators):
     column_map = {}
     aggs = []
@@ -129,7 +142,11 @@ def _non_group_aggregates(aggregates, table):
                 result[aggregate.schema_column.identity] = table.num_rows
                 continue
             else:
-                raw_column_values = table[column_node.schema_column.identity].to_numpy()
+                # keep the Arrow column, converting to numpy turns nulls into NaNs
+                raw_column_values = table[column_node.schema_column.identity]
+                if pyarrow.types.is_date64(raw_column_values.type):
+                    # numpy read these as datetime64[ms], keep returning timestamps
+                    raw_column_values = raw_column_values.cast(pyarrow.timestamp("ms"))
             aggregate_function_name = AGGREGATORS[aggregate.value]
             # this maps a string which is the function name to that function on the
             # pyarrow.compute module
@@ -185,9 +202,15 @@ class AggregateNode(BasePlanNode):
 
         # Get any functions we need to execute before aggregating
         self.evaluatable_nodes = extract_evaluations(self.aggregates)
+        self.evaluated_identities = evaluated_identities(self.evaluatable_nodes)
 
         self.column_map, self.aggregate_functions = build_aggregations(self.aggregates)
 
+        # COUNT(*) only needs the number of rows, so we keep a running count rather
+        # than holding on to the morsels
+        self.is_count_star = _is_count_star(self.aggregates)
+        self.row_count = 0
+
         self.buffer = []
 
     @classmethod
@@ -204,9 +227,9 @@ class AggregateNode(BasePlanNode):
 
     def execute(self, morsel: pyarrow.Table, **kwargs) -> pyarrow.Table:
         if morsel == EOS:
-            if _is_count_star(self.aggregates):
+            if self.is_count_star:
                 yield _count_star(
-                    morsel_promise=self.buffer,
+                    count=self.row_count,
                     column_name=self.aggregates[0].schema_column.identity,
                 )
                 yield EOS
@@ -238,5 +261,13 @@ class AggregateNode(BasePlanNode):
             yield EOS
             return
 
-        self.buffer.append(project(morsel, self.all_identifiers))
+        if self.is_count_star:
+            self.row_count += morsel.num_rows
+            yield None
+            return
+
+        columns = self.all_identifiers + [
+            identity for identity in self.evaluated_identities if identity in morsel.column_names
+        ]
+        self.buffer.append(project(morsel, columns))
         yield None
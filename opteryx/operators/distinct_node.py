@@ -11,6 +11,8 @@ This is a SQL Query Execution Plan Node.
 This Node eliminates duplicate records.
 """
 
+import pyarrow.compute
+import pyarrow.types
 from pyarrow import Table
 
 from opteryx import EOS
@@ -55,6 +57,16 @@ class DistinctNode(BasePlanNode):
             yield EOS
             return
 
+        if (
+            morsel.num_columns == 1
+            and not self._distinct_on
+            and not pyarrow.types.is_nested(morsel.schema.field(0).type)
+        ):
+            # with a single column we can use Arrow to remove the duplicates within the
+            # morsel, so only its unique values need to be checked against the hash set
+            unique_values = pyarrow.compute.unique(morsel.column(0))
+            morsel = Table.from_arrays([unique_values], schema=morsel.schema)
+
         unique_indexes, self.hash_set = distinct(
             morsel, columns=self._distinct_on, seen_hashes=self.hash_set
         )
@@ -11,7 +11,6 @@ This is a SQL Query Execution Plan Node.
 This node is responsible for applying filters to datasets.
 """
 
-import numpy
 import pyarrow
 
 from opteryx import EOS
@@ -68,10 +67,6 @@ class FilterNode(BasePlanNode):
                 raise SqlError(
                     f"Unable to filter on expression '{format_expression(self.filter)} {err}'."
                 )
-        mask = numpy.nonzero(mask)[0]
 
-        # if there's no matching rows, return empty morsel
-        if mask.size > 0 and not numpy.all(mask is None):
-            yield morsel.take(pyarrow.array(mask))
-        else:
-            yield morsel.slice(0, 0)
+        # nulls in the mask are dropped, the same as false
+        yield morsel.filter(mask)
@@ -15,8 +15,16 @@ batches which we order and then discard the excess items.
 
 This is faster, particularly when working with large datasets even though we're now
 sorting smaller chunks over and over again.
+
+The sorting of each batch is handed to a single background worker so the upstream operators
+can produce the next morsel while the previous one is being sorted. Only one batch is ever
+in-flight, if a new morsel arrives before the previous sort has completed we wait for it.
 """
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import numpy
 import pyarrow
 import pyarrow.compute
@@ -28,6 +36,8 @@ from opteryx.models import QueryProperties
 
 from . import BasePlanNode
 
+MAX_CHUNKS: int = 8
+
 
 class HeapSortNode(BasePlanNode):
     def __init__(self, properties: QueryProperties, **parameters):
@@ -38,6 +48,15 @@ class HeapSortNode(BasePlanNode):
         self.mapped_order = []
         self.table = None
 
+        # single slot of background work, sorting releases the GIL so this overlaps
+        # with the production of the next morsel
+        self._sorter = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
+        # which sort implementation to use depends on the types of the sort columns, we
+        # only work it out again if those change (e.g. permissive type promotion)
+        self._use_pyarrow_sort: Optional[bool] = None
+        self._sort_types: Optional[tuple] = None
+
         for column, direction in self.order_by:
             try:
                 self.mapped_order.append(
@@ -51,6 +70,9 @@ class HeapSortNode(BasePlanNode):
                     f"`ORDER BY` must reference columns as they appear in the `SELECT` clause. {cnfe}"
                 )
 
+        self._column_names = [column_name for column_name, _ in self.mapped_order]
+        self._directions = [direction for _, direction in self.mapped_order]
+
     @classmethod
     def from_json(cls, json_obj: str) -> "BasePlanNode":  # pragma: no cover
         raise NotImplementedError()
@@ -65,66 +87,122 @@ class HeapSortNode(BasePlanNode):
     def name(self):  # pragma: no cover
         return "Heap Sort"
 
-    def execute(self, morsel: pyarrow.Table, **kwargs) -> pyarrow.Table:
-        if morsel == EOS:
-            yield self.table
-            yield EOS
-            return
+    def _shutdown(self):
+        """stop the background worker, it's not restarted"""
+        if self._sorter is not None:
+            self._sorter.shutdown(wait=False, cancel_futures=True)
+            self._sorter = None
 
-        if morsel.num_rows == 0:
-            yield None
-            return
+    def __del__(self):
+        # if the query stopped before EOS, don't leave the worker thread behind
+        self._shutdown()
 
-        if self.table:
-            # Concatenate the accumulated table with the new morsel
-            self.table = concat_tables([self.table, morsel], promote_options="permissive")
-        else:
-            self.table = morsel
+    def _collect_pending(self):
+        """wait for the in-flight sort (if any) and take its result as the current table"""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.table = pending.result()
 
-        # Determine if any columns are string-based
-        use_pyarrow_sort = any(
-            pyarrow.types.is_string(self.table.column(column_name).type)
-            or pyarrow.types.is_binary(self.table.column(column_name).type)
-            for column_name, _ in self.mapped_order
-        )
+    def execute(self, morsel: pyarrow.Table, **kwargs) -> pyarrow.Table:
+        try:
+            if morsel == EOS:
+                try:
+                    self._collect_pending()
+                finally:
+                    self._shutdown()
+                yield self.table
+                yield EOS
+                return
+
+            if morsel.num_rows == 0:
+                yield None
+                return
+
+            schema = morsel.schema
+            sort_types = tuple(schema.field(column_name).type for column_name in self._column_names)
+            if sort_types != self._sort_types:
+                # Determine if any columns are string-based
+                self._sort_types = sort_types
+                self._use_pyarrow_sort = any(
+                    pyarrow.types.is_string(sort_type) or pyarrow.types.is_binary(sort_type)
+                    for sort_type in sort_types
+                )
+
+            # back-pressure, we never hold more than one pending morsel
+            self._collect_pending()
+            self._pending = self._sorter.submit(
+                self._sort_and_trim, self.table, morsel, self._use_pyarrow_sort
+            )
+
+            yield None
+        except BaseException:
+            # errors, or being closed before we're done, mean we'll never see EOS
+            self._shutdown()
+            raise
+
+    def _sort_and_trim(
+        self, table: Optional[pyarrow.Table], morsel: pyarrow.Table, use_pyarrow_sort: bool
+    ) -> pyarrow.Table:
+        # we only sort the incoming morsel, the accumulated table is already sorted and
+        # trimmed so we only need to merge the two top-k sets
+        morsel = self._top_k(morsel, use_pyarrow_sort)
+        if not table:
+            return morsel
+
+        # the merged table is at most 2 * limit rows, select_k_unstable finds the top
+        # rows without fully sorting them
+        table = concat_tables([table, morsel], promote_options="permissive")
+        if table.column(0).num_chunks > MAX_CHUNKS:
+            # the sort kernels are called once per chunk, so don't let small chunks build up
+            table = table.combine_chunks()
+        return self._select_k(table, self.mapped_order)
+
+    def _select_k(self, table: pyarrow.Table, sort_keys: list) -> pyarrow.Table:
+        limit = self.limit
+        sort_indices = pyarrow.compute.select_k_unstable(table, k=limit, sort_keys=sort_keys)
+        if len(sort_indices) < min(limit, table.num_rows):
+            # select_k_unstable discards nulls, if that leaves us short fall back to a
+            # full sort, which places the nulls at the end
+            return table.sort_by(sort_keys).slice(offset=0, length=limit)
+        return table.take(sort_indices)
+
+    def _top_k(self, table: pyarrow.Table, use_pyarrow_sort: bool) -> pyarrow.Table:
+        mapped_order = self.mapped_order
+        limit = self.limit
+
+        # multi column sorts work directly on the arrow buffers, this avoids converting
+        # each of the sort columns to numpy
+        if len(mapped_order) > 1:
+            sort_indices = pyarrow.compute.sort_indices(table, sort_keys=mapped_order)
+            return table.take(sort_indices[:limit])
 
-        # strings are sorted faster user pyarrow, single columns faster using compute
-        if len(self.mapped_order) == 1 and use_pyarrow_sort:
-            column_name, sort_direction = self.mapped_order[0]
-            column = self.table.column(column_name)
-            if sort_direction == "ascending":
-                sort_indices = pyarrow.compute.sort_indices(column)
-            else:
-                sort_indices = pyarrow.compute.sort_indices(column)[::-1]
-            self.table = self.table.take(sort_indices[: self.limit])
         # strings are sorted faster using pyarrow
-        elif use_pyarrow_sort:
-            self.table = self.table.sort_by(self.mapped_order).slice(offset=0, length=self.limit)
+        if use_pyarrow_sort:
+            return self._select_k(table, mapped_order)
+
         # single column sort using numpy
-        elif len(self.mapped_order) == 1:
-            # Single-column sort using mergesort to take advantage of partially sorted data
-            column_name, sort_direction = self.mapped_order[0]
-            column = self.table.column(column_name).to_numpy()
-            if sort_direction == "ascending":
-                sort_indices = numpy.argsort(column)
-            else:
-                sort_indices = numpy.argsort(column)[::-1]  # Reverse for descending
-            # Slice the sorted table
-            self.table = self.table.take(sort_indices[: self.limit])
-        # multi column sort using numpy
+        column = table.column(self._column_names[0])
+        if column.null_count > 0:
+            # nulls become NaNs (or Nones) in numpy, let pyarrow place them at the end
+            return self._select_k(table, mapped_order)
+
+        ascending = self._directions[0] == "ascending"
+        column = column.to_numpy()
+        num_rows = column.shape[0]
+        if limit < 0 or limit >= num_rows:
+            # we're keeping everything so there's nothing to partition
+            sort_indices = numpy.argsort(column)
+            if not ascending:
+                sort_indices = sort_indices[::-1]  # Reverse for descending
+            return table.take(sort_indices)
+        if limit == 0:
+            return table.slice(offset=0, length=0)
+
+        # partition so the top-k values are at one end, then only sort those k values
+        if ascending:
+            partition = numpy.argpartition(column, limit - 1)[:limit]
+            sort_indices = partition[numpy.argsort(column[partition])]
         else:
-            # Multi-column sort using lexsort
-            columns_for_sorting = []
-            directions = []
-            for column_name, sort_direction in self.mapped_order:
-                column = self.table.column(column_name).to_numpy()
-                columns_for_sorting.append(column)
-                directions.append(1 if sort_direction == "ascending" else -1)
-
-            sort_indices = numpy.lexsort(
-                [col[::direction] for col, direction in zip(columns_for_sorting, directions)]
-            )
-            # Slice the sorted table
-            self.table = self.table.take(sort_indices[: self.limit])
-
-        yield None
+            partition = numpy.argpartition(column, num_rows - limit)[-limit:]
+            sort_indices = partition[numpy.argsort(column[partition])][::-1]
+        return table.take(sort_indices)
@@ -16,18 +16,244 @@ We also have our own INNER JOIN implementations, it's really just the less
 popular SEMI and ANTI joins we leave to PyArrow for now.
 """
 
-from collections import deque
+import os
 from typing import List
 
+import numpy
 import pyarrow
 
 from opteryx import EOS
-from opteryx.compiled.structures import HashTable
+from opteryx.compiled.structures import FlatHashTable
 from opteryx.models import QueryProperties
 from opteryx.utils.arrow import align_tables
 
 from . import JoinNode
 
+NULL_HASH = numpy.uint64(hash(None) & 0xFFFFFFFFFFFFFFFF)
+FX_SEED = numpy.uint64(0x9E3779B97F4A7C15)
+FX_MULTIPLIER = numpy.uint64(0x517CC1B727220A95)
+
+# hash tables for build sides at least this big are filled by several threads
+PARALLEL_BUILD_ROWS = 1_000_000
+BUILD_WORKERS = min(os.cpu_count() or 1, 8)
+
+
+def _column_hashes(column) -> numpy.ndarray:
+    """
+    Hash every value in a single (unchunked) column.
+
+    Integers and booleans hash to their own value and whole floats hash to
+    the integer they represent, mirroring Python's numeric hashing so keys
+    of different numeric types still meet. Other types fall back to hashing
+    the Python values.
+    """
+    column_type = column.type
+
+    if (
+        pyarrow.types.is_integer(column_type)
+        or pyarrow.types.is_floating(column_type)
+        or pyarrow.types.is_boolean(column_type)
+    ):
+        values = column.fill_null(0).to_numpy(zero_copy_only=False)
+        if pyarrow.types.is_floating(column_type):
+            values = values.astype(numpy.float64) + 0.0  # fold -0.0 into 0.0
+            with numpy.errstate(invalid="ignore"):
+                as_int = values.astype(numpy.int64)
+            hashes = numpy.where(
+                as_int == values, as_int.view(numpy.uint64), values.view(numpy.uint64)
+            )
+        else:
+            hashes = values.astype(numpy.int64).view(numpy.uint64)
+        if column.null_count > 0:
+            hashes[column.is_null().to_numpy(zero_copy_only=False)] = NULL_HASH
+        return hashes
+
+    return numpy.fromiter(map(hash, column.to_pylist()), dtype=numpy.int64, count=len(column)).view(
+        numpy.uint64
+    )
+
+
+def _mix(hashes: numpy.ndarray) -> numpy.ndarray:
+    """
+    FxHash-style mix of the column hashes, integer keys hash to themselves so
+    runs of ids would otherwise land in neighbouring buckets.
+    """
+    hashes = (hashes ^ FX_SEED) * FX_MULTIPLIER
+    hashes ^= hashes >> numpy.uint64(32)
+    hashes *= FX_MULTIPLIER
+    return hashes
+
+
+def _combine(combined: numpy.ndarray, hashes: numpy.ndarray) -> numpy.ndarray:
+    """
+    Fold another column's hashes into the key hash. The running hash is
+    rotated first so swapping the values between columns changes the hash.
+    """
+    combined = (combined << numpy.uint64(5)) | (combined >> numpy.uint64(59))
+    combined = (combined ^ hashes) * FX_SEED
+    combined ^= combined >> numpy.uint64(33)
+    return combined
+
+
+def _vectorized_key_hashes(relation, columns: List[str]) -> numpy.ndarray:
+    """
+    Compute the hash of the join key for every row in a relation.
+
+    The per-column hashes are calculated a column at a time and then combined,
+    rather than hashing a tuple of values for each row.
+
+    Parameters:
+        relation (pyarrow.Table or pyarrow.RecordBatch): The relation to hash.
+        columns (list of str): The join key columns.
+
+    Returns:
+        numpy.ndarray: The int64 hash for each row.
+    """
+    combined = None
+    for column_name in columns:
+        column = relation.column(column_name)
+        if isinstance(column, pyarrow.ChunkedArray):
+            column = column.combine_chunks()
+        hashes = _mix(_column_hashes(column))
+        combined = hashes if combined is None else _combine(combined, hashes)
+    return combined.view(numpy.int64)
+
+
+def _null_keys(relation, columns: List[str]) -> numpy.ndarray:
+    """
+    Flag the rows where any of the join key columns is null.
+    """
+    nulls = numpy.zeros(relation.num_rows, dtype=numpy.bool_)
+    for column_name in columns:
+        column = relation.column(column_name)
+        if column.null_count > 0:
+            nulls |= column.is_null().to_numpy(zero_copy_only=False)
+    return nulls
+
+
+def _build_hash_table(relation, columns: List[str]) -> FlatHashTable:
+    """
+    Build the hash table of row indices for one side of the join, rows with
+    null keys never match so they aren't added to it.
+    """
+    hashes = _vectorized_key_hashes(relation, columns)
+    null_keys = _null_keys(relation, columns)
+    workers = BUILD_WORKERS if relation.num_rows >= PARALLEL_BUILD_ROWS else 1
+    return FlatHashTable(hashes, null_keys.view(numpy.uint8), workers)
+
+
+class _HashedKeys:
+    """
+    The build side of a join, probed through a hash table of the key hashes.
+    """
+
+    def __init__(self, relation, columns: List[str]):
+        self.hash_table = _build_hash_table(relation, columns)
+
+    def probe(self, relation, columns: List[str]):
+        """
+        Match the rows of `relation`, returning the (probe row, build row)
+        pairs with a build row of -1 where there's no match.
+        """
+        hashes = _vectorized_key_hashes(relation, columns)
+        nulls = _null_keys(relation, columns)
+        if not nulls.any():
+            return self.hash_table.probe(hashes)
+
+        # null keys never match, so they aren't probed, they're paired with -1 like
+        # any other miss rather than relying on their hash not being in the table
+        valid_rows = numpy.flatnonzero(~nulls)
+        probe_rows, build_rows = self.hash_table.probe(numpy.ascontiguousarray(hashes[valid_rows]))
+        null_rows = numpy.flatnonzero(nulls)
+        probe_rows = numpy.concatenate((valid_rows[probe_rows], null_rows))
+        build_rows = numpy.concatenate((build_rows, numpy.full(len(null_rows), -1, numpy.int64)))
+
+        # keep the pairs in probe row order, as they are when there are no nulls
+        order = numpy.argsort(probe_rows, kind="stable")
+        return probe_rows[order], build_rows[order]
+
+
+class _SortedKeys:
+    """
+    The build side of a join on a single integer column.
+
+    The keys are sorted once and probes are binary searches into them, so
+    there's no hashing or hash table at all. Probes return the same pairs
+    as _HashedKeys.
+    """
+
+    def __init__(self, relation, columns: List[str]):
+        keys, nulls = _integer_keys(relation.column(columns[0]))
+        valid_rows = numpy.flatnonzero(~nulls)
+        self.order = valid_rows[numpy.argsort(keys[valid_rows], kind="stable")]
+        self.sorted_keys = keys[self.order]
+
+    def probe(self, relation, columns: List[str]):
+        keys, nulls = _integer_keys(relation.column(columns[0]))
+
+        starts = numpy.searchsorted(self.sorted_keys, keys, side="left")
+        counts = numpy.searchsorted(self.sorted_keys, keys, side="right") - starts
+        counts[nulls] = 0
+
+        # every probe row appears at least once, misses are paired with -1
+        repeats = numpy.maximum(counts, 1)
+        probe_rows = numpy.repeat(numpy.arange(len(keys), dtype=numpy.int64), repeats)
+        offsets = numpy.arange(len(probe_rows)) - numpy.repeat(
+            numpy.cumsum(repeats) - repeats, repeats
+        )
+        matched = numpy.repeat(counts > 0, repeats)
+
+        build_rows = numpy.full(len(probe_rows), -1, dtype=numpy.int64)
+        build_rows[matched] = self.order[(numpy.repeat(starts, repeats) + offsets)[matched]]
+        return probe_rows, build_rows
+
+
+def _integer_keys(column):
+    """
+    The values of an integer key column as int64, with nulls flagged.
+    """
+    if isinstance(column, pyarrow.ChunkedArray):
+        column = column.combine_chunks()
+    keys = column.fill_null(0).to_numpy(zero_copy_only=False).astype(numpy.int64, copy=False)
+    if column.null_count > 0:
+        return keys, column.is_null().to_numpy(zero_copy_only=False)
+    return keys, numpy.zeros(len(keys), dtype=numpy.bool_)
+
+
+def _build_keys(relation, columns: List[str], probe_relation, probe_columns: List[str]):
+    """
+    Prepare the build side of a join, joins on a single integer column on
+    both sides use sorted keys and everything else is hashed.
+    """
+    if (
+        len(columns) == 1
+        and len(probe_columns) == 1
+        and pyarrow.types.is_integer(relation.schema.field(columns[0]).type)
+        and pyarrow.types.is_integer(probe_relation.schema.field(probe_columns[0]).type)
+    ):
+        return _SortedKeys(relation, columns)
+    return _HashedKeys(relation, columns)
+
+
+def _concat_buffer(buffer: List[pyarrow.Table]) -> pyarrow.Table:
+    """
+    Concatenate the buffered morsels, small relations are often a single morsel
+    which doesn't need concatenating at all.
+    """
+    if len(buffer) == 1:
+        return buffer[0]
+    return pyarrow.concat_tables(buffer, promote_options="none")
+
+
+def _contiguous(relation: pyarrow.Table) -> pyarrow.Table:
+    """
+    Combine the per-morsel chunks of a buffered relation, the joins take rows
+    from all over the relation and that's cheaper from a single chunk.
+    """
+    if relation.num_rows > 0 and relation.num_columns > 0 and relation.column(0).num_chunks > 1:
+        return relation.combine_chunks()
+    return relation
+
 
 def left_join(left_relation, right_relation, left_columns: List[str], right_columns: List[str]):
     """
@@ -46,76 +272,59 @@ def left_join(left_relation, right_relation, left_columns: List[str], right_colu
     Returns:
         A pyarrow.Table containing the result of the LEFT JOIN operation.
     """
-    from opteryx.compiled.structures.hash_table import hash_join_map
-
-    left_indexes: deque = deque()
-    right_indexes: deque = deque()
+    chunk_size = 50_000
 
     if len(set(left_columns) & set(right_relation.column_names)) > 0:
         left_columns, right_columns = right_columns, left_columns
 
-    right_hash = hash_join_map(right_relation, right_columns)
-    left_hash = hash_join_map(left_relation, left_columns)
+    right_keys = _build_keys(right_relation, right_columns, left_relation, left_columns)
 
-    for hash_value, left_rows in left_hash.hash_table.items():
-        right_rows = right_hash.get(hash_value)
-        if right_rows:
-            for l in left_rows:
-                for r in right_rows:
-                    left_indexes.append(l)
-                    right_indexes.append(r)
-        else:
-            for l in left_rows:
-                left_indexes.append(l)
-                right_indexes.append(None)
-
-        if len(left_indexes) > 50_000:
-            table = align_tables(
-                right_relation, left_relation, list(right_indexes), list(left_indexes)
-            )
-            yield table
-            left_indexes.clear()
-            right_indexes.clear()
-
-    # this may return an empty table each time - fix later
-    table = align_tables(right_relation, left_relation, list(right_indexes), list(left_indexes))
-    yield table
-    left_indexes.clear()
-    right_indexes.clear()
+    # probe a chunk of the left relation at a time, at least once so an empty
+    # relation still yields a table with the joined schema
+    for start in range(0, max(left_relation.num_rows, 1), chunk_size):
+        left_chunk = left_relation.slice(start, chunk_size)
+        left_indexes, right_indexes = right_keys.probe(left_chunk, left_columns)
+        yield align_tables(
+            right_relation,
+            left_relation,
+            pyarrow.array(right_indexes, mask=right_indexes < 0),
+            pyarrow.array(left_indexes + start),
+        )
 
 
 def full_join(left_relation, right_relation, left_columns: List[str], right_columns: List[str]):
-    chunk_size = 1000
-
-    hash_table = HashTable()
-    non_null_right_values = right_relation.select(right_columns).itercolumns()
-    for i, value_tuple in enumerate(zip(*non_null_right_values)):
-        hash_table.insert(hash(value_tuple), i)
-
-    left_indexes = []
-    right_indexes = []
-
-    left_values = left_relation.select(left_columns).itercolumns()
-    for i, value_tuple in enumerate(zip(*left_values)):
-        rows = hash_table.get(hash(value_tuple))
-        if rows:
-            right_indexes.extend(rows)
-            left_indexes.extend([i] * len(rows))
-        else:
-            right_indexes.append(None)
-            left_indexes.append(i)
+    chunk_size = 65_536
 
-    for i in range(right_relation.num_rows):
-        if i not in right_indexes:
-            right_indexes.append(i)
-            left_indexes.append(None)
+    right_keys = _build_keys(right_relation, right_columns, left_relation, left_columns)
+    left_indexes, right_indexes = right_keys.probe(left_relation, left_columns)
 
+    # track which right rows found a partner so the rest can be emitted afterwards
+    matched = numpy.zeros(right_relation.num_rows, dtype=numpy.bool_)
+    matched[right_indexes[right_indexes >= 0]] = True
+    unmatched = numpy.flatnonzero(~matched)
+
+    # the probe arrays are aligned as they are, rather than copying the
+    # unmatched right rows onto the end of them
     for i in range(0, len(left_indexes), chunk_size):
         chunk_left_indexes = left_indexes[i : i + chunk_size]
         chunk_right_indexes = right_indexes[i : i + chunk_size]
 
         # Align this chunk and add the resulting table to our list
-        yield align_tables(right_relation, left_relation, chunk_right_indexes, chunk_left_indexes)
+        yield align_tables(
+            right_relation,
+            left_relation,
+            pyarrow.array(chunk_right_indexes, mask=chunk_right_indexes < 0),
+            pyarrow.array(chunk_left_indexes),
+        )
+
+    for i in range(0, len(unmatched), chunk_size):
+        chunk_right_indexes = unmatched[i : i + chunk_size]
+        yield align_tables(
+            right_relation,
+            left_relation,
+            pyarrow.array(chunk_right_indexes),
+            pyarrow.nulls(len(chunk_right_indexes), type=pyarrow.int64()),
+        )
 
 
 def right_join(left_relation, right_relation, left_columns: List[str], right_columns: List[str]):
@@ -135,33 +344,24 @@ def right_join(left_relation, right_relation, left_columns: List[str], right_col
     Yields:
         pyarrow.Table: A chunk of the result of the RIGHT JOIN operation.
     """
-    chunk_size = 1000
+    chunk_size = 65_536
 
-    hash_table = HashTable()
-    non_null_left_values = left_relation.select(left_columns).itercolumns()
-    for i, value_tuple in enumerate(zip(*non_null_left_values)):
-        hash_table.insert(hash(value_tuple), i)
+    left_keys = _build_keys(left_relation, left_columns, right_relation, right_columns)
 
     # Iterate over the right_relation in chunks
 
     for right_chunk in right_relation.to_batches(chunk_size):
-        left_indexes = []
-        right_indexes = []
-
-        right_values = right_chunk.select(right_columns).itercolumns()
-        for i, value_tuple in enumerate(zip(*right_values)):
-            rows = hash_table.get(hash(value_tuple))
-            if rows:
-                left_indexes.extend(rows)
-                right_indexes.extend([i] * len(rows))
-            else:
-                left_indexes.append(None)
-                right_indexes.append(i)
+        right_indexes, left_indexes = left_keys.probe(right_chunk, right_columns)
 
         # Yield the aligned chunk
         # we intentionally swap them to the other calls so we're building a table
         # not a record batch (what the chunk is)
-        yield align_tables(left_relation, right_chunk, left_indexes, right_indexes)
+        yield align_tables(
+            left_relation,
+            right_chunk,
+            pyarrow.array(left_indexes, mask=left_indexes < 0),
+            pyarrow.array(right_indexes),
+        )
 
 
 class OuterJoinNode(JoinNode):
@@ -202,7 +402,7 @@ class OuterJoinNode(JoinNode):
     def execute(self, morsel: pyarrow.Table, join_leg: str) -> pyarrow.Table:
         if join_leg == "left":
             if morsel == EOS:
-                self.left_relation = pyarrow.concat_tables(self.left_buffer, promote_options="none")
+                self.left_relation = _contiguous(_concat_buffer(self.left_buffer))
                 self.left_buffer.clear()
             else:
                 self.left_buffer.append(morsel)
@@ -211,7 +411,7 @@ class OuterJoinNode(JoinNode):
 
         if join_leg == "right":
             if morsel == EOS:
-                right_relation = pyarrow.concat_tables(self.right_buffer, promote_options="none")
+                right_relation = _contiguous(_concat_buffer(self.right_buffer))
                 self.right_buffer.clear()
 
                 join_provider = providers.get(self.join_type)
@@ -41,6 +41,11 @@ class ProjectionNode(BasePlanNode):
 
         self.columns = parameters["projection"]
 
+        # the positions of the projected columns, resolved against the schema
+        # of the first morsel and reused while the schema doesn't change
+        self._schema = None
+        self._positions = None
+
     @classmethod
     def from_json(cls, json_obj: str) -> "BasePlanNode":  # pragma: no cover
         raise NotImplementedError()
@@ -61,5 +66,18 @@ class ProjectionNode(BasePlanNode):
             return
 
         # If any of the columns need evaluating, we need to do that here
-        morsel = evaluate_and_append(self.evaluations, morsel)
-        yield morsel.select(self.projection)
+        if self.evaluations:
+            morsel = evaluate_and_append(self.evaluations, morsel)
+
+        schema = morsel.schema
+        if self._schema is None or not schema.equals(self._schema):
+            positions = [schema.get_field_index(column) for column in self.projection]
+            # missing or duplicated names resolve to -1, select on the names so
+            # those raise the usual error
+            if -1 in positions:
+                yield morsel.select(self.projection)
+                return
+            self._schema = schema
+            self._positions = positions
+
+        yield morsel.select(self._positions)
@@ -36,6 +36,13 @@ class SetVariableNode(BasePlanNode):
     def config(self):  # pragma: no cover
         return f"{self.variable} TO {self.value}"
 
-    def __call__(self, morsel, **kwargs) -> NonTabularResult:
+    def run(self) -> NonTabularResult:
+        """
+        Setting a variable is only a change of state, it doesn't consume or produce any
+        morsels so it is run directly rather than through the morsel-driven interface.
+        """
         self.variables[self.variable] = self.value
         return NonTabularResult(record_count=1, status=QueryStatus.SQL_SUCCESS)  # type: ignore
+
+    def __call__(self, morsel, **kwargs) -> NonTabularResult:
+        return self.run()
@@ -19,6 +19,8 @@ from opteryx.models import QueryProperties
 
 from . import ReaderNode
 
+SHOW_VALUE_SCHEMA = pyarrow.schema([("name", pyarrow.string()), ("value", pyarrow.string())])
+
 
 class ShowValueNode(ReaderNode):
     def __init__(self, properties: QueryProperties, **parameters):
@@ -47,6 +49,12 @@ class ShowValueNode(ReaderNode):
         return ""
 
     def execute(self, morsel, **kwargs) -> Generator:
-        buffer = [{"name": self.key, "value": str(self.value)}]
-        table = pyarrow.Table.from_pylist(buffer)
+        # the shape is always the same so skip the schema inference from_pylist does
+        table = pyarrow.Table.from_arrays(
+            [
+                pyarrow.array([self.key], type=pyarrow.string()),
+                pyarrow.array([str(self.value)], type=pyarrow.string()),
+            ],
+            schema=SHOW_VALUE_SCHEMA,
+        )
         yield table
@@ -35,7 +35,9 @@
 """
 
 import datetime
+import pickle
 import time
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import Generator
@@ -111,6 +113,22 @@ def build_literal_node(
     return root
 
 
+@lru_cache(maxsize=256)
+def _parse_sql(clean_sql: str) -> bytes:
+    """
+    Parse the SQL into a serialized AST.
+
+    The AST rewriter and logical planner mutate the AST they are given, so the cache holds the
+    serialized form and each caller deserializes a fresh copy - this is still several times
+    faster than parsing again. The key is the exact SQL text, normalizing case or whitespace
+    would change the meaning of string literals.
+    """
+    from opteryx.third_party import sqloxide
+
+    ast = sqloxide.parse_sql(clean_sql, dialect="mysql")
+    return pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 def query_planner(
     operation: str,
     parameters: Union[Iterable, Dict, None],
@@ -128,7 +146,6 @@ def query_planner(
     from opteryx.planner.logical_planner import do_logical_planning_phase
     from opteryx.planner.physical_planner import create_physical_plan
     from opteryx.planner.sql_rewriter import do_sql_rewrite
-    from opteryx.third_party import sqloxide
 
     # SQL Rewriter extracts temporal filters
     start = time.monotonic_ns()
@@ -145,7 +162,7 @@ def query_planner(
 
     # Parser converts the SQL command into an AST
     try:
-        parsed_statements = sqloxide.parse_sql(clean_sql, dialect="mysql")
+        parsed_statements = pickle.loads(_parse_sql(clean_sql))
     except ValueError as parser_error:
         raise SqlError(parser_error) from parser_error
     # AST Rewriter adds temporal filters and parameters to the AST
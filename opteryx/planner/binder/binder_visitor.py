@@ -445,6 +445,14 @@ class BinderVisitor:
         node.columns = get_all_nodes_of_type(node.condition, (NodeType.IDENTIFIER,))
         node.relations = node.condition.relations or {}
 
+        # functions in the predicate are evaluated onto the morsel, so later steps calculating
+        # the same function can bind to, and reuse, that column
+        derived = original_context.schemas["$derived"]
+        for function in get_all_nodes_of_type(node.condition, (NodeType.FUNCTION,)):
+            schema_column = function.schema_column
+            if schema_column is not None and derived.find_column(schema_column.name) is None:
+                derived.columns.append(schema_column)
+
         return node, original_context
 
     def visit_function_dataset(
@@ -20,6 +20,21 @@ from opteryx.planner.logical_planner import LogicalPlanStepType
 from .optimization_strategy import OptimizationStrategy
 from .optimization_strategy import OptimizerContext
 
+# we don't push limits past these steps
+PUSHDOWN_BARRIERS = frozenset(
+    {
+        LogicalPlanStepType.Aggregate,
+        LogicalPlanStepType.AggregateAndGroup,
+        LogicalPlanStepType.Distinct,
+        LogicalPlanStepType.Filter,
+        LogicalPlanStepType.HeapSort,
+        LogicalPlanStepType.Join,
+        LogicalPlanStepType.Order,
+        LogicalPlanStepType.Union,
+        LogicalPlanStepType.Scan,
+    }
+)
+
 
 class LimitPushdownStrategy(OptimizationStrategy):
     def visit(self, node: LogicalPlanNode, context: OptimizerContext) -> OptimizerContext:
@@ -34,23 +49,23 @@ class LimitPushdownStrategy(OptimizationStrategy):
         if node.node_type.Scan and LimitPushable in node.connector.__class__.mro():
             for limit_node in context.collected_limits:
                 if node.relation in limit_node.all_relations:
+                    # an OFFSET on its own doesn't bound the rows we need to read
+                    if limit_node.limit is None:
+                        continue
                     self.statistics.optimization_limit_pushdown += 1
-                    context.optimized_plan.remove_node(limit_node.nid, heal=True)
-                    node.limit = limit_node.limit
+                    if limit_node.offset:
+                        # the scan only needs to return the rows up to the end of the
+                        # limit, we keep the limit step to skip the offset rows
+                        node.limit = limit_node.limit + limit_node.offset
+                    else:
+                        context.optimized_plan.remove_node(limit_node.nid, heal=True)
+                        node.limit = limit_node.limit
                     context.optimized_plan[context.node_id] = node
-        elif node.node_type in (
-            LogicalPlanStepType.Aggregate,
-            LogicalPlanStepType.AggregateAndGroup,
-            LogicalPlanStepType.Distinct,
-            LogicalPlanStepType.Filter,
-            LogicalPlanStepType.Join,
-            LogicalPlanStepType.Order,
-            LogicalPlanStepType.Union,
-            LogicalPlanStepType.Scan,
-        ):
+        elif node.node_type in PUSHDOWN_BARRIERS:
             # we don't push past here
+            if context.collected_limits:
+                self.statistics.optimization_limit_pushdown += len(context.collected_limits)
             for limit_node in context.collected_limits:
-                self.statistics.optimization_limit_pushdown += 1
                 context.optimized_plan.remove_node(limit_node.nid, heal=True)
                 context.optimized_plan.insert_node_after(
                     limit_node.nid, limit_node, context.node_id
@@ -47,6 +47,14 @@ class OperatorFusionStrategy(OptimizationStrategy):
                     context.optimized_plan[next_node_id] = new_node
                     context.optimized_plan.remove_node(context.node_id, heal=True)
                     self.statistics.optimization_fuse_operators_heap_sort += 1
+                elif next_node.node_type == LogicalPlanStepType.Limit and next_node.limit:
+                    # with an offset the heap sort keeps the rows up to the end of the
+                    # limit, and the limit step still skips the offset rows
+                    new_node = LogicalPlanNode(node_type=LogicalPlanStepType.HeapSort)
+                    new_node.limit = next_node.limit + next_node.offset
+                    new_node.order_by = node.order_by
+                    context.optimized_plan[context.node_id] = new_node
+                    self.statistics.optimization_fuse_operators_heap_sort += 1
 
         return context
 
@@ -23,6 +23,7 @@ after a join, we add conditions to the JOIN.
 """
 
 from orso.tools import random_string
+from orso.types import OrsoTypes
 
 from opteryx.connectors.capabilities import PredicatePushable
 from opteryx.exceptions import UnsupportedSyntaxError
@@ -47,6 +48,32 @@ def _add_condition(existing_condition, new_condition):
     return _and
 
 
+def _predicate_rank(predicate) -> int:
+    """
+    A rough ordering for predicates applied to the same relation, lower ranks run first.
+
+    Equality checks usually eliminate the most rows, range checks fewer, and negations and
+    pattern matches eliminate the fewest and are the most expensive; numeric checks are
+    cheaper than string checks and function calls cost more again.
+    """
+    condition = predicate.condition
+    rank = 3
+    if condition.value in ("Eq", "InList"):
+        rank = 0
+    elif condition.value in ("Gt", "GtEq", "Lt", "LtEq"):
+        rank = 1
+    elif condition.value == "NotEq":
+        rank = 2
+    rank *= 2
+
+    left = condition.left.schema_column if condition.left else None
+    if left is None or left.type not in (OrsoTypes.INTEGER, OrsoTypes.DOUBLE):
+        rank += 1
+    if get_all_nodes_of_type(condition, (NodeType.FUNCTION,)):
+        rank += 8
+    return rank
+
+
 class PredicatePushdownStrategy(OptimizationStrategy):
     def visit(self, node: LogicalPlanNode, context: OptimizerContext) -> OptimizerContext:
         if not context.optimized_plan:
@@ -264,7 +291,14 @@ class PredicatePushdownStrategy(OptimizationStrategy):
         self, node: LogicalPlanNode, context: OptimizerContext
     ) -> OptimizerContext:
         remaining_predicates = []
-        for predicate in context.collected_predicates:
+        # each predicate is placed directly after the scan, so the last one placed runs first,
+        # place the predicates most likely to eliminate rows cheaply last
+        collected_predicates = sorted(
+            context.collected_predicates, key=_predicate_rank, reverse=True
+        )
+        if collected_predicates != context.collected_predicates:
+            self.statistics.optimization_predicate_ordering += 1
+        for predicate in collected_predicates:
             if len(predicate.relations) >= 1 and predicate.relations.intersection(
                 (node.relation, node.alias)
             ):
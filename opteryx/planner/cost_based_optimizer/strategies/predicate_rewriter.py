@@ -20,6 +20,7 @@ import re
 from typing import Callable
 from typing import Dict
 
+from orso.schema import ConstantColumn
 from orso.types import OrsoTypes
 
 from opteryx.managers.expression import ExpressionColumn
@@ -38,6 +39,9 @@ from .optimization_strategy import OptimizerContext
 IN_REWRITES = {"InList": "Eq", "NotInList": "NotEq"}
 LIKE_REWRITES = {"Like": "Eq", "NotLike": "NotEq"}
 LITERALS_TO_THE_RIGHT = {"Plus": "Minus", "Minus": "Plus"}
+# the types an OR chain of equalities can be rewritten to an IN list for, these are the types
+# the IN list is evaluated with a set lookup for; the column must be the same type
+OR_TO_IN_TYPES = {OrsoTypes.BOOLEAN, OrsoTypes.INTEGER, OrsoTypes.VARCHAR, OrsoTypes.BLOB}
 
 
 def remove_adjacent_wildcards(predicate):
@@ -66,6 +70,67 @@ def rewrite_in_to_eq(predicate):
     return predicate
 
 
+def _equalities_on_one_column(predicate, collected=None):
+    """
+    Collect the literal values of an OR chain of equalities on the same column, returns
+    None if any part of the chain isn't an equality of that column to a literal.
+    """
+    if collected is None:
+        collected = []
+    if predicate.node_type == NodeType.OR:
+        if _equalities_on_one_column(predicate.left, collected) is None:
+            return None
+        return _equalities_on_one_column(predicate.right, collected)
+    if (
+        predicate.node_type == NodeType.COMPARISON_OPERATOR
+        and predicate.value == "Eq"
+        and predicate.left.node_type == NodeType.IDENTIFIER
+        and predicate.right.node_type == NodeType.LITERAL
+        and predicate.right.value is not None
+        and predicate.right.type in OR_TO_IN_TYPES
+        and predicate.left.schema_column is not None
+        and predicate.left.schema_column.type == predicate.right.type
+    ):
+        if collected and (
+            collected[0].left.schema_column.identity != predicate.left.schema_column.identity
+            or collected[0].right.type != predicate.right.type
+        ):
+            return None
+        collected.append(predicate)
+        return collected
+    return None
+
+
+def rewrite_or_to_in(predicate, equalities):
+    """
+    Rewrite OR chains of equalities on the same column to IN conditions.
+
+    `a = 1 OR a = 2 OR a = 3` is evaluated as three comparisons and two ORs, `a IN (1, 2, 3)`
+    is a single set lookup. The node is rewritten in place so it keeps its identity.
+    """
+    # keep the values in the order they were written, as ARRAY literals are
+    values = tuple(equality.right.value for equality in equalities)
+    in_list = Node(
+        node_type=NodeType.LITERAL,
+        type=OrsoTypes.ARRAY,
+        value=values,
+        sub_type=equalities[0].right.type,
+    )
+    # bind the literal as the binder would, evaluation reads its type from the column
+    in_list.schema_column = ConstantColumn(
+        name=format_expression(in_list, True),
+        type=OrsoTypes.ARRAY,
+        value=values,
+        nullable=False,
+    )
+
+    predicate.node_type = NodeType.COMPARISON_OPERATOR
+    predicate.value = "InList"
+    predicate.left = equalities[0].left
+    predicate.right = in_list
+    return predicate
+
+
 def reorder_interval_calc(predicate):
     """
     rewrite:
@@ -109,12 +174,19 @@ def reorder_interval_calc(predicate):
 dispatcher: Dict[str, Callable] = {
     "remove_adjacent_wildcards": remove_adjacent_wildcards,
     "rewrite_in_to_eq": rewrite_in_to_eq,
+    "rewrite_or_to_in": rewrite_or_to_in,
     "reorder_interval_calc": reorder_interval_calc,
 }
 
 
 # Dispatcher conditions
 def _rewrite_predicate(predicate, statistics: QueryStatistics):
+    if predicate.node_type == NodeType.OR:
+        equalities = _equalities_on_one_column(predicate)
+        if equalities is not None:
+            statistics.optimization_predicate_rewriter_or_to_in += 1
+            return dispatcher["rewrite_or_to_in"](predicate, equalities)
+
     if predicate.node_type not in {NodeType.BINARY_OPERATOR, NodeType.COMPARISON_OPERATOR}:
         # after rewrites, some filters aren't actually predicates
         return predicate
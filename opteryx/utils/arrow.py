@@ -12,6 +12,7 @@ from typing import List
 from typing import Optional
 from typing import Union
 
+import numpy
 import pyarrow
 
 INTERNAL_BATCH_SIZE = 500
@@ -96,8 +97,8 @@ def post_read_projector(table: pyarrow.Table, columns: list) -> pyarrow.Table:
 def align_tables(
     source_table: pyarrow.Table,
     append_table: pyarrow.Table,
-    source_indices: Union[List[int], pyarrow.Array],
-    append_indices: Union[List[int], pyarrow.Array],
+    source_indices: Union[List[int], numpy.ndarray, pyarrow.Array],
+    append_indices: Union[List[int], numpy.ndarray, pyarrow.Array],
 ) -> pyarrow.Table:
     """
     Aligns two tables based on provided indices, ensuring that the resulting table
@@ -128,9 +129,18 @@ def align_tables(
         empty_arrays = [pyarrow.array([]) for field in combined_schema]
         return pyarrow.Table.from_arrays(empty_arrays, schema=combined_schema)
 
-    # Convert indices to PyArrow arrays for efficient null checking
-    source_indices_array = pyarrow.array(source_indices)
-    append_indices_array = pyarrow.array(append_indices)
+    # Convert indices to PyArrow arrays for efficient null checking, the joins
+    # usually hand us Arrow arrays already so don't build those a second time
+    source_indices_array = (
+        source_indices
+        if isinstance(source_indices, pyarrow.Array)
+        else pyarrow.array(source_indices)
+    )
+    append_indices_array = (
+        append_indices
+        if isinstance(append_indices, pyarrow.Array)
+        else pyarrow.array(append_indices)
+    )
 
     # Check if all source_indices are nulls
     if source_indices_array.null_count == len(source_indices):
@@ -171,4 +181,9 @@ def align_tables(
     # Create the final aligned table with all columns at once
     aligned_table = pyarrow.Table.from_arrays(aligned_columns, schema=combined_schema)
 
+    # hand later steps a single chunk per column, take normally gives us that
+    # already but the null columns and chunked inputs may not
+    if any(column.num_chunks > 1 for column in aligned_table.itercolumns()):
+        aligned_table = aligned_table.combine_chunks()
+
     return aligned_table
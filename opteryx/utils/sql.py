@@ -145,14 +145,12 @@ def regex_match_any(
             A 1D object array with True, False, or None,
             indicating whether each row did (or did not) match the patterns.
     """
-    # 1) Combine the LIKE patterns into a single compiled regex
-    #    (Empty patterns list => empty string => matches nothing)
-    combined_pattern_str = r"|".join(sql_like_to_regex(p) for p in patterns if p)
-    # If there are no valid patterns, we build a "never match" pattern
-    if not combined_pattern_str:
-        combined_pattern_str = r"(?!x)"  # Negative lookahead to never match
+    import pyarrow
+    from pyarrow import compute
 
-    combined_regex = re.compile(combined_pattern_str, flags=flags)
+    # 1) Combine the LIKE patterns into a single regex, Arrow compiles it once with RE2 and
+    #    evaluates the whole column in one pass
+    combined_pattern_str = r"|".join(sql_like_to_regex(p) for p in patterns if p)
 
     # 2) Create the output array (dtype=object so we can store None/bool)
     out = numpy.empty(arr.size, dtype=object)
@@ -169,31 +167,31 @@ def regex_match_any(
         out[:] = None
         return out
 
+    nulls = numpy.array([row is None for row in arr], dtype=numpy.bool_)
     single_string_mode = isinstance(first_non_none, (str, bytes))
 
-    # 4) Main loop
     if single_string_mode:
-        # Single-string mode
-        for i, row in enumerate(arr):
-            if row is None:
-                out[i] = None
-            else:
-                # Match or not?
-                is_match = combined_regex.search(row) is not None
-                out[i] = (not is_match) if invert else is_match
+        values = pyarrow.array(arr)
+    else:
+        # match against every element of every list, then fold the matches back to the rows
+        rows = pyarrow.array([None if row is None else list(row) for row in arr])
+        values = compute.list_flatten(rows)
+
+    if combined_pattern_str:
+        element_matches = compute.match_substring_regex(
+            values, combined_pattern_str, ignore_case=bool(flags & re.IGNORECASE)
+        )
+        element_matches = element_matches.fill_null(False).to_numpy(False)
+    else:
+        # no valid patterns, nothing matches
+        element_matches = numpy.zeros(len(values), dtype=numpy.bool_)
+
+    if single_string_mode:
+        matches = element_matches
     else:
-        # Lists-of-strings mode
-        for i, row in enumerate(arr):
-            if row is None:
-                out[i] = None
-            else:
-                # row is assumed to be an iterable of strings/bytes
-                if row.size == 0:
-                    # Probably a numpy array with zero length
-                    is_match = False
-                else:
-                    # If anything in the row matches, it's True
-                    is_match = any(combined_regex.search(elem) for elem in row)
-                out[i] = (not is_match) if invert else is_match
+        parents = compute.list_parent_indices(rows).to_numpy()
+        matches = numpy.bincount(parents[element_matches], minlength=arr.size) > 0
 
+    out[:] = numpy.logical_xor(matches, invert)
+    out[nulls] = None
     return out
@@ -21,7 +21,7 @@ from orso.types import OrsoTypes
 
 __all__ = ("read", "schema")
 
-_decoded: bytes = None
+_table = None
 
 
 def read(*args):
@@ -30,16 +30,17 @@ def read(*args):
 
     import pyarrow.parquet as pq
 
-    global _decoded
+    global _table
 
-    """The table is saved parquet table, base85 encoded."""
+    """The table is saved parquet table, base85 encoded, it's decoded once and shared."""
 
-    if _decoded is None:
-        _decoded = base64.b85decode(
+    if _table is None:
+        decoded = base64.b85decode(
             b"P(e~L6$BN&3Kf<IOci_;01^NID77#BV4ndE4gfYFT_xb|=o)qPxquX_SzwBUO^sFLb<q0<3{M6eW}HThvkxcNrw1ug08ao@00;*W%H^Ld`2Gl!`2j9{1|2syZbo?S`w8N<O?qR+Rl40+`5~I5o>)T*t`qO9bMhBF_$<FP<+T!b=^J>F%KN2IMYK4W`6mp*jI%%u_B#T9<702OU2FLpTI_H@cHy5ml};P^8P>D@Xv+A}W{p(f!Rmrp43$5s9`;A@LF<<^>(Q*#EcQEKWuf4seks$UC%XVa{0&%LR7L%a1cjNT6?8Mo|9B6t0ecT_YP_z@A3aPNKk#RGrgq~7|B12!HcKJx1yy&m9?epIM<y#MUM^1fKQNG@VDOJ36;@T3g|RBXB*7e{Xnw|K&Wu9ZD^tb~bdFGGVqPlwCwMu^<PU&^ICs{{NxI3{iIX1^@1{K}aWAe?&ZU}vfSO<j^q*$E{0)a@C5d>sZBod`l+nSW`WcaKYOIt)@5N0}C-Mta%p3qI*5IB5^mK=)HA7pnTn8i8c4kF@LynzxM3Jmqc(48qw?PnYfFemqYp!hg#Kt(69fw*Qd<Z&1yHhZo!NSgo53tf?44Y3C02S6W6~-tm6|6`V5ETX$1{^j3C<kdRQ*dEpWf%iNMM3}o04TLD{a`B$%}@ZErTimTV9;G>4CeM1NU3rgh574oC{tqK%i=%Njff74mR~31hi!;W=pPfDAm@3hqUE?ZL4uUI)wTU2k}$j-Nsh4YQr?APJpjMDaGAL&;|Zv~2Y?>1ZQd!z0rdfE0{Wjp(XyYIU0ol*c@#H?cYmsv|EKL`;s(q<LgqUv`t|1UJ1BYq(!<Q*kNjUhhp%18#8qgh`u_l+SHJW1s6OofQ`k?u(3ubbUms-3RFUp~*Izq-Ir8W5)OX#y>n`#i`fKJV0arm6IFbKPbzZ*$_)DBCUr*)wd7eM<5&v2E>-wpwpXxvTe;4@?$p5_S|96hAk6QoFejacXrz!nMsz<K>X(RrtH+sbI|7l0wMQ`fak?7Z*^TpJ6OAK)JKLt36-^|<`et6!*kw8})di{SR<Km)^p=TOh-SZ~;8-4wmi>@(ncU`#k=#SoY{Up}^rv6_yub#yJx{Ln5MpyIee;57E)f=t;T>sTXZ_b>Ct{P2E{TqE#Yc&1;)zs+C|6fhLny$NF|Mh6<es#~&(BHKl`6EyJYcnY=Ds_>kMg8b&XG%NMBUAVM(ez4E7n#zcR@(X6nYv0+{k5j=Mx|OwTGOeCuCyriO48c7*3k4(svD)!qEvmRG}miqs=w+}b)`;|N@?h8GN(nQ`b^#Pv@@;Aq;Awzq)LlQ)zd{wa@tUJak(DD<s##9iQ&2~p>9w@eUFz}qr(3)JjXfsv$Ba&F>nWua}2nPmvp~*hDS)l54U@9%UxykzJhpQsUCb4FX?*hxo9Wh#Ry2ni0oo8+4baDzEwtXkrcdlxr-@cFs_D)Q4C-8RLyFYZbRi-psr#<oEVhcQot*QXW0+BkIPqvX5W@7Y}Er#y|C3Tk|GZ7dT4fWkreT9DVw6|9hWhvW&DH_JJQ6*Wqh28kMazMvsTS)5f&X(>$onN4i>eib#O||qpoqUQl;;WR!!njt-5aG@>jQP9lv=UbLK8f%)R+T#Q9w-iZor<dseTE*7;dirRJr29i7touUURnEfJu|+qk)#)SNixj=$#1)bZoA`mbh?8EW<FzvfWq-?bnUe$2i3>s<E3Uj6s<&C75QZ8nB1?eBl|e>s)P`X0?Mv;8&ai~Ln?hS1|DPOU=XDyI9J!}ot(!}Xj&)z=KV>(_r>nfgD5zWbK<*R#viGtsh||K@OY|I7Y!#^k7K5}7Xl`kUIxa5lrCH+Ax+>oS*LonIq!m76p7W(>X7tmw^}z8Un_+`ER~L06<q|Lz;YO`0D)`tO+9q{06GX80@lOQprk{eM*b-LK{lwwn6paAvxo=3!6q^`<`UB}C#g^t{UJ{HpRoug;Es_9K7l|Fd=Wn=b#=m+Y!-=P(;|knC@>kQIxP@$rXbL|JSgig9X}gZTR(h*)$%8Rxc9D95;C3ud8!&C!MtX2TcAQV7}_f}6lVU^!Sc+2~egppX@1IBgatZbG>es&3f4PDDBr#ac@WLNmp8%lKnv3u&ShL=H*UQiPR7B(ioB`QXS6#T%6uNLD<M*;103jX-KB*~nCY$ci>6mE(`7h>BRZqDY)EzSv+Kav6neBU6(iEM-gn*qa1LGdSHGAR-wd7LPxh%nk?%@*a``2oTpUU}Z>`Kr#30sgg1Z{cb@<?M(tKRF;tqQcAX4NX~<#4-Rs=y)12pxZc^SgIV4?U^Ox~;F={-jU~2#xIs|<sk)IP=*oCO+Q%C)ku8F-^@-WG85oe4RqIs5mT<!cHsT%UAaJLXY~vR2Z<gboH6&c-fWcyCtR5Q*se}0{K7r^aqk~`uq7PgG5212szM*%-89G7~bSZ<d5f5hOiNNx!%Gxlx9-JI|q1VFf;1Oq|U_fjevB8-*hvSFaL1B%}w2XgbF?+?cl*97|@tBNW9M(QUiLp>#nxojB*{98uM8-Sfun`Q25haM1X10(xL|g`$<Q|h39utulK~a38@~Ya+w2N<0@C1>wiPYG+8@p-8K^z?#t5`_HtD(R#U&T&V!KE9$jm2A9zVoto!=i)BxoO%xs2y8?vw@mN$Z~@h7JHOpg+qE~oETBwO}htU)q{n^gh)R`oc%((3t-`?zzGji%j3i<cH9MXIlLwLrQz{@Wb9tXo^W`C%&{h&-L%s<oEQ^U4-RV!cQ)J{ghJwQVzifLmT6|=q<Zj>|9|p0Qfl3TwHlOK6I`%j!b%J4w32{iBT{^~A6iK~+M_2e(vvR<*djgsBxSWeKp6@Tq9hO68<6q^44Ds*)@?|p0VoGs6%K5!MiNjDwjzj3SlNn_BTsN@#rXJvfpoAXX(WMZSMbpe$=ZrJeM5wDj0{5<N#<Z*r44IKC3%P;(%O_wPlS+<s&Z~X@{MQ8ZODfsrPd9&Z$nK+r1)+?O)(siZ$MfvTI3u_@%dbEyaD+TgF(}q^cBIV`DoyDq?F^g>6XDx@{zki=>vO23r3c&_teG&0J{Z$j+8TvBjpmMq?|ORgO%Xt25e1O@!fzG#4KnwB80F_fx$xgCX`{}4+WT?q@WI)Qtp`ogMmIR473MY<QA5ZPgK~dD2O@1W1r-jWSazu(*rB5F-YUZlW%UZWIz2d1>8r;B}Y!=DGZ3%qWMLOA0|2zF)L;yB*Yn6zZOuCZBl&fF(;Mu!N6skYjF^fR07L2PnNJcm<weO`+%GgNCB%;VN=dYS@I3ItC8Zn3EQJ9m=UE4pCB0q`fNZfVRN=*0Oh188c4Yxr6sJ`qD>m1MN$9+q+Hu0rB$lhY|$1Bn<htd>%)PsEn3R>q4gq{0}S9!5+-d)tQo-?6UcmRjts+xuef3s;zO(5HH<R!V4K?(ezY=zW*1i`-YXb;fbte4_s&i;fLlo^--edBNd9I-@!dGsu}9|HjwLYA$3@ka3n@u>#|g$0TkPyJ1L)f=w&HgMcuE4rSMHgA?dt>wX>A<?J&<yi?MuWslmn73h;e9#_}zkomOl8g+Z9`I@Rua?Ln7{cg0hAX*ed31<ph9*sIercm{O)>L`0ILAQ=uYLV}dS^AH&HwgKDs#l|$yAFC?&0f5JtVUMWA#R(#+9#^nhveICp042hN*v=mk?@2S0;FcP5&}b9@lLP07k+v){NV8@QAh=*7C!xZ4bl70H^pkT83O*s-!Bv=XGNx@cNnn85nH%!P7Q6EYw{awh@DaB_=|08^XEev}1X2l+1Z4xsmzP-08V!;6FTVN3`ijMbC^4|ufs#gDT+~bs2{D>5r4+?6I#52m!|M;Pu3R`-*@C6bkPB!4i|-Ddi%<LL3@5eYvc0&(`f|f63tCBL31w3{yHjq8*0)tO!x8jyvFK{^XF?~!Ery{E1*pHpQ>ASR)*!$E<enO;CeSb(6$}|Q5C8@l7zaadZE#_3c@+#6tVkAsKo-a_CcXzI2pl#5C<kdRQ*dEpWf%iNMM3}>EENP502KlN6#x|w6#@VN02Krkgme{v9!wRy0u=xf001bpFa2Nw9JM<DnqOcMEU>Ps9&4|Rz9basp`g*wI%B%;{_))357G~&3F`Ozvi4^IEgL95=s)N}3Jw7b0R#b$O|O-99_wc$)vm@Z;~I@GX!rNVOso|%7l=p?Nc21e4N?`6Opo_OCIq0!u`c+Y2SET~s3a7I$n&HF5J`HDbwMHqC{>f^(b}z|UG)b&<F%WHOSFre4BxngnFl;P=S5J=)QD-fxlu;UD}A+0l$Ev`R7$^SCppx`%<e*RtP4huLGpl14^UO1I#VBGel{J`?g4QmXOcAZ1@s<+<T=&_nfVcCr4pjtGMlCEjP%lz#_Jb$jZ{nD@QHRCubT|m4v<P)mzj+^Ff%ndA`t}}wDT-hDl6?^g=*>bH+;I)ui;iZYVsWGV&;bF*J>Gl!6n+ghSrQ~EVa6BlV(J(+D*^vzY#L?BNt}wO>_%pc1+PDde3wqGhM@?gLaZ*MV`a)z+AAQpM#Nj%w|NpuhT2I=Fpmr*I~QM)tJkniJJAyPq%3I9ypW)di|=2G<gp7B+>&t7q#D5(SD~xW=;Tcw9EX`n}wMTXxRK(Y4>${+#uRHTo26rKpqL=@EJAhZ<O+{!=AoT*dl{=4=Qq~tD&I?nkbPJc^;*jNDuU&D59j-Yd5N$g_jx{YV~KPSG3pHP<qi7imGT=O`Gf|MUf6r-UCq(L{H?K`4a6kl}flSFBGe8>FKZ?hFi3T&CRd2KxTfV=Q-(-Bx$;aGiX=;&bRt8*MRMHqcdt)17;o&MKbJt`|{H6JrCk|0hDY~>>)ElDAO}ZA_yhJy1bQYI2W5umo}oMbj|*au&;fKemh^nJM_zFZL~BNuZ>cA)zdTn6`e_+v;s~X>w*wvqC6DnF^a~bgoybiUf0AMYm{iWd22TrML+*aC0e_cPPEJBMk_>TW_;H&lUhXlEA_DLonO6b_cK=4U~I4@5X6yS<|!iM1+P^*8bO<0-Qv~njDSfBUKnPMUOS0nU3GeeXh*Z@5dB&E*QffeSDTqp47vfCS%5@A&gEieCsO}{XR6<8YpgJ{G?@%Qlj)fx(etF|qR3{|D`XGt>c?8$>MEL?YGT5%F8N+<M7y_+Q6trws9~;=erfkQ^Ax3uL<Qi31Q{T7RM2lcG_+ut83BCwg)RL?j7l*!_$EdFjgUcVTD=1^1IX~0QHe^LFb*NjYR72RjvBzsj!QQEH+%xMw39VLG!`|MTFflTwyL=X|GK=uu0W;y2kkynz3RACbO4G)3va<<eGMfYi?=?8nWb#H^oP(DexjYr&CWRg(jGMhmUh&0tgA8n>iZcOtzhN^Z~jHQ2StyD(Q7HD9emOQK~eP0B`%TYSkAhIx9DsCV#Z9Y6#bj5nE9C~{WnVeH!`z>!U;wjg|zxayH|kXSXYf`SAS|Aw!4*T#2H^hHHp@^CW4ux%KC$L(t99@1eriGUcQEcnJ*#%fm5jQOl6Q65g8GY6eLMHF@=N}<e;S<5<u{1C{S_?12KjWf(Rjm5JCio7(=BYs@AE&!+;b|+B~9Al(aydc1<?f8pHf-?|4Me8+e~MI>PM{P!Xw5iPCjMEj)7qJ^;*<mNb)P&AKEIoc^%Pk%et$aFk1ladE?E(JB!4+H?aN1y1XNWxXC;KGzhmTW;=uqzMKHs`W5Qo+t3$3&mCQVJ3ykn1l{bZgB+)`^>z+;>aa0=%SuN6zGVSY4K5#(Y-yurY3K<uNNK*IQHNgV>WA$f}b*r8+83jrBqY#{NBDI{3?jOHdJ!wXI2j!qYLD?9cm-e$~=!){EFn>z0D*aG}mbkBVv^(D8~hK80@0=EhKKp1>K3wP>7qxw!dT|WcfUly9YK%L;3@VBuy^d&NAwvyvK&lC^n!eoUC+$46T2%&^F!`9d^gZnNAAh1x4CiG;NMJ2>vo}j-FT*>G^Pv+kVUJQi5_ML!Xo@vlcrB{?6xOOrJ)G6c}W?&E(ceZWBJgH(&<i_~I`WjuS4oYp(+HeMv6T+4FS-Lwja2*;|{QG<Z_<ya1fx;xFp%u&;D$X9bwENJ+3PN=4FpSH+U4#)}pKv6W?rL?;Bl^q{zqKye<n(InkqGYjJ)19(W&6Bj~^bH_?WA89Aj?@d!?<XkW=_N4*;ejl0oOkqh(jA8_oorVDvOa;<b$S}I19jmZ^!iS3y%3{+@EQXAtb$)F+YoY05wHV$-1X48HgQ~Rrx%)Aoi-S2TX&hy3`-5EsZ!5}VV#(1rAmJcwne^3zEG0dYOZm{)8*jM|2H=Oupb+dLZ_4}-rP6f3M3PBlDs@?R`>QbkHZGAFb5<^mF;&8~PkGkcr~P}AU}p4%m2O^3vI+bWS&ejUH_$Mccq|0U?_oxh5lFiq#8(wK7@$Sa60zt9l(~rC*Zm9QPHUD;wYsIJI~3!W`wp*?9ElTIQh|wTgmQoE<Ltg5+IG305d3Ayg7~ITQheySbqIGt_kCoL=hQ<5W|6RZxnys~RRI+M71T%-=r}ADtVk6Q6$TXs95w(bCRk}>Xkl(=AX8y<Wo&F|bY&n+VRdd}XdpvnZggdGEFeQ@X>MT{FG6f}Wgt&-X=iC}AWUI(ZewU5Q)zT%EFf29b95k7Wq4t8EFe^6cwuuaAXQUA0000ewJ-f(DiKw20IDLDI7L7b9g!P=eFxZgP*qhG(Ag5{sDMJUt&TbbFl;T>7EW)o=NPj?0j+t_f=TZ#SxB@jKhA~g%Sq%{riPXS2DKf5j@SWv0}KOx1Miqx%X(Z)CFTe4@D}5WpVq5V1W-#IW6QBk#=*AZAU0#nUS1`wo~>u@7S4}rz1gd0Or3hQ*2=WP(^{^<yk?i<r<)4f>Nfiaj}1R&zhaxKhmc7-u&UdfHO{G-+7zp)Zgud$t7Ck#b$kHqmt$$O2f_6<)j_KF`PBf@!Zi3p#(9I^dJJy`aNjujIe%+qIjt@&t=8=a4-|vg3|F@fGCRPVwSjD&)|b^c5_g~+uOQUJ{j22_V;BK2bz2=<)B{(n1NZ8bTC4!oqSsEhm{y8E;EFj=kV-37Eq{z|Uoptn0{EqMvoNXoN->vCsfL3SfVx$w+X`e;CB1Y29Z07d%&J~B%28>#hoqHiY6U`_dSEHFn01|I1JG!dZlnbwol1$_DlyNjYH0^lLqV)fT9?~K14?D>pvg)>+?{@0Dz_{TuhavV7?u8^QOvSVD`v3`8;x{~TGFfZ;L?wcq}0M_^#HM$^o+G=wZSlI(GIB9)SGcoD>wMYqOya3Pzhq`2CIXtG^4Uwa)U<)4Zfjr&017q992^6lJcS*q?H~TwLHj7f^bj{^`isDDh0u)v^c;h2h!uxU<1`K$$?sqY2Zk?-2H=Q*zlOwhRj{k>tb=JHe8-z!!-^3a(TGro?*i^T$m=~RJ%CGm0_d8HfV;+9do}pGU^&!;}_j<4IFb0F3cVC%drpFFwfu_+&RG9{lYZ9f%%jg<mDg!Av1V(c?R>4nh(FQOHP*=G+dsMzQHA3UY>zNepu2gmme5M2HOC$G-U8<1MKRM93I~BVY$4dUm3}<fp^G{%R4wcTw1bn?~oZwx+P@>mr{0E9hT&f8eouChpeQOR)_S!V0Cm{EQvv4ke3eGv2l?YWJd=EDKSVXF<dgxm@ZtXSSnIZ6sALVaLCFAg}ET7iqw!84vC>dO3MXV;n1*99TzH-hNU7ebYR%fpsI>x%0PB-Xk0ovE>lHgW8$DHmyU|uuy9b73j*lSxKu7|Xjm#4a7^+-#lmIM$bh;~v9KXEDwDJzsSS-v22xrqNDT`dl?)^`S<t9Ri=;R-BvqL-He`j`kdxGq)HH2qR5mm!vce=cG%Axu1zD+3sZ@{wuplQ3a;hLPzyJda7)%&gz@S0}SwUK;0DuYrs32vEMg`9cq?8r{o%L9p%~BETc^UH_d)a3#NNx3C>UHR6srbRI+px#0nEv-6-+%Oaz1cP+U*}!G@c#GLdOrMLy&k>zs}g%UpXFi~0W-XX{B<{!^KCBvMk<d5?+4PyA=fv|b2Do#-diD@&t7kX|C<)0mh1bFyM6Y8p8bvmyc-KsZwu)_4~y8#TC&H$&5pdqtQlUAdf>=&yvzL=+Rj=Kqn^DUwb%{(k^ld$2<>#%a%sWVz3Yx#M85jXW1wd(5caQpi=`OlfS1mK*1jdnzwS?w&pt54>x^uj-B557k@o*myZJ1(eWu%G!R<vX2-@%Ios|ekLA!a&S~+sD*?(4qUU1U<S^IT<ldu0a+htpAK+l#uLM@0a=eO=tx^3oWH&(>~zxyrc@1OcxZ^^KynQj&RoJBGSOD(-Tf3}R+-!62c_J6Z<9BeNawqIrGh{e-lOs$<Zdki9X@QXaPOcDH6wb^9)Z!e3j1$(x0{1n?P^4Q{eacVKPG^6f4wq$(CpEHMIj4LZ!oO#*uSDya)akcq;d7N>_!?X9F`LfxwwJx^vDsynh^Jj~*?A~wqv2_n=vH1V<_K&4k?^%wwymdZj4QKp#(=yK(zhnE@V*A)HPg=ZgA~<9J3R{oO`pj4)d&V_ei?fw6?)*6xXF2UV_Q#vc`oF~;Y~|+IJJ@2p*<|V1X3v(yx#PIjY~i;rv%LAof5{EDKJ%w!>z2*gYp&?K<#VP_vn8F*?WuQpvtBu$`M-QEf2RJ~J9G0_{`@XGpYuj7fB7NHPw9KsI+`h^+I#MNuAHRwDb1C7<cnsJ?4M=j^MePP-&)kE<?ALl`cAW3);SgZ5A<oJ)usPNA7@SCj8@#C*k0Iaw$y{IZY{Mgu_dv@)v=|6D~2V-U#-QKPppyI{s#NTVv4cji#mvPTygbaxn?<7Vrw@~v6XaIOL4Wba`M6%%@$KkE0&Z}YsuWPmP%@6RV|7+e9=rTi(gLpxKhkLhCk$LU5Ymtt{DZv^zv}}j-`v#n=-+4AKG^k-*ZAMA>v}hQQRabLM22K61LV+BIxrS3JkZ!i3CWbO!mYPJ8lH+S^_)~;z(>0Xk#FQF#$m{0U{w`b2?C`?cbokPIjG4jJ1TeM~*XsE&yUe6GS4K&_LbJp7JtVn?g*Ph~s}uL{uYX@*7hEM0vImAWRlkRJOrcfx;=Xz@-z%YGQp(K>I_?Oa!PW0clhv0rv!Y7d6gDgltc6>N1)V;bN>4u!Qb*^*3X}eHG%<>8-t<wpBq_i+B@^=0JT?tGjiE5uwxb+dLRf=MN^kDxgPPba$s&;mu8%ehPFy6KHc2gsUfg@`<|wfzz1Zlc+(}9YL4ySew(-r9md9&#DhevRkKFZOjIZ@aW5-G83Y%Mu3~X7b^mrL}w?R)+QiLqS8<4Y2rLoo-7mU!(AjM)D$660#j)kM4~a(BmwHR$@C=pQW#E)u&Ydu$RTJCh60qvn9vk01dnF|oLq_DbVZCcK@&Z3Bp4H2WjcfoGmX%dh)YQT1cVSYMsJyk?l_D#MPOG~2;$5>n49%i+Js~xff4nEKsI5n4)x@@Sj1!yczvx31U)m4bM?espKTmf>4^k)?xeH#WRkGUx|(!2NjSYJjznLX_847J+((mOxQ`Nb_LSx((YH!pnW*o?cuFcxzrK{GGZI<niqrI861`Pmrl+n%kmv_kvhV(KmH3>@(g1Hh)?(#(Jlsa<kEgTyoc_SliJAv%u==p-+abxc_W=m4da_H6m^kkfXLqenXPr%4rJs7ubu9haJY4ospe0|r+9v&Rk0<?Y_XGTa9Io5s$sX`=98f2a!`1V6B6YLAvNwUAs<|&yoyqAb6JK{SH&LI?R8?;_Rf@CpQ<usf>)KVGe8UEKI<wUKUHUzZuZQCb=-$&8f1szwUgbQ>vs^EGiqrWkb?KUGt(&I2x^Wh7$_&up-872QTxS8(hieF36_C>54SQb(YVn&nQ`)ou5L>QNmau*xB2RUj*Rz^ZKxf10n>bk4J3T6IAg4dh+i><--SntQb9D=;TAjRXHHgXCkjZk|vz8<6l)sSt<xq2;%>k|u`q4`*B03$ynqUXSdm;5dtZL8uHaNuN)x%@=HX-su+F8D@Qmk%2_4U<FNayol-PiGWcC+4FHjf`nz{TTjG7uim^8!+a8@MiJltdQ=7%UKHl<)~MLZudr;U=x1G~<>|Vt7~@W#C(yL27YDFgj2wVZ5aoBJt)CMkxl#1-ay73Z)W+S4In3j5A6l{$arg-x;M*#uc4Vx+odMu>=?G7Tqn)AcZVqj2DK>AdN~QCi#pp1rZDsN|zI^7@gE@aRo9?L@6;`1tF=$^%+<crQoIzBOG0XLa0PsLE11z7BNB+tPn?0O6dg0Vd(?~3PhzVwn!<FV3cuTltK~QvE%}U6(>l!F<ev{O^{N8;dg9Nx+3t;SW@z^giTNa(pb7M#1mqaMq`Vc5=sF^2_+JYKm;GSVIFlQ7c*d>aAk-e(uxv{5SOmU5N`<<jUgbVAUe4yz$lHSeMb<m&_wQHb|^@pi1CGJisO7Cn&bVz2{?sDa^cqlqHCdF+(Mi=+_OYO>HNjKn<Nsai>lE?qZz9B<S~T5n4-|eA!!9^ilPz|!WSa25Meo{5J@6ZMalRJk)+M7aU4!kNNPrKiU}`nxUUYdz*F=QUrZGt!je1kkobZ$l98bacQhSke^ii2a8NFBObI86#VGVb9Ou4d{fvxZiQmwR5f;0Vghg8m<#>^H3h{%PAxsEIGE)>@d#Z48oFVR{ILE6byrPS!f>ftQ`;2>vE)j?1IGS2_xp+B@DRYM}G!kbd@exJS6OJiYr$WvxjyNS;ff1FAh$F7%^>){|Llzen_alJ|cbewP5sBj0#l9~7h@)#lcX#;3=!W)fAvN)4x;sL;$otu&PUCQqMA05Onh0Tv%x6T3n%v`s<f8ME6BYY2aw0+tP0`MbQxs~`<=8?Csn|2jXsQU$(KtUTqdBT@5o?l#hxY6$2@POPWU*C*u5gY%9u1FlDmDkSi?%<cx?-e-c8bi_K67MiD(0RwH0n-dw23lDP&$k@OR&HwblI7XbV4iHpKfY<jxJN%nOQO_p<+HKKwZ@`BU2Oc8C`al*;>gA;X1m^dIE*^xi+A2N-7G^CUGK@Vr!ZYi3LU{JEM)1X!CQ~AT0x3-5St9qdl6LjdJ;Dpj}h!jCL{t2xWF#`+PJ&VrwHPnNg>CPB5d7=cEFlZg<p)t$8w`ivk6+ueLvzj5gwK6Ey`1&koI<sQ_k!CN5RmpDm)qi44q|*|(Fgg-TqR(XQN>jHlCX-P{GUsZR>+W?)Yx{*q94#-pLw7Xu1WK%45NJR>#+#p^N~yyGZhQbeH<PLOZ{!kCmm*(5w@V}4WOHK`y^NZcc651KA_clQI@lZM$QnGeA`X#oHx&WZsX6$}|Q5C8@l7zj*nV_|e@Z*CO~7OY4X+`a)8>{up*P$uFr95w(bCRk}>Xkl(=AX8y<Wo&F|bY&n+VRdd}XdpvnZggdGEFeQ@X>MT{FG6f}Wgt&-X=iC}AWUI(ZewU5Q)zT%EFf29b95k7Wq4t8EFe^6cwuuaAXQUA02wS51Qh@k0ss{N6%Z8y0000L1QqZH6{rME6@C=}5&!@wwJ-f(_yAQ10Avb13fH4>oligjfK5OEAbdd0%*@Qp%sxN>fI&br6JbCAM8G`&Ic!lz05m;7>`}NLg)2}%W@ct)X6ArLfL1_TfMft^pkUy@XKOLwbwFSsV*nh$TmUsDJ-}W-q;Ne7*CR9lKOkIQz)gT*002H9VgOWtLO@V}OF&EjPgyfSGZijCRTmyefI|Q`z)%1vOgsPtK$@AEnVFdrKmY&$0000xKsX>^gKE+NVBpDt4SZk?++eeKzT1q8!N#VbO?U6`Fg~z>2R87)eBe%IqaE!K85?*YJn+E410VRn7<f4Fw1KAsWj5N;M$2eB+8fO<1Ln3vl#J)VA2`EYHqw$2D<1(B02SaB74#J>6|6`V5ETX$1{@d&0000003duo7zh9W000001V9$(G$;rF00000Abda=2mk;800004KmY&$D77#BU~mM1D*(&^007<u00RLS00V(400RNo0RRI55C8)KAOHga5C8)K7yttS8UP0Y5Fio&0|5{K1A!I*1py!!00RLK00RRk00#jAfEEA)0T=)U0RrX`00RL!00RLY00RLc00#j;fGPk30TKWO0gxB~2LT{}IsgR;5f%Uo0T2QKK@tE72_zr_J^%v&UH}6@TmT0N1PB-a10faw2Z12L9smb}Ab=<U1%rSj03#s;3J?$wfEWT4I06t50mMKU01fFtU{XOG6aWhq5dy$~6aYITfG7eGpaw7o5LgHam=wfdPy{3h5ur%}NI;>K5C8{3*oG7US%DN830NSgMi4<_AebNlp-41DJWCVUz>2^RLPV&t+aXJ6UyyLCc=wDh<rD!+Ivgo3ZhTI%@V#SJ-dC?bxaYUOe(!(YUB($d{qEQGkA8Rk?+^h8{?_{v0SkWD{_pP?0SnY`^Y`u)0Rxs60S}xy+xzvp^B4gIZn`7^A?}yA{?}jr?|*;wtj~Mb`w#&Mc3SDb8UX`Z8UYpFet-Vw_P>9B`x*fUzW3V@0UQ4N{q=u8{@U$*_uKCf0Rwsx0SC5w>ofrcets|k6Mp^Q=RNQJ?-d3E0000%5CkLv1%e<5gCGclAP9mm2oM5)gCGdPFbo4B2!bFGf=~!TVF<+_2!bF8h9C%nKnQ|x2*n@>f*}}!ARxpb2!xObieMOrU<d*tB!XZVf*=TsAP5E`7=mCJ!eI!4KnO-62!>z`0%8b*At=UR2m>J)gP|CLU<?M+7y>d7LSqnuk{E*G2!<gLj3FdKA_$Kl2#|sZhTsT|;1CfaG?Fku3?Uel@kEK?R0f3*jdLV}H7JZV49#;S%{5dOHf4r^9KsMW&S5x{Hf@H%HPR#r55qXqAVA5~P{|}1ND@ukkT9KLOx}?QOvDJ&(|iKfOi?F50{0mc*g1_bP20q5j1e~8aR?IzO^V=roiG`nG&!5VOhP1fQzT4|kU>Hu3CuG>!X!B)!%W>&I-@z6*hD@PCOU?oj1q@TkuVuTC}|S|O_150D3q#N7?u-68WA>$&J=agB$4Noj*|mLQ`C`Bsz#>~uG%Cr*u*+%*@lt9IPG{kPn$-Q1WnNyqOB@L4#afMnYMpY)JA7JMJ*IgX~aO-gu3V3YLMEtpTt0C=(JNiPHG!QlQ=!v2|IB(eNiM&YSf*s*M`#?Ar9nD;j%_oavkm&y2t4vjk98lJB3=~eqQ4q($u&Qry|n~#nFK-YAAX}c1(vyyU{s?Zlt=9>qYMLxMz((lk2Wm<Ats}xwh)A5#pMmyQ1qb9WLZL*XJtg+`t2}9G(lg$KW2}amQReOfG&vmkXipc|308PEDw-t`mDvlQ*+_xCw*|?vPx0-sG4%<efOt`JheBGC&?uyZL;mos&=b;nmN%#`$7<`HjUBlINaUd);+Hv)APH(lt4<#`)wyHKML=KH%3n<y!64m*mh*EFMU+8nrh!UQWaG6gGK%(KOQKXR|uFchFOw*9gST`E=m9hvdkhU0#0CqloBne&j=)A70+nhqs$hel_TN<Wqj+YTod4+%(9Xdsm(#L!HCDSLSM+=g^6Gd5q<6&4)<tH)pPUb)Gj%?p^uZATfE~<amxWd2{6m2CI3K4|$z`O^$eZei%kRESH`mN3+1gdejr_&5zn3gU9EMmm@jtMHg~J-UQLt03Uart98RS`9dRJe)if`=gsQTd7e)V@*ZBE>qnk7d7k4ZA6|2wH-3%gL(Vr>j>mc3EV<X@c|PQEedKwbUqe1zd7kI=bToN~>PVh@e4P(@o*yQ>r~w=m3K=yJ00tQt1yFKnV`UW#7OY4X@*Wnx8z#n)0Ve*80UQ_z0000003duo7zh9W000001V9$(G$;rF00000Abda=2mk;800004KmZvm6$BLk6#@Vi02L4w0ssI26$BNqvIG^<%mYjnrbZP25&!@wwJ-f(n2Y_G1CGf^#vCRPxExvod{g772Ds=Ba4^-rMn)@LJpQ$N^)0>Ymx;_2irjne6vZ4F96lXIK!o{u`-y036Lj?xNwnlH@*kq%28b}f5J+`NR{cWg+=<2cg_MnP<nssN<yK+x55gx{8Ua6$S~^^8_<u-}F~H{kL8(_PBL5FTHhdiZKX?#vbNBy<fkG7H|HB2Dh_n9(8eS}1zYoL-c7eYSz77vs{BVmK@}T<R1mEy({BUe#lxRO3SrY{H?}0~Y2>0_4BjOI0pNAZ$8UlVEH#}81^1sd6;&$hM+msl=%l{_hK#u|c+X+DpF#S6$HQ5;S?`UL1ug<@NkQ$L-{|>ebg-rcBI?z#g`*(yHc+~alKxOMK*RMlUCogk;9cUyN5q}OzGDNWXa}<)H#mJ9C5ThBVejI*MI-L4(KyiBu^y6@%<A9C-hN26I%KSGJ1z3RNzj4L|;iUgYml{-{{5Rmr%mn^69;d`j{x(YB(lX$$F)6oz*I(nrBqy`}8Wm<qKK?ZRNIkOg(_nKa3f)hGiQg@=pN0rZKTduc4LspM^3ymQsd@9ys1(N#lz)aG^OBr@#vL%A!u&JFNPSB1&q&~6kIL^xX~xlv->pZR#lK%ht~x0c{V^_)QJni@NO>|T_{aE>WeeaRgM*=2n;%9FAU_I!7%9*~p!i>0xsXQE|Dvn`7X-hHNm^W(`d#?x5J2O10pv_^@o$?IOmFgU<0PbzsK2f7jAO084a=?{6#lj+GJrk$+bjrf@$$26B%nz@8!u2}$bL4)M}#$gHYOw}&we%(d0ch+*MxA2wfL{KkTm=9uT3bk$Hc!TAq~fzzlGt0Dm4BUXCwhse~WX<4>~^!PZPLA`B})RIeGjmfR&gd<X=&v#}7sSiUyH#eEce4QO02Mt9T))4&tAJL!_FMKSi1Y4%d$&RI46!KME>=PSAc7QWh}+@}p3(CP2%N0)>oA4}KIEco<pmqX?q}P~$&Q=r9<Y{{#^oH7xumY|u&~_Mc$!D97P{qHMB6ivL6z9v3D469NQTKK^R0cv!;u)gobmVeqSILKK4LSA)U_kioB3p#}-PUk$(o%D3M{DG`x{eiMUwTqgY`CKar3^p}7%%F2zuL?RFyp8O?ZT<SXXlc<DJqtj2KZ-J@Bp9F|GRI7dx6<G8l{6_?0gP#8gRIyO*7ctAp>ir^OVc}8ui+FV;&EPLW50OeyzlbF;V1)QXfTD4$#2-S;u0=rp5N&!EHT@tc=~^}ZAg0WXIR6idj&Pa&4=(ih%=*)I{W4Scr)`n|IrpaxMu0=(Pt!Bx;^9wIyFf<ZPdji0Q;t7vfFYR%zlT?|?3DZ-3RN*t;P+5RPnJW!hbn6kX#5@+IHvvi(de`hGxMX>9U5`;qa`te*XZY<=n7@4pF@=}HG+N)afxmW`ZwSb)uYzGfs3Idz5We7e*MDpZ=j(^NsoU+j4zHV{tY7Vv|;)+P)gJw(62!bkp*_YhBr65$oVyRL2(PopW&3_3kH7%Nm~SY{2BVN2?F{voS9Q`_Gie_<wTkvLo6tWX+MTK87!FiG0+jP2hWe;OBqSSAA=S<C$oMGQ!row{4sdYgCpU`PyiCH$^R@BkXuXsGfgjq@cGZ!BmwgCUm$fsG4Q{TiBPCr|Ai)mipcmcEZ{SW!f%0+vV?};LZd$i-uz~R9D$_y&HNxfj`+>$q&oHEHzN~E*O1?AjGjp#zuAK!dTYN~*bf0i{<1<rQzibgJ5srL{AF~N#HjeocEDIL_*ZZYHA~1}A;RDW4nKuK3ro&^3W0QuV)0XWD>5bUr$FNjj^9r~jR%Xue}W_mmRJ4>e3>5U{1VP;JyP>W*!2W~lRtu=G#xPg5%R1n*B{}E7PS|D1SGc9xcVb#kZ@S|N66sj0l^;u1CTe5eh9&W1lsx`VCi(~#}6S14nSpo2tb}-2=PN`v56Ie|G}?Bav1&xk9tgE_#YUS@e}EHP)J1;g5Lq4OIoh{4&GEzM*17@3Lrwq-#{_RgR;Ltq$It{{0&-+2*dL?7y*|E$lu_6^k(R1pevD1($7Hf%od)X0i9oVZa;%OUu+b921Xj)RQ(Jn2oTfz85kJiE7i|{Knq<i{sn+ENm%<A*g0}4@Gs~Q#*l@70RUNZ9{psP3fb}TlO^g3R^lg1GQjQ3PxfZ!>&j2IC_hTS0z<Wu`1%z*Ktn72W2zo(vh|O_S&5VMkC7lNl=6>NkmLLDj}Z_9<ogp?;;19(Pf#UK6^B0oha;(g{0T0+dV}FdKu1O)C_e%zhXft`2Rymjk?I#?B_)v1FXpID5+c6=U3Nk+`VCkTpfdLxFcl}*;BNpF5itY5fksagbo~YZNq~X)8{lC@((*TeHe|}&Um!B=il)CnqNF7te}Tg_k@y#|lZOGFpMb10myJJx3Srgk55omu(3L+7E>k4Oe}D=`sGxrUN{DjFFW{CfI%U6rSZ*M3_ytI=V4M5}q@XfEz%PIV;Gs%?fJ#bo(EI^jwX$UL2N<*@M20`WA7zT@4<LulsUCj-7ol=s`2j3K#Ps(As29Qv`0FePC9wR}&MzU8{>tQ%l0kp^>Pv<mf0{-GomfALXvETqA7$~yM1>#yz$nh(e}b~K3GY9Bka-~IH}Nbv4Dp+9UJwBDn`*e0VE9c84B!HPb3us*3;qWoVtIRa|Ee$n^zMFXlf%Wk3uH~C9`9}sNdSEBZUQ?!7T&#NVx>*iyTK?i^7-9hMdZ*)-wl=kPz<PdgB6f8<mz2uKLQ!)@h&hL70ifw7g&TxI27Lf^#w--TJQc^bATn#yT1N_XfW$tUwTZ{U+?<Db07q;cYW2(LDS$}UrL6|LG!M!3x5jHc-I$#U_fTP+so6fUya`Fb=V`y+`GLBweiK`-Cli~D8zZUR|mMa!*_YTaOCFYU0xwznUV1Bu1f&mB;Vb&2N^f%U0rA<tO<Nqmx(Y}Xx`10c$SvEn=5b)15xkhva+GF@ZDS@a;-&q7uThU0L8nwCIz*?y^HJ2rnXq`;#zVyrSaWcI0jLs@7`Jw`326qw^rCGQ1Y%VN`MeMy=!a6nXa>UYf);<B=&BtMsaY3y<3Zo){QOi)<U_=q4O@Sw-ZEKyi1ElAO|n+(n=5)$mm_mCQ2goy=$rDEDGDZvv|2-HRs(~p5)p}ygLi8kc`TAXT_*Q)8*Y+7s>?cdsh~tzQ-Kz#>xOGfYrN|Y}WEVy<1tv?t!0oD}!7~vwOD^L<upD-mN@f$yAAVVHFBN$j7^|2I10z>s?rQtzsN_7gm`nJU;Kj8jH}F=v`O>a<t*S`zjYBO%~pL#i)11&AYDx5y;f&-B)j(ezAJ@RSYy7e(%0=prX}-cU>*{;G@yIuHc$jh<w-8jzdQw-gV^yfDgHMU2*8urS08ThY)Cuz1u4A44A@qTLp^n<<PsWiilv6_in2YrD6<vmokf^0Jq+ylmUhf-Mg$9XTWIjE~^%RXWYEYN`a*q2Hs^AVAl>T@2-kGL1V<btLV-!Uhl4oa{)rfyQ@&lBBl23DgsX`)p=LdACOcm-c2<bYmdB}N(?PubKXsL<X5d=@1|-H<c6kqQB@WS1@|thJhiNVco$U?O>KC+i|T_FK3VUgVxYGN=-o+Bmnt{CJ6S1(nclmTh>lirygO;(lmx?fPen4NCw=$Sm_|KU-aU1rOP4zDn(`G4O`La4ongcw%)6$%?5Y6XHFbr}9lv)?kwH=td)JhipcRvMOZoNKCHHQrGF$Gzyh|#Um`Gvol7dws5xz^Rj+-MS-X-+}kdNObRYS5Y?Ojr8D*|A8cN8Nufrsyo0%IbFp?62gXvAs2yP|Gwk&ySUC`d~^QSXX!9QDG~yP^{89WwH6s4OIcF?lys5;U9R-B3u}%s{;>sYX@_ws$2Jz_Hu&E+|`4c(HgF)S)5;zTO2TY3y&tyPz8B8Cmr%C=P9Iz`XnE1*9aH-u*<DX(I1>QbgvGsdqi~A*71TyPi@oSu^EbPa}HRn)7ZaJU}mSyxU0vt3C+cja(%`EXuo)VFWM9dN&dZDni3|BZ~-9IPxy!sXthG-i2(8!wAN^kcng(`QC+0Lx+o?cOj$DVOjAmCsuc2y1ct-P7M*N-hCWwi@@OBM?c6zkKTQR6XwF?yN^~bj9qy5@rDr;c;0<v5ycLXcONOFfI;cqN3yg^JMTW$yvSAWI)W-t!PdKuly1bJ@vh^MS9%iPbyTyn_vBqi3qo=szN_h%qq*r_O_ZVNG``!2O9Y=!?>0^rc{|^26m#y#d$$pe2MJs6HqMw_Vc=axK90ncyvw-fa8Z|c8QVz6b@?u16ed#m-p!;Yz>UdwGnon7%kwTKyak3ly^ATzU@N?L7ikQs8{S<c0OyI(yO(fHf}{8DB}KnAA>O@Iz_KyZyNV<@xovt^aY7(QmG4?|!)O!WyOx0b;<EQ{rMn__(042Gs5>+GE~UW<V@$nENzEouq~4`ummx@`cPS~!aD&pjiB$^y7<@PJMW(eJ?<Q)X<>&BS#9UEW2zeI~P%p{iyNG^xpecM8Q4EhQk={joLLdo<cM+2yc=Y96M7M3S<y}M*rY0@lMKl#HySzI|k&!{lcPHtU`Be7qq!u>#lDs=9gQ-B5?;hfX>EPqt!v#bJ&E7pMz)4Q5cO~&U8`ScyBtTBU?z}4r3kCol-j!q}02#h_C3TpiOnf)ess~ig-i?$=&l7}qBe5xP;l{g>Ot~pU-i1`T!NTObkcvFg()8}5O1?;qz5D1xVJ9o^KDy9G1AW)g9Z|scT}OG7b|Sp%s00oHjqf%ZBn*S%-9}N?AV<C1Xagqzhwm~XQizAgyNu4T2$}Hiq8gCO>br|%%&^h;?jloFk5%s)TCOP+=3T=@Czhw)H3Y;VhUHzuJVGSvyleQw%@8^78jh)<_3B;20Z1r&y{kxZak1=OMIj16V(_k_6a)$t?<zXV9?5qL^YCR+^=_dX5xi);TS&LS#PM!ni8m2M-X+W<hxg=NLI`ezkM9x+Fw^Gd-9)w|P$qgeks(Yyw!E82MVfl*T|}WIh^4)Y2u*`VXYV2+lEIUqcM+-J)I##z!6}wbEO>XY2%|BycLz-z0deQu!4fUTta^8F!mJRD-aT}f#*NFnhr}!jLg(E>E*vY#y(>7l2V%V|_(g4rpmzn8pqN|nt{{jN=iIx7=y07_-Zd2Wn5ORrvf_cq(7S=EDu2~_H!$*%f=TZN_Gu#N(Yt|KASK!KZlTLxvOK+8$gyz8k9Q0Cs8wgaTj)iKwzzi*iJf`oyMzeHVZrw9pjC}vg1kG(%-jmJcL&`?I+W(!K}SO1ihOs_jWlMW-u<iWpo_)3e~^%Q3f}$Oqlk&ayMHb20CBu4$c$y&?+VJH*of@iK)woHdG&4}%fbV;-VHSC2b~!225M6y?eX0}G;-C6^KKv&KUmPc8;HYXk`?a)3dD(1+q;0^NEE7h7f=T>Kj*uE&~O;Bd-snb8K)}W{S(JBiK2J^2%sXz!MlFEyf`)aZXd`<eQ3SgN6#iZn%?bm29zRH@AkQSq=d`6eMs!#B<9^dBVtqrd3TR2!3BBm?kN=piSFG!jD#fT-raMkvPgw@_xK3qC-?52286`ec~{RKNsCgwtLI9n41MqBF(e6;qIdJ~)hU$k;-Pg0!>4!gM2Z2FzKaKPffdAe@puViQTHw$EERlJc^6NR3IY_odk5GGN@?%j5w+sMo_FtDf)ruOyLNmzIw9y?J4BKUHoj|z#w9sI-mQa3g3-&nbprjMK;_*!YJwd4y<2C7rdgxjt@DDHnkMhoiC`*?k$3%W$+hZx*AGiCIK_ASX8Cv%=-ob8mGF3Yw{Mh`8GGLCD=dsc<lR0kjl?Lt+h<@4iOYBCz(`Z5(z|p#1asr(-8qaw<nZ2|BMHfzvUla6k}}8aT{)aU2{?OKP9ipFtKOB9qJjn#@5;HLSm(;Se5?**33!+9ke-q#@A6qO+u(VZZv`YgFW%*=U?LQiclpFtA%b}qPAN}rP`wK$kR}L)@4^uhhzE#w;fyiHs(W|u6&~H6clRu<%DeLJo|iX`1iZT!w+BtgyKnl!;xxSbhC(d|a^7`wDuxtW@45+0R72OhZ4f0HP~crQm4%2byvyd4Dh|KP1_=g0UhlFQ@~47|ciB`*S3cfd)2b}4@7*<FdM$E$ca4~08a?l-xdo&VtasIPsiP+FT{TfuF-r2TnkSRkBzjlP1ze`?-c8eY>&cdP)6iJJ$<MoK(7_^!@9O=zX_WP@o*A_7ysI}sz!XgHqM;08gT=dOnw;vi_%50bdJYrcMN`284OZ`>G08{@dH2i?vH^46J(B`gVT*Uo+&aL3*Sluo<hWw;ZW&$}*bI5MObj_Gy51$D_y?xRyJQ-qg{tyy9;R1W5WSnHLJfqyck@gUcAVZF!vw^k-yIY8rh(17W5mqV^6@U7-5yjy-o<mVrbM21@hFJtk@xQ1tt%^7yn7d`7L5Atona|3f$!cC((;1JyJ9>&{y}?J4BV<UQ}2qo!KlKKcf%ysfk5$Yn7lJ?;Jgb4muckAyI|%}!i3>nFk^;`EW8V*K%V5~yI)G7cmUr0BFaXYh<EM$_U7u|wWC`!^yXbVB{t?jde@63OnR-}^}^#Z2CH|woRWmg!n<8~*x?c7-MUA}!6on3B`6WM_%4@NgCN`9<&wz@AgFh_j5&44;$1E@CeZ}G%SFK)0HfaJLV!q}ws*G(a*?3ayIW)|(E#IJEwWGr`Sq@rJz^xq-qqsftx|bc3l}PL0N>T}qSiinSBr<lQor8KA_@Y4!FRJPQYz)*T`Z7%5GLQnqQlMy-o=tZj>nF7>3R*gLG~`44;Ty%yj#W9;v6*ZR{6w8OW?azE?N2{<=rYrD$xabw@TQT7p~r&Q<b7}>|H7jAY~Es?vyKet&qGsB|@3V^xY|AV%QLQR|=3G3Ix0>r9-e=AKs0U=u{pF??SP}s4&*MP!gS?B=RnlH$Ffdz59gnZphucPuAMNS$fw=ue(JF?>Zr5>ay)!CuygesCS)ks2sK9-6o?7fROcWlQ}U0CEsnLCQ}`dcbN!rASvKoCMs|>x_oyD4@6f4-dz$xmLN>;D#;_W)#hC#3@YDnysM-h8H4NHBwI3=gWg4QrAr_x?;?q?sR^TZkJM`QX7Jr3R~D35@U9%BR-%r)E60aW2;jR$Aosf5dDqCH9}WV&YlKP#J$~;NX&k~R?%g6|en3F;Zjlao#17vj60FOeS?>}tQ-o5dcZncqBxS(6LqwVJNPBk(4?9Azyeq_QNewCQ3bEigM#j5A_7ETt_b!kH6)wQN3k1P{BS+o^V&;WezS|>HB)z+LdnC4MG3ebMjTTI>e7A=VwK<6I@{r(T$$)oxAUM*X&%19Oe34=B?hZ<-28DW82QX4n7T?v;r3(NI@9Geu)+F!U9I6KYEZ@z6iPMrB@8VdSqyl}{#-0#>6yB}jr0j)|cWIoxXcY3U8zUocaNc!G(P+qscijZ!QHXn2Mp+v=L*9*nfyECi@5Z3;xHjrt7`vd%i+5iH;X=pY-4`2FmBo731)#hgo8EOHqEHKjciU|265I7I8{`KPy~|dCz$_~7uB}mHl6ZHmjtYm!ch}f-w1IiIg$@}P61}UUmzgyU@1{WX=*pXSPy8^H;l#UYZ-SCEzN=>74y1y2P2|#I1;@K4NX2+^_pXUXni{Ej*TmnHAa33@(dWU;#k(bFA<9GfZV3&#65PE@qU>_SrFTaV!t{vi-4S~%8tL90;iJl7s&_}EIP(d`yCQNu+ECvWG3pVapLazZPTG<1u86`{DKNY%LdYe+w|7OXm}?dHu86Wd0GPZR0u7_TJnx1G&;ioE3nEyo7OdU{k@$#>ns-4Ik_jmCE(kZF*nqwJA=Fu4<hvg@;mOIp`(X&=l05IGwE=L3_-<O5Hza_)o7PqW#Hx4GBv8(}@vetjMGEb`>tPcfjJ9_@R2gJKdba~D3JS#D?Ldl&9F})GOaYX_#k(EKv><BmE*hmOZF%paK{DWL>|Hb)mS%x^7Y&4+u?_E{p>$eOyvsqzBOeRi-7sg-$nS1Q0zqxbyBdD=LSyS)4T_>1{&-izpwt1LcQwSh04USD8Gfj_Qs><aH4Lz6csIiXKR%V-#c(U^0giVu07@El<K44gS1b&A_iPW29lLkWs%V0w>fH;3_FnXO_W~He2Up&`@C8+*t9LJKA(ds%yBD^Ui2L;Jg&DBMLcDvyg)13V-nGz}$CIdcEnJ{`!025wSFsWpdbe!t01giCR)Djn)8)Gr*l<Y@_AZ54V;01{OJU1^AQIlC5O=2%@!bhh?BYtjD`5(lHZR_lphCbIF7HNgq6<yryAJ?)Z1~*=dvgT&dDlUzBw7Z&>%dX~M2g;RAgMw`;kymqDC9A|%OIBp6D8hdP{}Z|%DW6Gc`{?--37h!+y>uW5C}&dsdpE+ICCh@yJWZQ(j4!SDf;1n=3O#09035lJ67h053Y9;WGbRZ_HKelBx1aJH-Q)_sII(=Kv5!Bd+#FHA^C#vT?A!r+yHv_fEx*OckhZ_LIdRYu2`K)1!&$iz(+z(j&}{H@w9}>y9Geqx`6530+G0S?0UC=U5`pM?-FoDf&iI!31E^N0r+lM<Q*a@?}mw3Fj?l^0C!{VD836|(Ih7|-mQcrEx`0{Wg<so-%SUBEK+zkodL&6!MiCNmn<LNO-&?7^y%I6lEH>Q@0yMU0-$-<OdKTB_^#PzaDv#oW}TG>`>q++AyMDE=BdU;?A?>F^6=u_&6<cI^X?SNTtf9;0<-181E}{BSf{_cz4sCrBwK9=y_dk8tdSA+UjB0A70AeY`HK%p3&Z#F*9|hI#NNwaE+EyxdM|w$N(AWdz4V2qaRjgTvX>+hQxo1xUU?fTDZZDx)~to~dM|hR$ol~5z1+2829+)Er7lZSjJ$X+b%}X+Yw%v?vhdf*&U<;QYz`%RFK;bqG{?ewd24~8dFQ>fB?k$oE$^kREkNK1-^*HIAjKVcFKam|LnqIBY004uB%}9o)*Bmag70N49*dm(URJh&<u>WPteneYmUu5;!Kg#Z!h89OO#ueC_wp5)j5#syr7H`2e@xy>$}lV#6uy_Np6CET;=No&suYA2@1-h3wG`xdFHN1PRe^jjODS^W=+S#gYB1IVviC9+t|xZp-b+bCD3<WvOG!WhA>7_e$+b;vuii^ZloSy&@8u^ags*(Om!4!55<um>^h76N7N7SLvO(D%#P^buWT6GWmz=~10O9vuZX!|y0f_gqF>V3(y=)wEq!P<}xwy(ur5o?%;+Z8c%zIg>$s-<j?<J)cI$mUYFB4ll0p{wxOsr7IN%6g$L|{)D9q*+i#Tjq*y^OSq?Fip{87Wj;7RC1x5~8`iGw&s&Do*71crP6#kd(LMy=;_**C4U?auKIOV_3YGismxi$$2jcF(A<*_+BQm5NXAg_i_-^g}^WG<)9-DtvbAyf-U}FIlh;M$~Z9b;Jpm&TLs3_dkI)X41p!@C18M5DU0_qkRO=~viH&tt{g*%yqA3b03^~nVq}24X$wr>yWX^Qqg9}XH)~Zl!Xa;3s>u-r&YQFNx}42=bCw+CoiuOCYBlK$<eRe4MCdf=%~*$aj<DXW48`VC+?$n&e<GQAv$D|<{@$!)Qtd##Sy=+Gmc0qf&<#{*Z^D{F#>35<u*zImg7D_6JB9-Q-+U!!!4gPsz8bU01=gFcaHXP9_NJ>8K={(U+3HI$M3ry0vLbe%&YP5rIBKFdDVv~BO1()*A`D)YH(6y`6otr}tm0hwg6GXu!PMMw@#d;QKp`~VTop)c%Yipn(MUpt(3`6iq&P(3%~Xkq%%HrPipYq)$v0Dt5JX|uo2VT3>;my7Dn=5Dz}`f~0Lff|Hzz08g!H{RIminrD{r3SV_0F(o2LXIC_D0|DMF3Ppm@{Nm>!j9Z<-3Q35$+5OHD~{IC+!QraOlUy-CW#oL_9-9Hkg!)7_h+CPji6@#d&MA9{FrQ`8^BSAX6NMJW^kTyILo5yU{jo04Jhm|*oLC|(4h=z0^Bm_>8H-UNkW5kmOpCr2TI?0EAN6*>}Nz3Hiv8$STvj7-GC3EG>Hh@j9?^=9NA69p3AgcPeqM#r0+9zh_<dy^9vRE#>j`KXA87)EbCzCo%X`Q~GW7)}_y>BweMV5B!4>mEI|z3JFv1)xN4YGR}S%9b}Z5z6Rb;7v_Vc3^?^rY5uwm%=w2$FP|=@Mhx`MqSk2Y%B{yY3NNxQg|91yqSrXnZFWmW=a&h_2SJ;gEpYqdo$At1B~aJm<l~Wj(Ky@uZI*UZ!UUSbE?priyCHhID7LFg9igF-&CBeg@ehPiXK$B34GJiql|U*rlm`PhBUrusZpRxCvRFZB+x?0o0b3{Um1DR(i{aSHoaL1k(m>(-mKI|($9)FE0G`rLdKhw(!^^0d9zZ7J}WWatOQ|0i?cT=`QpPT>rG0Y2ub35lM)t7G4kG|B&NhHeKV0SR+k=cBFZY1_T)`OCQ@3oy@@#E&Mi}KA};E|sW&IV$`FXwo0IZH=<?^y!%PMYpn3BU1zDN5HzhIh5CPYlk^rn}bm`4VOy*8pZ$d&<h0Va5kOpP+@bM-ja}lEsZ$2W01~K*KBT1Vo8NK<45ON9On~%5{O3S?YsE3O|kKTOLLd^idHyyc9fac7bjz$nMD}0mDnKOQx-ee@@(3s<!i>eMo9B&%ViIM9!4bPx$tv3r@5nzmav+(fJPM0?eO9U{5zFAntM~dE?gljAentPKF!3IMp-b7?)kWTGQL}c9RD0veR-2+lP-b56(=ncx7gHe15%Jk;olO|y+-W>eVYl@#Y4@F9>k?74sgd_F<c=OQUBukOrG=!KY#;i9D0qQVI%bSMu=u$&(8WO>Z*W#Oo%pHM(Zw5M1v!KPBg+BTDH1;N-sl_{5Zvt)!G?(E`Kp=q#^?H+#qE{Drb5J3qBtdTu!jPqjnK%Ck8G_^D%|AS@Lcw_R&p{sql5hS6z_O<HW*}QZ(jeaq^hu2pC~pShqbtMrW}q-@k9^()^eGggl{Wz~YEl>ZCZIpS&LDXc5D_|vhHw5!F-wApH~&P4RI&Kx9|VSq=z7ynqn->oZ~6he;N``ee)x#skm*f6Pz0s;dXvu%yGKE9?osus4#Jyz7A*^DdUH>p3=D|g++$=7+}WFY3QM(Fc~j5aFEvDO>Uq;JYSWu~ItYn_@n)VrDH2I}GtZYk5|iG{Q+<&k@FpI=w?<9g#N&W(MckWq*o??kc+<`)BS(QZ>y()#i_x2P<Xqvf@n#(laXpN@**D3`AvACH3BuLp?@c<jdXa+lCY?<kVn}*(4yXXI9K1OPhUD6B%4yUAz|5O+`Z6)HcvFs)NvFu(ltaV}3mtFD$zUNwr8nhNK{1DK@-6<_yYePqnl?F!-i*Ts2|D>^91d}bth@=w&e0zUZ^D`K*umACdzPX?VR~~9j1@np-h2a#$`J)`zTvQC#pIiAK0T0g;!QV}@NzwR(~XcKV*K80vq{aX#5dVo3M|y)O*VwSCRBQpO&mvY2H#x63$0P)%{5XagRyy2O{>Q{1aGRzTVlxOO*KLIG#c`zo}M6;!Z-CUP?&`Erk(^rwZ}Knh{z$v@69t89`WwHX(ktdHF|HFc~k;!)SG59n2n0_W*JO#ffU{>gJe>kM{km`^h;!WlguJMRCV6WLsUmrk2mwmT$&>DW*!hnD{j4+_hFRYt2f6K^5YcjO}soeP{`iI6Vm6>%$s;A5glT0-u=4MhSr;R0&eyBdQ;3SHgh=M6jR}Xl*l*3*b1y*<IOO9B)kp28752`0A$__gJsXHL2rg}U?+-}H^JEPL$c{jFm;b~j@|_0La~XiH^HQdTuFKJiz`fci*J6x(`HhFH|=^IX@T~povTi<GQDXR=ZmcwZ+aoHXU)-@T@KkCMS8P~i8r!Zyjj;MXiU|cbpUt-3h^cvK{j-#c$146IxH5w$>q#L1-+@IRfky!-qf<T#7Ckxvm~a71AH^fixNW^yon`4n=2e|()lUlBKRhq8K}DjZ_-JSq`}UcR=_w4=<=qO9G~W>d2>!tt3rHl&J8g{X5h^^5Mge0-lU>P0-0KGQbE&!$HkjeGNg!%yg9{D%>WB;PB{d)rSQ!uQwU3?y*Xux7b|hzoI>Hyr&(`CiPGxTZ${COxFW!tP+C#K5#voLYgigdy$NN7V=57EJ~@LWmg7w)ZqNpnZ#qe`;L^V7BrQoV9B(!mgl6x>n@#={=@#E?Qs9S(0B<sR6efm^H<{#F;&XeGiH{Ug(B5Q%V@U<LH<^T$*+u#05+!A0aJ;Exma4@TZz@5A>B65kmEZ^z(CAGiAsFns^kx!9zw!inGl`yDXNfnHB(T5-&znfXsuaF@6N$+ugzwEGbz~I6ym{n`Co`4al;h>8MyfaERs}AS^`;ytKt&4QltUB*Z1T;xJVAthy%{Gb$1us8aYD+v9KIQ+!V~K1O(Us<lrntNh?{{encg(=;ZhP7Zx#V`s1)6sME;x<@$e=Q1A)M3yg8)q<b>)?A+#77IP+$ZNxcAsc{7MzqM!qB262L96yTddHW1RGdlN_-E<zx00!fPkX3m>G95aC8^QMnkeSd4-^pOUWiWP6d=`nR?%A0U}YB)%Gvq#;S6S_Bhlt2|s)tfvlT#B50lSickq~*=GIl5@Iz4`Wrsf6U4Z)t#Z5Z>HT2_?g;H+KX=+cWp(jsjEqvb?DS&ME^G-qax@78{i}b+{Px^XJVRGe#u&^kxn;%Q*E-9FcI&pl{;X)TcQ3CXPX9&KPgv=u^i-;hQ!DTcy!?vqqhpKSOWUhyyf8%bPXG@;*JjSwoD@-HA78w3u8)_~r~%btfLZIYSMBEhXM`+hq&V+M8~De^_9=>GlG`+vA%u1lN8&c{9c#I;-VP7=|QdyuAs-OQ^#TZ@x(ERJrBN7a>mNvh=14T#Uv9c+*8Kxe;}5y71dEMbMiru+W+`-)z(Lr3!{O+a$%Z_4j655g3Yd-elwSN>ija*(5!Rlju!0JzV7U-ehwSXheiJ*MP}T9D8%^Mc5MqZ>}Xsvp3<*7Lm0kiM`nZuL`2yn=O7kqABzyi&}(2oW02+il+dV-dq8piiX8ERVdJ53&xu%ZaH3o@Ma221^g^{GX)=3DR{h@LJUe=-<v4fu(5RHO%xXJ6mj$B2^B2TFnUvMG7199H`Rt<`Lp6p6MlCJ-n=<t6OK&<-VD*H)2qZcK@=j3fa}c<ff{)cc=N-aumX>7rn$P3NBL%25k*}J-b}-R3(ek}9@_A@z~xO3Z>$~>zUjfOPX`EZdN`$!Sny_tAt_W*d9%ZZ31Y(DL}N6f!lO6QUXW?C<V`e_lpd%zIj}*2i0sV`aYT5<cyj{>z(@|>)KI2ZuoiD>s52F@dQ*d#pB*%BX3)V46RtNgB&HX{-o%g!cG~sk*`WqRNZ!0KDM}9U%?k{21)KAxg+h`Hpm@{547kL=H!ZlC7zE}`3ljigAbZp7Rw5S&Z<^g0g_i5hGFg>o;drym(FK#mn`LjRdZ>7_>_Df!C2v;H#6wo$n-rd$sH6C%gj5eK&)$^a!jclhn-LNn>Co^d1PgMkNWA&LQidfg-h2Q9!lQ^c9qa<oWX78g=p3K}_GW{{JTgIVHVBfcLWwsSP|kpqd~<;UOc`9fxj=!7wi9nE00dTt&6{JY3Q(4KbF9ydOI_X^D}Wc}#hVF;z!~!8O$3&aW`Q>m2w@au`6dDw0?;3CB5<ML$Cx+8UR6+3d{c}KD-dmOid`UdB=V+#R(yDXZx*OY8U%Th0F6#!i*JTS8tif9&9Enr>=3;fwxUOv7;lE9Fhjk(IbhTv3+bBz$WQ_*^rnCgHgq_8Q$U!8Bc|R25Ny&9^i2SJR&KF*vq}<jBl6Aa=ayRGn{@{-3N+rV83;4wy_t?UWHIJVR1im+#5Ykifn|Sho&wD1jd;^Ml|_c*n`S9R3TNIl<y86O^`<$cLY+Ksnr^&8gnH8)$eB8CF6)&P0dI~<PYqsgKBxd4rZ>ORqmbI0Ct*=T@Xc4i&}HP`z*J}g|CM0Hk=B1X2|%Ma|K%Sv6E6LiTX>z4@CQ=^;n$Tvn1K@ofc?PaPBnn^10!%GP}2_#Kn+)+{$HPJsmcFWnlor;|F68Wtjhmu$1gAF|I39cGuH15!();qe=o|(wZgxb61oat{$3Io{962Znb}~<$iHg~4F&pjN!Hn+^y~6t#E_9c*DA%m^y6yP*g?X7Yf_sOKL4#j4+4bxZ{3mfBlq7r!=}i=e~XL@EL6X(HzgR^{I-zX5aj5$#fIa{*>6itOQIjYtx7}zqraA)o3zqTD^gB!$4`qfivt}$ExuJO4*ayV1RKNm(-I;{Mvb4AiyDb0e_E-iMRb14S`S9W`YkJcj57Nzp@{7X{<Bo*uqF1(`ZS0K=a;pi%3pq25#&Bd`C|!I3L*K&67;Cko<CL_D<SOsv5u@V!{v`9;*L<mU#X_bFF}7Lm{^Py{gqC_oM8N61sn6l@rRWMqm7&&mXotF1AbT{4pRSDx74=C`ClpS1%~)v717lo!2hZR+>X8f)dRxDProZkTN!^>e{_7R^Sjb<r53Q?RjQ^6kiS*mU;?+lRTjNLd4DT90b?fol&FZ<DfubwWI|-=r(9y8(bG?9WRlOEpK?K&%U3_87?)mlepYOuHih_EtvxdQUzJNoCK~^$#Sy^5{Hqv!2~_c~lEdQW?q8+C%O5)bst$_CfcRI9C1E7tUo~Kb3&LNODhrbQ{HhiQLml~5Q4*k~@mH1Q2_UUsRT$xxyFXRnk3=^9NjG$oeE!M2C1ue3lW`zasr{2RQYiWJp8{403FCk21f+n=|5P>biO+B92d+fQ-;@qNnd1DVN)e(`>o2vb3<kr$lo`4dmHtvsXqBaZsWuydr2M7YP*A$`mntw}4bxvrK$=CE{!%HP2PHo#FMo8=`AH>7go4pe%0hueXa6W!aGY%YqX6Hc%=kxXfdobNkD~Kq1mhnyg^HQ>k1{hOLg^RfMa=o<7v+OeueLu_CPY|!{!mHG0+IZoTp-ER=$G^qjFy03vd|+$oPJ3{LNWmQCH>CqVDw8$xa24Amm~np7N8$gVjwUKeo%rGTo(F4aaqx#%nwRLgiR=ZP!ujf67qu*3&Y6e|3pc`(a!(r4~9ZS{!e=(RJiqjYO^13{hzvUT7&n0Lc_8L!v9GDqjbXm2>};LYrm&o2T~FFJ)xPB<=+#N6Dl11og#TUtnzm<wBZKu@6;qklrVoMA)eYG{heqeSQP8;gdx=)nZHw+DZvqcWTY=piT+4IS3J1+BV}M2Gx0+*YTF~^ht!}1Po^Id?evTA=XB<cLYaRPBLh!j|0cY}I}`p*Lm=ab{F{1I5<=jA#B!pAng20L8(VOG$569U*!mse?5@AxafgXZRDMl}z3TY-H94V!g#0yC2(-5LYa(Ddfy3W;nTE@izp>GSueiUF#1TL<{zd_8h2(xlRkSKK{fw7t^g{77f{{@~$)72V1U^~*Oj({tu=Qhd!a+=y9}|(oKs^5<pbQoW|HVHWP`vmT`R+i%{g-x8>S^;|%5>xmt^d;Ej0K<mONEq}qWqWsXqr;%zZ3#P6a@bz4U_;4`W1f(a0201lr!p1!mk)d(_-JRxJ2-h)UTMK=0N)`Rq7xS>93T_ELHVaI+cgbrN5GgEQ)?VrCKE}nf;Xf*hqr*Q%VA+a{4L3K~hohQ%aGPjs1y}ENpoC6E6u0Q}icZnS$8sN95%S5t|<oP5>|{enb)u=otAC0kl1$^G~{U%dyfwY0Qf^ZvP}NgD157hiF&<3-KQkF%&25KTNUZgNFZ5tTGCdU($9dkl~l)$_T1hza%#gHMsndHbt&c{3C@BAg90&2~wd#Yd@qmg(%*BNP1>8TK$mPtU&VpkVL#$fa{0kK?I|gA5sHDUUEMq1$Wl?_#frL5$585WG1jpng3A(3<Es;kH{>4iTWM2lH)MwcQi+@hu!b!Zb{{z-%$`3GUWV@fS}Q_;djJfjjdRJqgswY&cD$QRbk-%MlN1ON%1o}q)7s#pHU14!}=E$(&gjqUnGNY7qEX32^ce0{fi0|PNMP~LS`xC<TpeF34oE`u#P8G!EflcDiDj`Fiq2g$ghadmkVXTA~0R#0Q`!)P&mNlC-jBjF40fuDbU8QpU}|-EOCB98i5k4{E1kh>LTG!<X3?b)}P2os7X!!L~UiU(*8sg5~*7I5xsIy82KYg)#hXFN0cd8q>~>JqzMcz{fP8n;Kk=3<YYpZn1ArhS3UI~dOY>x#(#*6hzo`Pp(%4zi1`I~CFZE{3yx~TDCZZ<<e}BxFNmd)6DGf46HJxHenB`dFdF@aRtXBE<2N*_&Ivldp+&mPe*A`NB-%UwKtveoNcjWh9KZzTFZ4KOP2yijFb|1`zmNz$bd3H&0C0s-`vGeyhD!VaYaO{z_XAoY91QjY{z3e)<_F{>K?mpu98l$hub)sXCx$lsgzot2GW>*i{P+dvCuCM!wf;fA=+Nx_g9MqxDEtTQ<totk56bI;1=2rg%c~=Q{~sYc31j}hv<;4dzo0ci4NLw&eI&Io@dMh`_&D|hij^j$#}BCSfL*R1P@!6R{C+@eeB7P*0pXRX@#P0J2a8sSACQm=we<c!m2j!#{C`Rnkmcw9lc|ecjQ>yFm;(U+9~qL`di{S?FoHw*|4~CCgw^lI76Kt4em{jgM8N%iSmdfB{QGDEb!g)6qiE1bmA{W#l1GPsp9vKpcl>-L2w5xf?_u--F2lb^j+;$X{ykr!kSX!&*}F=>U(cioF)6>EP?e7){Ce^XnF{smnGt|PgFnx$1vzN^d0zd2)cEJQlH`w;KMxHHNz(p2Bw$Q|`|+5{(h2g%v&dIsnIF#!wMXZFN0(wGk^fGhn_htbP8(9a{_m(+abeYe=ftEh68{|pF9iMlcfx?|IPlvEl_`>%-;QDe0keKPe-<S>{dULz@M7Y(qoq@?x!+C-2aaR@I$Z9Eiv0Z;cbrM{`!T_E!pQG8LoW=3-){<Sdi;I2pj^1}_sLR}()jx*HGXLO`~G<P8~ppmXsN>L?>pjQjq&g60650(?@Is!NaIiE)dF1`ema4IX0d)cbs#sKKOHq#5TyKcMAQ+P^wXhG08Y|BXA!1dbpAOhm?~z!9Ld5XR(?4Rj0En_2P>9dnV;|Q(5)pupBOBT5dCpHQOdIM$7vLtv-Zc4v-K+1ALj>y1Al)U8Ur{@_~C5wRK>;*M^M=zi62hep9KYeI1aWHLizU;U!W@U@5O+C$i@Gr!mVDg{x@PH&Jg<Du(|-M@psdQi~?D|8!HvAH2!Xc+)CBzcQXK20L8z};tmIx{x%%8tT6JkQM~hI@@Es|)+J0o8yv9AfcV*{KsOEkYhD3yobj&-+fjzauV$BkHoRX=B*Z)>zZyZNCs)53Gm!d7`qe~X72)t#<3ZKkr(aEkCTr(UvrAA8vp-EC1AB#k8bE@JEdDe~XgIR;ry;Av5#&cxS%uEckA}*l0mC0n+>5_U{~1YkMnU?`SgQ3P{mmGPS_I}dGl+;!)^Fx7ff+h~nLklr*8FACKnl?Jlkv4>k%phlC_bii{AAJ&u@?M!xL&Ba^5@Y?Fo?yUN2#omr9Ush5CV+<7+OOnP5fhK;bQahj|r6t1e<?MC&e5q{xOAl6xI00uvtMR>&J@)r%9t9@0F}CVn1Fbu@G}Vo*^7nl>B%yAT5Xdcm)=NmH6-eD#7~o-%;T43d?`DpfO3MUyPeLCfP5>jgUn^znD4#Z3O&ca&%cU=oe#NNNoGVM3xFO`@^6?@+#IJhK#H@h5j%|o;dLHhlwkYY3vVUL`|*A55@wPOB+9!3P$`K{$Es0`it{_Y19M>;Q!?cnOS6hyGo0YCV#s^I8=bYogh_sMt-|988;IBb_d=j1%EGDzJ%fMdpTj~ik-iUE;EM4{w{Z5O7Q)4k7h8I{B?{@n$Y>{dbIFi`E$WT<U{4pW$lR~y`PJP!6P(&E@Of;t@^k4(WT|mzeUWJKb`(96k4rn{I>u=%W>-0Lg<YK3BMKxf}-^LvCQ!j3eb<mZql5mABzoJPhk9Xzwjcw_~|xTf}s29BoT^Y=%)kBlZDn##{_N0nxAe+7Pqng%3q!}VE>gLbAV9!uXx~4DAa!i%|;dw{}nMHZ@hjhd0bI(^;=nUDocdl3JXLKD*RR;2q3cfSHWbVg5_T&(NhWtf0YnyJ`Vj=ETA}C@y}i2k=XRl!BQ20%0CAwCyC@g_m@jU<v$1ENE{pg8~`eT)_y9Q5YX}ZsW2|FG5Av{WTW8APlX4ds_Lh50zymtrzk3#rRAT}sFoU+e+rK{o(%m{a!?Tz`=xkFvZ(Ku;%7rpnP1A9fVUxk6h$kU68|WH?xex{qc{+h%FZ9<fUQyqekimgoN4=^@F~J3&<}-<3@@#IC|$g`k^NAh>?l*~htgz5UEc4cQ;9KMekWt%JoNaT$hhG_(%+;Akw?kD2^tb4zJ4Zpq5v}UGa1`)mg!$&=Mux=zXUJxl7N4SggS)LuVk{Yi=JPJqgiT#zmh&Ibt--(Q{>!|`;`RAqF47P!IXzj$e-j3sWZc$<jWOCKK>+KaEKZDlN|XI3)Y{6hXg;nKZ)C$8K@sgEL(=C{76JuqBZ14f{BYPUO$pPvkuVtkE|lA0_;CRK}=B9e?)>K%S^vqpi_mGU+&K&n@GRh11o$e{c(PT!YKOV*f0R~;Ez)R05HaHgsu()l;4PrA$yX4ku4qC$oY$a_|SyTA2~i<J7nr|_32t3D`wuOEh6dq0)5&-MH>aiPg|JDi8AKX7G;iJ0Qr=~AtQ*jK4sydPtESr6^aJn6hB=dK?ou{pQ_N}7wN^PD(2E4wfIzp7?c;0K20%dQefYwDKg{<@bu{kL{f|(`1HhyN)>Q@szwUNov2Ssq=B?z!>1*1?3$wXX$b*p9BF(?f>)r?J{@t(McaT+N4RqG#m1*2=FI3RembH^DGF+zicrj9*X2_YZWGq*eHy|@gd71r1rcZm2jkNZxfGoO@acz7XntsX`k~UJD;qxjP@_kmolifc5X|y?nx+X<sVJX%!0?65#-|<TIK9g8X$KRDI>tUl6G7$?#HSnz5k&s^bOT<bqe`D{u)$`+%BLCr@RU09=~*r^awI=J8+8E=icilLfoXN+(=$4aQM7z|W@1UL@#$HG0&Ng{dS-wHBjKkOxSVZ4@~Ih>4udm3H9J5l=i$>bR8Yux__QogjX;4<%kor3LHo4AA~Lodd`jWQpb(UwQb@qZ$J?h9U@%^(^67*OWQZ(%Ist%U+vTSc_Ea1&pGJs-2|}t*Ay{(jV)p3+J+s{Q(+6W}MCtYEg9DE_jC|@~i5)VGpE^i^;84J)4J<X9s{FJ;TbEL|K5dZRwL<VI14=&j%ugBEq54JQQ!+*|Vj@2!Q)H!0hEK`%PQoUij@dCXQu}l)4n`f6Psd_FphM`>1gZQuX!<lkl^9|0e3~FeiMLCiB2Zu`Rr~ZnCAdkHpNbtKs=)TC0Uw9Vp!n1Pfx}9<J}p4X)fmN32_SH^W6h^wjx5zRek!1@1QS)C3dmB5kf=}VA{|%sd|Jh1)FpnJGI)%^<Wux+#*rJJqA`BG8T=Ft+Yv(Y({s<2L4co{fVw<derhIR@uAbByCv^%)T8TS$sdqMH$aIjw;sK;kOCO;=p_LJBVs)o?8n=t503(K6oUcNqrb?|&~W+auMd<8?LF#C&Flc>qrS!n^|*P|*QsgKl}C4>X<*30qq=<f3B~wmu2_~%Tt1qsPb*rv9>vvoD}&jixY!8zu=gk~FKY~HJZcL;l|Q>jYoV~wMarYK*0Z-BwWJk^3#LacLx5TI<<VJVv&;gI%DPi=(mh)F3(juv(aK9FawU4S@=Op$hL2WOxw8lH(N}PazT`amDgzm>KaaXv(&QH3qpm_g(X;fZs}FF6Mm$QHh{(c~M_CzIbfN6gRg}~~X?k=OnKOpjqpI-4Fm?H8s$WP<@jaSKQA96ak4`rFRK)Dj$qJ@Ug-1_8Hs}K2(NkH5V370ZsWnCrhL4u&wW|%RM@#Jjl`HYlQg6_`IFFL5)6>&?bkr73LL59Q$`qwAS&xSD+tcFBqmp@h!FD_<i6z*T9*;^6F@vhtqmpN4zN~oklLAN|PCV)fj3HD79__?u(isJhM&4P#=H$^xA6e#Pcogza8ak#P-GnEF$>h<;KO<h~depI306a?`b!?Czhn+_?DVj2&%cGjW*p)~h)wBX{R***<8^mQo^C;s8#~Xtl&D3fzklCY|IG{R|@F*r;bT>dfib)h=A&W;b9ijnu_UNLYh&fY_E(YObY3k9%8fcz0c~sGqX*cRoMFdoI)jetnQ5vfOk6L1Z>Imhdl_0fR(CX2|L!?xkcogwfp*NWxMdSesi;G7QtC1^F9-ZVx%ZcF8Ls5==D0%cSk<g6Dqlbq&9GH0Y@J0v(vK~D&o8#*4QAtzQOc8uEQXE{2k{*pj0&pKa8VSP_J#UXfGIA);l}8^Xm@*{IqmEk1X>#_cBSywF7mqrs;el7*qmD$(BGBN`MypgTnvXJSGb%`_M-2xdgkbTgq9s%Y#~xKg_9$=7qlHCA4KVa*p@OtWghvVC#4!`;(L}cJ6malpA~j7;36CZMz_;e$QACV5^i6maQJWgU5<QA2g<$#N(Lp;69|%1<h+*wb-J^$Ekx{_(s3BYhZlI3_S}D^B&7+0dF!E6JDB!I%TZNATUYR5d)1!cHn&Lb>N(k4bp#qN*$|2_}%cFx1FLyn9G*FAlQ`4h?4!pUcJqjq)7Dg@}1r)jFM(0sLA1ttV_2{2ZFz6~D{R4)Oh%}G-Ni+q@he!Pg(qP5IqkaI`!SVAbpI>!?ym*uk1~OCbQ9YJ`@j`o4&xJBWCXeRn+d_6enx{r&qBoD`Ne@smAH{Q|+S&E!9Ys#&ay@#7g5)X1NAECj!DY*%cKmpO;ptI3cLX5AJX*)mn2lPG)`{Uj&zVQ-lqqUO=~2HnS$AuX_VK|}0n4Lw&LX3bJvzsaOpGg!%27m;%EF^^^hT7D^{5;tTL|_j-y$S`A|8cvW}=qeqkEL5@LoN-m*-AZjz{-U6B5d!Z|smULG$Pv44=~Q9(4oRXW_u3Zp6UV3Xir?qacpJqih-tB4y`MHi05B!1L%D5>041dUQ>I6he_l)quisYSN==A|0xgdNj=!EF&5`suydp1lpr|s7TTA@+g{KSi-~}MRUMR+o4C#&|rWA?$I+U7OupjW#~w<P~p+MH?t~jkLHz_C56nRV~QLq%=GBp<KJS1NACbcid5=RF~ORsjXf&nZHgnjN5eFFVE6VYn8QM~?@=&^ZlWA{6ik9wF~U4*w<d2+kVoyZC<sg+^<w42oVQ22OoCvf@@N-GQUHKFTK8xK9^IpLhuRkR9<6&p>51B-T=t}WNFU{5Cygjtk8)8nBY}iRxoGH8z{I0lAkBC|`KXps!N@p1ss%Ai8r`E>%AR~m@u-#nwJb?Knx%;-H3g4m`4Guw>d`Ew023@8#gZ15#`q`}2bU<s9;I7ER4LV?bZ$yoKt6iKQd)~Ck6sD10m|W{R>r`}aOhDh3Op$|@u(FAb4Fr4I)`^BZr7t!Fj*mC<xwhRde!>!C>1Oh1|WEpiV!R>W;{AYMu$VZ9-RW=lCttqDW?Fj*myJwm&ZOYk3wl;g-NPMpXA~d!^ERc7@<A3c=U;m6A;&<PbTmw`g_y~B0WoKk2Z-D#1DZ-mjuE{DLlGFE=4RPk1FXS3&xH|mE_SP>dm7`I<Xn5cofMcMql_miiAdGl=dhR4H+N-c@)WkI%X^$Jrby>=lJLmF-~pF9+k6|0M4jK<yOVA!RJvqIdntnJZj_?hgP5-H4+#p72cyp-mqAl^r#UOl=O&s)CdAJmXaPVvg=Es6OR@NBdAu}qeZ5~coXB%B0WN-=<+C$QjBv(Jxb&foJOJ^9fGSu2Vaj4AtXxy9~}Y&z+8Ywho~^rH1=o^6SW@1c@&7_q1l2*f55e<1>?~lHO8V8dGrTbA40cB;T*XsaeK4}uqJl&JleyB86Cbyc~nY5IeV0cm{OyDJo>h!fd)N~zS*$wV8Ek0Ad4*Mdvpg4v@{VO-BDqds3MQ*D4-z?f=6=<D#=yr(HsF@g{3`;gBGPLK#$%ChDsN&M{jhh)N3ETVFitl&!aaW@ah8hsExV`W6Gm868H)`d$filC6*FBTH~%xCO?nTa1&$;lt*d&@XG__Q5s}&ygEEOV~yejO^?c;0S3;MM`JX`z=7k@7-j^S;CmECEiyy)JPHHH-=QmyzK{!XNAS_MHNCd{d6X@2jRRAUvZ<+qCE-yvAeJ@Kqic_DVOsL&njZ_0qaIzOk!8Y;N7rb$ARz0}wG4UW7ChSGg@IFQkFMASM-tSdD~d=dA>z>$H4riNc~pfYD{rbis)7-U36vgHfk%g-*`p~M1Mt%IXo@d#J_LI-1&uypDm{wAl1qd~kD~aJV~D9oPgn+GN$}{2DtmTC9z9Xyz$J)B)c|u*3G=9$5L|%29#w-;Um18*4Fh404Ud}0)Z)pXM@^KNbz#Y)CP-M)q36*ORSbE!dbC7pL6xRQNAx`+6!z!{A%iF_cyt6=BOZ7j6;aC7Z;yt6)oGI6qajYMp>XBV5Q2Jw2|gO)gd3<ikAfJKgn^PrK_pQH0?MNwnrzyXKKcOx<fB24rWMYmaC|f^j*Jvp9!>jj$|!u)gDYH)2t4Y+Z^j}&k9r6o8E5WMG|4c68y-dD%VG%NQ8W|^WE6T7twEXv#YZ`uc|29((G4U*<hu3f1`(6&_<3{#f<A0H9@P-Ih%nNl8n#@K3wu-ph9AJ%9?cNhE7Ff<Sh5JH)uR|%nLP?UiUG&0HGYqt4e_G@$)jf!S~;Qe=miFcYfwFUL5z(IACFpCG)#>iwJ=JAsZEbsh&1XDlSeI_k)2E)H5>J2&8<hxJPCn7<59CqRm=)JYF5P2j>)5Cx(3uh^k^9zA|h2Dt?)$#Ajn56JfQ=~_-KW-04!`hN&%7$AY&e-fJ2m#RF6_napDe?M=3y{#pBSU6aHd6n(^oaHA6fZdQ<|Vm_-pDl~4nej82bAfDoaK)uR!B#iHT%XoOjMJh(j?ffO7)wjPb}X-pZiM<Mu#^Rx6Qgc6kuR6YvffuK7fk3KMkMhNTC2W^rpsPX6nxjTfB9(^DJErE?kA2b*OA@NZMAu^G$d(^>&9S!;(ZE#4)6A6zt(2;6{rbijXlAF=%(FLO7Fz!9NpoJzz!$-+5q4KopQ3Y|{8q__iK<t+oSC1yZb*aICM-#L{+%}IUD1*xJcr-zjHmuM*nm`4UBqtt4Fo}(VMvoq_L`(@hdH|4?Q-mHp;3L(NSC1a3fntQ5N5y>jQ6%}OSdTk393Cxz2FK>eqXa&Q!Lj%#fjUoCD0-AYh(|wQ9t|5LMhD=dVRNcDZFw}zEzOl#kA|55g$eP|0XyoD_;^%+3>S|v9t|KWQ?MkD0#NXSkIAC|20)t0c(j)4>qGcx9YUf7f=8<WIeL^HO&8JLK0Jy#u8`p6QS`$k9)d?tL~~`zJbG>kVF%BnCLfJDmXDfjD$HE{c`1i4k)uB^V}xbt`}1;xUSivy!7jVZnet~aM{E{(`7_ubH$Rns2GdYR$%j9Isi_es>rY@h#H?cVComEtB<ubJCg5O|fBt%th|J2LzUJoOG5E8WARRqxfA%5~%F2K8LKKCOh(CD^a(p!8PhNHy8&Ual*P$6LEdSgUV+_@UKXpwx^Gnj7xylT-f%RuD4YLps`4d+!5S~c=iEEXUA0Gb11;|LDPJiA4L@46bpSM_?Z}!hyBqVqt`}5WaL0Sy`X$ux20zUq%HRnKv3xC!cV8jUFpS1d1@F?;pEj%G8$oy%UOUo!ie_FDs(xkzkv+NWL;reqHkr_GuIm-YRLtTH$%2g@Wgg<31y3|AB&se=K-1Yf0)*m`@X@6GEDI)Uc&q^1XB#ij8@&cbB7XGYEP2jljCoBdp)U5jRRV*Z<VEy^Z6$J+h{(SYK%`(=Xu1dv75&v|xLX6>rKV4zy;|cQ5R;JhtIQX;Go*f4i{-gwK-0}7&<qkd*iGQ-%)c9q>pR5K=RLDPBF>$nH&Y!C+vGvXUxhfD5TX=u2$}=$7>d#e525qH(syd=))ZCw`rgUKu_9rR}5O$3Eb5a)?%CSEu-Mo=v@aJR`T*3POoJ`^Xi-JE-4Vm*G)1RguH6RB0(-aiGGqFES{n(Ku)Ssq21d2KSNy?EBFj@X26=uR92!E1-;fk@(pQI4XVbkHyQDKzeVDsmw2WSeE{3)tI+}z@yp=?b$&!3@)Y-*C?Pf1R<`ab<Bi71qg|CCGtX$$3_k|>n71Al%(`>R9or>6^JAO!leQ>H>}V*J@@hbljGe|FM=DZ=8Poy<tHzWf;p39O9EpOKtCV6yUOB$-?kX8Z~17DE@VKOx&@MdtmvsjShPjz1q6bwZQn&qq5Cm2ZDO0`U<d!=H|X(u}b3r{kI;CZGP)#KcXCPk(Bn@CA?HpN*O-)x!MQ*tbIsgg+ZI?5I=zWZW>_-=CR$J$^{^XQo^x9IW^=(=1(gd4FblLnx}vpNqcgIK=(AXbDM9+@Fh%GngRxa}jZ^QQV)4jTVDZ`t#BgHfD?dyhNc_9NM3XprA0A^QR&qA{9-4Dz5$70qIZ0G!_mAe^%=A3Cq}@mEMTSROru276zFX{-iXC4w?^tQUc_{lcPT=;koRP_a`Md4L+#-N$IW(icNn~lHs<9$DfIAw1D0HiMS~(L-8k~BT)!${5c6Qirs)eCpqARci_*%Lk?0@`15cNA%|dp9=0$A=07EEa^nm3r=&KD@QnB~(k~ca4EzZRga}q)e?Ed_VvUzS9pQCgg5*y}UYM}T^JgPe5mJTy*@(~`xK@8MGUXUX%b$$mteJD@PeWaXs`~yk1aoOg@=wDMohU2)sc2Fn377s<^k(qPs6PwQK=`urCt)Z$25$Z&-1LM++@FMaO;pABldx{G2%SF@DUyj*<<CTneC1jBGm&8*M4<j0oM4Mc<e!HkNr{2#&qH$VhS>O1@K#}xy*~x>Tu?Fp6l_tr$H$+B)SR~>{29n$zy!lT3-N*bEBmt$p2{#Se-@gd0)wMJ0fX&TA@C>QhdwCYpM-qbxfS>)p%cM2vHdwH5ro)=KL_P0Ad~jzpe&98{r()3A(EyifBw<sZ~)`aKM+qaE&lmuwhM~gpMl_*Nz&oZKwf}=0`g}d17m_z{se@JRIoIE0)jxM%JI)Xq<pcJ_|wm+4WC&3=_kNgu3CTgX=Q0e%%6QgF`z5+XCFUmD$M-ZM=gb)hClbbsg9cd)N`g%C7eI?WC6lMz@K`g;9|q)&pbtbb&2$6o)#6leEKubhPFIlf8uGJ>x1|wo+=8kDERYEsuVmv{dtEm!~nKG?+7M2EcNG|8iOt^`tweNI++msd57!+CIWxjp+q2Y#h-Q#8x*?y(+(p9nj-yK=aNfYmOuR(B;dpKXCDk;W~M*;RM<$c=}$U{d{_qjNvDGvwYWd$oIRQ2@#h=}B_tL3bB+O7A|U_dE98TWi$D4H&^-Y2Cm$3+1~~rYgDV5z$e(;=Z@LEk2?tafOTwRUG*L+-|Adoi5yFN);k0RDdHxBf#*7vG6V8VpMXdY@hr!<-oj><>eK7Im&pkkU4lMooW&<V1$v@u^fR*XhpKkgnX|Uu^H(LNva{JTG`8X->&o+=@y4w8N21ph@XMeKE`!J^A&oy>V6hr;FW(bxal7FsAai`?*&orV~nL+Spnha%LSp1m=O>;-@PrX;3T%h<<4-<neWq<0?L9%D+PrV0d7??lNu*q{p@J}>)K_0yQc_xwAn<amqX~OuY=g%{4mVb->JTsyQBdtHpNbZ0j_@|jfNKAbGG~>3Ytnkk=1eV0%{Yj?ONrBOyWbS0xSo?EKtVY5ve~!rlLxG$>@wRk<g!}W35tvw0{=5U+wcysDcQD3sIQTP6t|O1E{2AsIfE+OX3}a^I1Mg2Tk6wPI{RyTBqQy3UemTWr5tcu{Y`_EH%b#|7EF1Iww9C_LK!rc;Nc?(4`_oGaCTgkv^wI#$9wvX*QBdph_9qt|E`YiH$;AYh1}*;Ff~V=P&!1W-O&;*{r<Ol2U?lyi1<ZoIO@C%VBM8Ux&nzBnxH0f2mMd&*k^OlEmf!|ne_FZq#nqlat%MRmgu|a!%)%rW{aNL3f`tKp&KVNy1LV)SK`;b3`g5-D@D!9k=V*i~!0XSs1D9@D`jZOYh7}q9q*9kDOvay6?(jZk`g01DL$bp^rR=FCR{kkvL>WQ={*00qXa$r%p^Op4VA7vYYQeRk^yiZ}DA?}&`6P*+BfkE0VtE9Pkw2Y)f<vd$pH8IcJqq<_lO??PsQlSPZF0zlKbO>E(ueQQC4O{NwEekc#2S=Ye<}gy<qgE2N*pox#P+8W3}b;~e=2eCX9UKdNd`1JbNz|rk%TW;e<E?)YqIOlBfS_D;qm7YOH-(fKab#rg6s0<kupS$l>U^%vEc^dpK|quAecYny8QS6=uaaHCMmG<XAxBu0OkEz1V*12k$(=kh2}Tu&mpJT7hQh}A!Any!Jk5q*tl`%Pa$xfT-^9G2rd8?Ed3c|5F!S;KZAh56JfxgL8iO~g7`CtgEc4u{{)h2*Q~ogfsmTCT=M6SPb+vd{^{dW0tc-A^f3jMCO3b=y?Pwm@+TapFdue*!abUcH1sE&91?z5{Rt<d28&sL_Bdp~a`Mj}Xi8E<fAXLaNrl9pJi-VKA^iD9ijI^Zf4+U%R!{zX^TY~?q(9%fWDykP&mCNH___IW2aRo%<WC)X3|86rQwIq^HSYe@F#^$pKY!}5;NXjfKXX)>Rmkhl8=@>NS@P!%LTPn){CPu9R09Hk+5p7`&(ohaF2PYw`qKs%I<_i**4X6)PNhF<lnwdu>CYK2C`Ud1Ib*B_l)pb`1TaL?@~7La6O=&x>Grp(%acFdD6lmF^QR0;L^WXkl%Yq!jx&GC7(>HH+n+M**zAq{8H3UjHhzD`__K$Msy}0F*oEowPZ*F)tx54Gj7FsZN&fi)kEkcU{(R9V)@JtS3%*1)Lw~*y0Rax*pDxt62^#QcTdfOUZv5F6iPjW3f3_vDp@zkuZ9<>`ko=SFl@u`#{$!g>pi9S}Y?bUDHT}tUD2In3f3iWbVT;tCYlNm8Gk>lH*u$9MPZn2nu+Z`6iY2-3-u$_Og5V=Af36U);;;UxVpk3lsQyGz`2orPiNa8vU{U@=5yG-cmOs_@@-C42Q%wzkLl1wd>DAe#<WIFCeIsc6Y2vN`m<WHC0M%qq%bz7Ug<5>@XNg300#*65gqZ-yygy4+09Gg0pCpU~3PSsHgdYoa*8Dl5&Vmk+e~S1LC6tFhMIcGs@t+~AxS5gaPY|PSumJJrhZ$>UApiW}7N=C+pJ|t2Vo3QjZBl?Q$3N3JS*o+-&osh6d#?UWvtv3~@u!C>kCqbt?7*f@o2NfJC@5e+%AXq+MJcfA&kbY#&;<Uefz&6zu|G9<+J!*RpBZ{#0;1v13|cDSq4^U-Wd;VZ{>0EYM}&hvG0@q%G59BjDtpd8{CQSMmx{`tXQlGU5&83s6Jmrvf1asn;$_#L7n+={*!8EG0kTB8Kg;eQ0_*c<nVl*v^!}`n=u$v{KPwFI;~4fQ1s|mn)&88YDwX5o&k2C2sm4Dim~sr|`BMVho2?^%N<h%Tr1K|)Sr<}0`4hqrwpP9Vgn&wjbL7tl!3aSr`tw1ZP&+>T>44WMQ7-;;phVON34c03ac1nrpAI5WFiHH`0M&=G{MkT|7Ca(<E+CXj!IM81xIrE||6EWYtq#SXWTpfix$`Gk8Xc+-{7HsGhzaRW1-2s9%KWK-MF+XNKgTv)Fl6{=f<hS#;ry9kFGmFQPXunZIO_B#0w-bi!Ji0H$O1g|CjtpHG==)}K$RnkZ2fs4#iUq>KMk<0sPxYQ58Ut(@h5?{M<s0h8Mb|CjX%Tq6wZS4XP6vKwPgGm#>Mc@kw3%aL=h?UXBZj=vHuK{FaTBZXBY!V051O=u<6gI9e)l;In9duQ$QCxKZX7bK%&8|OMe2Oq?8rt&q|0P55}LUEg(;9{E0H^iZk>ldP5K!fIm?Ik4_c%^BfV#$(TP+(};}$f0{?^j-<W0OxoDe^5!KfE*MC?c{$~8iKRC$ExamR^(L?nT>?kF`RfmY9;-Khv9ZJ^>P=sUcvuC#>FdvrKD6HK<qGf1+MB#6%>=>pCNDltmR`NNs|Sx8d*0kNVnQzmZ|X|riwL4Ob@ffoK=h_A5i}T}dNbD<9(`<Y=8^$P3y?Q+rAg7S;>}zqS(+$s;vz(bpzuvxSOB*WzKJWr7&-uN+7c7jRkie7k^H&}QIC*SUstv9uxnpep;-{A$JbR*c8r+wb=9_ZRQjswl;z&vS5=zcloWndb!g2G%de^k!EzwwtExRD7}WZzO3#Oi<*TYNc@~-Ys!ENMg+5<Zk$6KY@oTC^Tn?suO{M5&1FNs82x+l&<!dTDVSpj{n(8h99#&sdS>Z%L&(~CB6o^>(nhF6AJBhxcT1Pr0Ur||BItA=2Doajko3E%EwE+_M6_p@fsrKunE&@D4e4PY@O9kxf<Q}vuf4)wlVT5Dyb<#@M23lWFiSiK`_w`g2Uc4NAJ=KH_Ridw_glLlD>FcQ(7?$zX)Fq>q4PQ-Ft~w<2)zqmWZ4thj>Z^p*_|=q;LV9RlO{wTJWW-lf2Sy}1^tIF{#R!tVmf}QM$>VFOO;RW|eJw>v#j0RmOX*nvXYp&Pv`L0hzLE;{<ZQ=RQi`683HeHDFar|=UrA+P5CHBgDX~F!czq?6`eHNlbyOh}WRG7**(otez}Hb_3RnXCI?9QTQ@6g35<<j-g|DI<D=8#jMX5;zL)TYPcpYAZ`6`M@;f+UMMX9)O1lHG3m~vQp^EH$qOHg9IhQd+=J@Pda4-Se?zJ~hXOV8!kP!LW&S-wi{Qk(GUt0b-^ir&6TielV_;;W<{j2(erC6$CR0O_kF09b4GD=166!VX_S9cscM#8*&;Bt`sv1;qwS3$U-C%ogCe@D-HUr(knmKe=MXiNn`VR|a8v`}#>jio^n6J+ZPxh09k@kv4I{S5IQ}8Zr6msf&%WLSH-4`h;f9*G@hP?U4K0=|-O|X<s|ds5LZv?Sx@Rqrk77%BTc@@U;_ac^T?!<gPGifPIbB)MWvruaS`;|0H~k41{K8$k)iaOCrv%ky3U^vhp<&1EEM7Un2+Dc*6EIvbw6(=PTr7gIp56LLR!&B<m~WAddxpUm**<DLQ_I%mZf;<yXixgoEb3LZ0E{u<9#h5e6n?e1#MN3s#7)oCqWBLh+ST96fhbedPpa39Bz(Iq8+jrROWBJW_B7eB~5HtqiEIoJPR$aP^hbhdp;VeB}hdL=`t*H?2Yg!0hWLKskC8ecj|G(ya+!H@&?f8}oJ30$hDKzHTyORLJr5vD6z4QNBLPF|qO2#~pA+h57o3;(?+zUmp)d0wwnK@xa-EBwrmRX`pyt9k-mmMtpU2a>vt{uZ}rH6*BPE5eKPBc)mKeP~gV!tEN5>Y-7GQUJ4k);%j3rN<#{KZNxREr^VOCC%h=+eQiu|CW4NyjJ&WMYV?&c)|y0fUm53Asjt2=x~Y>Q>?@;OuR*x4j0OPtnSIS<XbUX4ubBjyh&1#yQ{9Oah`wgpkqgzRubFVH_09R3=>dZmS-xT_^&uf&F)b2<WbP{_9)A1lE2b5H80^<Y$SM}%d|hm`C=ub;ML(CYX!^PshbLJ0b&<uU5RASquE>CA*Vjvbn%q_SdZ|rgoDE+uRY?^C!&gO7cK}s>RXlXZmgcJ>7b$Tbzbg7r^Wd+FAkLiR_^Nn-4H3y##VKhp^VJeC#xRIqEm_ujtMk<o9y(TlUoE9sfT4Y@#EZ&fg|C%j2@oXrwUT345)NN0^_lUj&DTm=BsnJeS}8$~DsEpXoqA>Az*kC{Ff}gvN~sPH0HUvyo&b^I<}0N(7BS3xO^n5;A<@@FL9GNd`I@L_1C1G96P>{5L-IAzh?KWFUlC8`ViWTf(a?%ZioPP^0eqYB712zhS8!huJEXZ2>MJ6d4i}SO5y?;un!X~A8NNyUI;j$pq%L14QL@EI@pV$9kT;ILPU2J8Cc@XlT4&M|Uk}aTn3L-3p_nS<!q-D4cV7g*N?JT@1NT+ZB)+*$UnRlK=|c2XQVa!t&b~_0a3@X5S4j^}B^vNG5*QPktbC1><j<qIuaVs5&NzIHv_`~0k*|;t4dUs2g#>7_5%U$&5nrJme1#-ugMy8(kO&ZN@bmT2;$+IcKB7_q4%631LIPbD`s%367FLp99f2|QYQk4XNY>OK@YN9#7>RdZ9l5y0g2PuwCnCuqUmFPuWCiJKBOh<{&aaJjl%j<E+6cysz(ZdfO^~E!_?6KqDppo}WkjUH93Ed6<w>AP@#`Wj01{pKx(Gm-gvhUkoB#>%`)UYDtqS^TDConA0ACHy@Pe%M)i8`LHZ#5&I#J8g<EvqjNt3}>L$^w7GQJvOu)IXS8XkB=Bm8P;fH1?@S4ECt1a^H@L}^jli?52zC^!@JRS{i^wi{m+rO3p`__c7=t|*kg7B-5x%KKW_$LwEU3-P|Rkn^<=MkG0dUkg82K@9V?F!j^q;42}lU|+m^B^*;m2jeT@9Ra?<uY^wmxzK$jWWr=XnXicuBT@PLnn+F-GxKXAGI}nUd`(0}iIF*95!GT)#`YD_9RX~QUlFx21I*M{L{Jg{JMeYzvQ^@VuY-+(_3HF>FisLwm#>2`5=?0G^-v>?l+D*eJA#$6^z{$}LN*q@9$Ek+1gEcpiBt`M@l~+yQ-lv+1)*4w!}3*7?w6|pUj;7|0$}-7u<TAv#aBalC7Q7MYDfblDV)9r)-tpu=WF1LK-JaPz_c_m8hj08aBd>-wa_6QDEhU~pA12nz7|?hmp9{UAqjp6Rry+oj7u8JuYi;$>?pqiLVi)S@fGmP87d%O0mblGdh!*}q_7~^S3-}Nph~|I5_F=)-d93^LI^(iN(hgX3@l#>^+;@^_H~e<9V1R(2fgr;1M%zMEyK0GuYa^wOrr7i?~p*?n6G~*&^Qub1<7*kaO<m}R9+t4z6yFAE5i6ykQf?~(7p;ffk()XuYwvR&IS7#2oxtxK)wcwQX;a`S3s&1xzhUzNP!`uS6}~7ZpgCs^-rh_mNmZm5ygRm;8#DO#wcC*+UJsBlPX{Pz+v;&>uVn*Qr77B+NTVqZ2QUwn6JLTuY7o&Li6*LkCea^n!fU3fwyPYS3SY_fLZ*i2UiCnmcHsiMPSOOuX+?w8L048&z}Qc(64$zYyxcZRZj*s4;sJffsiK`malm%&*TvKn#YMDptrAiW`IJF>MNeRPzS1f#X}>F&aSU`QWUTg^%c*VW0pr>@3`4PV$jz+WSo>~`f5jz)E>sKcK(FXOY_wZT`X2+zS=P(<F)wJ4ulUj+`iV)HD{KcuXRRcpg{Sxj-~`FfPAe(2lpuBYaJ<jMqv0_CyJ#oUtjAya63cgYaOy0j2yn!sghKU_*y4D)PTZQKVC2{?fB|vM354VuYNc_<maoO8yK-4U;RK#(KGn9kC!h}eZKagS(R$>YhQ^yC23##Mo`dO^|eod4=H@U($SNwl;A5JD1?WCzS4>NvLe3DiA1cE@O6#^N|~&Dos)oojmxic{7AuZ@l{UUoKqFP%7O6VRF1EFR&v48^OY|NfK#fz@&REG$k$gs9f=yzuY72YP(k<_CsiAUwXbn{B+~KXD;zluY$AMx17v_BMql>|hoD;fx)&&=jp5h5IyM%7zV6jkD8TCL9*rAuExx|-%khNL*Ee4v{L1t7O<gEOlD@uaqG%fV>ZX_ZfXi1mrwBPB_0>%qJxq7Ly3u>n=hRm>b~xI!e0AgE%bCNkZYsc?Ve+-j8xmrezP6Dwps4R_8z7qWP=00ON{s=&uWal%ObYnQrb;LVslKu)6PpD5%4R{Ks8(OsEUMV#;_Di-1PBg%RkLPM0u^7?P>=${#@95Ga<Dx3n#Qk}AP8U6j1lE($k#Mg0-b65nx=t{J~+PWO+X~b=&N2B8{VL=Xj&1*rTL16(5%zh*E72k><asO=CD_V5ns>HU{p2t)y$$IZEau8B&u;B@~fFE=!ghk%``E^$;DSQAXX`;^VJLj6AI>hEfZ+WPs!IZ9Y|dG^tH@bqq|vO$rOU@Q|2p~vIP_FzLIHx_($Sv9%Zi@i@xU3McTmjHBU+k3TeKM>EKGhm#=sz6ac39if1N;)~T;|wRmh&@%66L5lV5s-VLrwDSW-t@?sa3uXiDmbXxHBZUUh^bYI1s`JGky8fKRhR9?P@xim+M?`xPrOD9r%4YOB?1J&0sVN7&r{2E5d9x^b#hKcjD_}4HKJi*%Y6%3X_JVIZ=IN`)#)mJb!j$lIZ6$}a$BuIP(V}XemU0=aS_@ao_*DsQKgRH)OQFO4TuU{;T0+H$K7Xt&r$iCX)ih<+7S35~Fj*MUJ8qEZSeYJCR!3pG7J3VoUT)x^Bu}h=otDOKXhH1WfS^VJ_;HwurUC26o^#Vk#*M_fN;Gmpw`07Oj3Sg7IdO5}X!1UFN`9#Uz*Dia|E{}Ze!sOMfAz!<&$n=TR*E&mBe3D=55)*Oo^tDb<2B1-2x%k4AXU$hGjS>eWe&ymNN}^3)xumEhGvMo%6*Sd+-QsG^;ES(Y!ql-FU$?MD5mfY5i(8i_bYHccIFPvbRZD@wFOy%hoXGVf*H<i@%6zf)70V071Z=)yd7!td(^oo9a1nxirQ>84cIPYI-UBX>U+HFaVZ!0-6~EI*qpw%`Hl(@vdPOf-r%qq3R2uZC=Bt%H6_fOQt%6AaDga-rNJ+D0<m=on7H~+u&aG;M80hO9rXx=xe4XP1>#p)El}&<Sete~J=vItMU#SoxbxMAna!ZjB%hxH2Y=NNibxIZ}a)-W7*%24#!dEFfsfgoODUHqrK)y;jv`R>Pm7<|WWuC86GDyNw;A<36W-Atbjbeud3jklEaA_5J<ZG0&M0hNGg`!GJi5Fj?1d@v2<SUdup;pvaD0`FqDESIyZw@1|uTa)336kpT6H7=~P<(wtCki7aU!4Rag_!B9lSPVfB7Aj{<iw%))d`vfLvml6Xi9X&@@o?Xdl2q?Wdcl<CP!bHz-i-K^OeaANh1h-Wnv<iACa$2CKzb&;46~{667rTx}?ts6=z?U@QpYk<LeSOD<+SxOVHTV(fYdN0gVu6UzMzyC<<Sd{4w!Gz*i-A)Ic!vRS6pzD=d6fqF3aU-B%?$uuLHPsw4%E8kN2#d7<hNm9I%aEMaT=io_QOK4V{z?CP|{{EB4PrboN4NXjS(V&y9mC5W&XeMPb%R)sQOkL-dD6}}#Mk|{y3uSbStF#GZKNXo?#-&Z+FTUP9=92d(hVqfLfAd$8C8kY-DurOca7B}$O@-?msqld7saVkumwfbtrlp6;pz8YC%B<JgEk-bhw@V*uaqv^|wuSKN1h%x4CksLJ;Fn%p^1}A0D*CG<IG$HY|$bu)grhFw*q(KE1Uy0x#f<e_+A~Bw<b^1EQ)&5QSDrA-@M@?Ua)S1k|>#L9gfXdE%4bsN&0NK|dWp<=U`x*pCj#y$}gOHg4b>wRh0B!@md<8-|fiBHgAdNzp)%glU&Mg>)zW#XBSIg1YA4>AjQD1$yfPq%xD_kEV+<t|FJH^GoS2zNO+9G}J;m8LT+t(g}hMcy(_5ei1*V)$|etT+~uRYdgs3`H3$F4EUA76R660>sUD-S7#exUiv!-N_vC0}`v3BrTn>)Wh7z7~Cb6NO98iLY;POyo{|edD3m2-4Rbj0ft@eBI%vL-Np99hT5|Mfs|u5n_foUv+5F8=UhsM_-;P9lqw^Gt~>!*Bn^h5IKCsp$jc;(AOKjL;%S3^+s3_R+nFGr0P|R)>j*lmbjq!Y6HTFwJ%?5ESd#){8~d$7L_kwYdA=2g!Pq%st9G$e5H}*P~!QOMj0kUFnpac;fzwRuWpbtz|i{YwkJT*?W-FDIbDCgx+U;q$JAFDecVt8_EiQEC>B(Fjd2J}T-w(dBGNYtUt@$wQ0DeE2ASohhp#Yh^+|d16-FX9FdBS?@isxz+*cSW5KV@Cg#iIY8OyIQ!ggG+@%6<kK3I*uzNn+CkjYmUtc=82_0`28UIUbTby4P(EeT&;hzSL1?W+s1KppgabrEK0jHs_|l$!SV`P#-L)e0bA+ip~8EAy3&1dLyQzOp$$yYDL-`l*bLuWKa=*z)_jb{3}h;%f^euf}?OWkF{F8K<u-*zkZ+;wuX#SoYAqvIubC!l|z-f|)4g;Oh!HReo4~U7=)ei<7S^B>B*Q@>NBXEmwejRZ)S_ATVE5m_s^+eN9n_%7r0cQ~apAVdpCfL`x`deLaDy511QYPh9HD0r&NUspt*wtD2Iv2B*HNJpjN7!B@2arj$%yO?ZNJr0}Z=KVu4!eKm1rj}*MGCV13}q3Wv%26U`ueKnEd*zxLXiAV`7EPO4Y#YK)TUrPWOWJBgFiCt$I<a{L&3eo~IUrEHt!?x+`2+6u1xxS9TuxC@NuOiM6AvEZ#h%u}>S@|mB2N+Q2R}kBRPM)tICh5pB>njK%h5(HD3c>`RN5Q^+SbR}H%GVEqepC*9{V;?Hp_H#_m$Yt_`kH2Ik%22;(+=&(Gry+M2}Q@}YnqEa7$UxQxCP_YsIMI;Nu}|9?Eq!fsWM+XTmZ2)_O-)>17dJrJJei&roN&L0{Of26%EgdUzx9HL&Cy9`N{#307QLXIjjkGO6)5KB{mFMe${{l4dI)w8W{MYh3KmW6hWL+Uo-4ML+8!c3@-jmq470?h762XzGBezCCtND3@|2{0r`5SR=4=#>jfyBl&tt_)>p$zfUjl}^mL%|wG0>|6boO=E@im0@U@H%g(Kb9GP6A${(P-q1%#2wuM{TzLZkdjp+?$HzD}q#cEZ%x34{DVLHinkZxITjuMlWOQc&>~LZu-I6kj2r5tXab*9US04c++q0K=Xauf8^5aQN!%D}yqVP@MWo2I=qzkFR8c6bQKTRl(vcHFUm?&GA$s*w?Wjo&^7V9m64piow^h44oV-`Z{)Ic8b>5F|!VZXI~Ro=n@RiR|IYnEZO)fCTX$|@l|Zog-kfU8UQ9}45+ULZqY^R@zp>DGcA+87O0`YZ|-Z@C{V7Jd<|0*gjK1pVPhr(Z+s2g!pCjX*DwTK=y-e`5NE`eL0<=ON#%*~>i`-ceq{P8KuF+#FJA+6cm#^>D}Xq_9_zjWAfsRo@@s`-HVW};eZ%Na%-7WM#@(u~D4SV}lV8yjgFgU#JvkX^u;S~9g)gkcS5pm_2U%Y~(<_s&Pq);XIqB2QQ$@A;bmRU+nfY{UxFIO}^l}4Y8mmt)7hJLk{504oBYsgn4TgxNPKZx~)fnO<&!@pgP_}vaG#G#z*!UEfi3=Eded?<NqFa_veM!JW=kZftVRmwOeA)}xCSQD?_G;6{$;79;P`J?>^64%h5yT>Vs*6xD(UDJesR_U{=~G=C41f6fRM**-KO&#zN|Cm!)2Fwd-0?x+Q(Kd}G>rMQ7A3wSPClh2m=?nFQ_D79Hii1s(nnoQ{M1ryl8fZ0v-;%7`1y3!TdzPvK9zN<%_qrEV@WQdl=Nw=LBZ(MeOj5g*g)>nO29e3&QB}h<hhyqw6ac72P&V!k|I}z#iy;%JZ|FiX{$6%p>BOj`A3%`L7!5-feMA|Q%V_RduDw~d4W<_m`_<HI+CmLDJvMF?A-d4RRmr>lzhsnHY$esbd{PmG(w-MVj`(chfh@@Akqfr(^N&4TyXmo6{%Kvg`ZA}SwX4Cr;~LV=;ZozGA+-6`spMFKR38fPc0cBm_9XC>d$P}r>3l!7@PEIsk>e{f_+MAaSw=?Pf0a+VFJsiqFAwD)AFfg4naB^KK*3M382JJKdmto6y;M-TnhCVe(H&X3ONWq?F0x#rxc%dTEi&;u1`CGIS@d?r=40%irnyNB#;nuu0G|oVvgD2(@lBM%m$xs>JuX%*r$)Y81v#jee{$L`t+$I+LTX0K4mnOArh-k8OJbb`|&BG3O`POe3}VUpN6qdG2yY`$IPdgT8vmj^yy-qStaz-OMavLuzaeh1CLzTr<Ou}YU}l>r5svRB>J>c1WR=AQ%ZPPw6*v&krIs`*{6we$iN`*X`+$9$+k}smBdZZ@#&;HAM~z#I%#dp528;eK^Rj-!Ka5R+~f#;Dk+Vt1G_$rMCKez^(iDrD-N!F`UsWY8%duwiqyag;-`!}snH|gQ$tv*+yH)B*fzm3(x-%?Y@J#3X(B*vLI8e>XzkPDeLA@3M*$n34hmTWRpQe_nZl?zetJlO4>v=f3i5?H#Pz9Q1T@y!r-o*!G2Z&rkfJ+_G<<4Eju1aKpBl1TVoK7dfrHr4A@gbAoL`24p8^W1#nJkdkf{Tk%6v+wQW{(bJ{_bZlZY{&4niv+r|;824>ZZy`1Eg2Oj&?W1+hY5i}BMyMqoIeefsB-173DM{lg?JuFI!>2+2qi{IrkWASow4?bBoJQSDPcvZAPv{8SH%JS+Tsnx_%~MmwM83G~A-z^8e{SP0Je6wi=4KUqG#gXaXMGoRi;VQUhKPwhZK>~i8$J2~8FvHR4H+YGfwpZf8skR;+$zZ8HH0Qr<ot6rX7eLAPt0JIdJ&hZ;loAv1&x>ak0pUN2$fP<D#`3%uLRG-2LQz3Qu6pn=xv8;T$7YPC<GoQX$R90&3(>98ALX`TnO&wFJ^3ydN0uLR0nkJVdxX4e_;El4Q=F>D|ckoF1RBsR!9#1~iL&1m%rBC(FD!s;hibfA%W#gx4%p&(reR>8?EFOiQo{51s2klccJ2E(#`_xR@7dU7>Ei-B@=zUry29Z7|J|*MGKo>HflCe9~<;$mJQY08;^XZtANG8Tl?|d|ZRqE3_1t<<Pd@2Sotk$JZzn~&+arxA4aFd@!pW4+jI_5t0f+v=u5}$fuf}(HHr(V(=q<VeYCC_|y<<q($epOz4TIZmMiM>zjuCwI$DVGzf_DX!Z<w~tfIX=}wiKv3pr&^lqD#PMaEhrY<>hNh67H6FpKh4r0Qh_v|V(C!0mgZABTa4`BeM%=d;cn5Vba1#vwD{BtsXAz3pIQOIR$;}bRV*!fW$4o?ek!;zKb_kpUwnN!2j~KjkWc4~*r?LtQ!1$<set^HiXTh>0DUS2#~-}7Pota~JB0FS6hVoV4t*LW#DOx&PoMBAbAsv9C$?V1<@nTzr70wEed^@UB{mN}Z4zqDkKm_Gc(^Sh@M)6}t0)P5%H)oQ1N74+jvKT<e!ApO0wSwVl^pI8RQIWp7EC-S`7{Y3i9M8`CZPbN@yw@47;*Z=<5Ri30VHI78aDt$UXD+T9Afly@hK6?F|#P25_vL0PQj-{!UCD0@+px4e6q;;bVwtvz`#$3=)p9m=~E#c;2<A;8U$D+6;_`H!BwXy>eC>6Qc)s)3S{k%1m&kdL_ER};nN>-&Rk7C^+C7ChRLUJW>z_Z@M#aeNMy=B?J>cvP}`?GxS*-xK7AvjF-y#+J2u3m5})q4Ba-6Fr#qaKhy~-*9V!wNrTA1wn=#15Pj#f3QQ+v)9IfI^D4*tV1VxRMPj9rsBuMt@4N6f74nMt7xT685Pj93}Fa_dM8?l76nDVI&QLO4JeOjXm5Xust(tr#A3-MDLS^g~MQyMw~r3^l$ae>MS=F=IyI8>7HsoSHNDSbYbK}V6AC!fY3!Q;I2DGbCo9V|X|0SU?E`_x4w7%>Wb+LjB`oCu$`agq_D&!=m!9JvVq6#x~Ccom>{EETLs6%Z8$6$Ts_2msh{p7G=b02l}W@WKYCp#J|B{sAZm0N8Mz@#F;n7zhCH!Um_H{{H{~04TLD{a^+iG4KFk0RR9R0R<}lJOKm##sL8X{&oQaK4t*}{uBWP?)$0%0R{f|Z~+7UCIJKfBmo8f{u}`V{!9S_{uluRzA^y={_+6<1O6BR1OB)H0R#Se0R#S40R{elGywzp6afSNZUF=SH~|CvVgUpGZUF=Sm;wO<{!Re{?jivL{wM(h{vrVf{_po_0R#4)0RaR45CH@F76AqR?-l_A{u%)T{#pSAuD?J53I6xr`)~mR{xAUr{_kJ`1Ab%y1^)Hc0RaR4L;(f<zcv8{{(l|;1HM`T1^)LC0R#R}0R{H&WB~*Iqyhm0{xSgr{t^KL{;&c81O65P1O9*k0Rvtz0R#S^0RaR4QUL}2e-;4){w@InZc+gQ{^9`v1O8|M1O6HT1O9da1O7At1O6ld1%B@o0R#Sc0R#R_0R{Gd9sviw{_h|G1OCtf0R#R*0R#T{0RaR4U;zXE$N~Wa{?Y>h4SxV200@8qKmZDW0XP5%AOR?V1;79rfCG2{5Fi3bfC)eWDu4yJ02m+xXn+mC0Xl#O_y8av1c-nUKmtmD2{-{LAO)y^6~F>ofD3p5FdzoVfEhpoYJd&60XQHB=ztx-1A2fD_yIs52nc~8Km>|_5jX-!APFdeCBOulfD?EEP#_9Ofhj-*s(=-^0$3mmXn`%j1-gJ2_yS-c42Xd-KnBWy88`!IAPuO2HNXbifE#!Na3BuIfjK}2>VO@%19%`0=z%@J2l{{?_yd3-5D0=nKnMzfAvgqxAQ32nMZgFefg^YXkRTFBf=NILDuE@q1ehQbXo5|^2|9r%_ynLJ6o`URKnhBMDL4hFAQh;BRlo{bfh%|gupk!5f>}TdYJn}d1-Kv==z?9q3wnVs_yxcq7zl%5Kn#k3F*pXuAQ>owWxx!Yfirjp&>$K}gK0nws)04Q2G}4QXoGFQ4Z49h_y*u09EgK)Kn}`*IXDOCARVZKb-)hVfjf8y@E{(@gLyy?>VZAD2lyZ#=!1R05Bh;W_y+(XAP9tkKoAOoK{yBqAt5M)g}@LRf<t%+5FsK+go!{ADuPA02pAzFXoQWx5juiL_y`~&B#4BOKoUxVNjM28Atk7UmB12Of=hS_Fd-($gqc7SYJyF;2{<7q=!BiX6MBMA_z6HEC<uk2Kop9CQ8)@nAt@+@rN9)Lf>U@3P$4Qvg{eRls)ALx3Rod4Xoao76}o~~_zGYlEQp1%Ko-h^SvU)5AuXtdwZInIf?IeCa3L<pg}Fc%>VjRk3wR+f=!Lz&7y5!<_zQp`FbIahKo|;xVK@wkAu%Y1#lRREgJXCMkRdWihRHw~DuZRX445G^Xok(e89IY!_za*SG>C@LKpIMeX*dn2AvLIm)xa8BgKKyVupu_chS@+HYJ+XK4Y(mU=!V_E8+wCp_zl1zI0%Q~KpcvLaX1dhAvq|A<-i=8gL8Ne&>=cVhv`5as)Kd74%i_(Xou~<9lC>e_zvJ9Jcx(!Kpx72c{mT~Aw8&v^}rt5gL`-n@F70PhxtGs>Vti_4}bU}Kj?@3z#sa9fA|joB0va;0YM-Ngn>8^2qHl!hy}qQ8ia#*5D+3lNQenRAu5E0xDXg3LuiN%!67<?hxia6B1DLY5kVqKgo!v2C?Z9uh!w#iT7-*u5ilY~$cPz1BWi?=xDhxaN9c$h!6SNvkN6QlB1i~{AweXHgpoKBNFqrni6y}#nuL>h5>O&aNQo&yC8~s#xDr?*OK6EL!6mwcm-rH3B20*hF+nEEgqb)KXd+Fhi8a9{+Ju{U6L2C<$cZ^YC+dWqxD$9HPw0s~!6*8JpZF7iB2Wm5K|v@Ag`qeUh$2xaibcUF8ik{H6p$iPNQy~8DJq4fxD=QoQ)r4!!6`b0r}z}0B2<WqQ9&w7g{e3ds3KLUidDfXT7|246|f>!$ckA(D{6(UxD~h}SLlje!7F-&ulN<fB3KBEVL>d4g|Rpm$Rb%Ni)FzqnuW7?7SJMENQ-GfEvkjJxE9zVTWE`I!7aLlxA+#|B3y`zaX~K1g}FEv=ptRHi*>;++J(D#7w{rp$cuSFFY1N8xEJ^$U+9Z{!7uuSzxWpbBVY)Ofk7||hQT-(2qR%AjD^848ivDo7!V_3NQ{X=F)D_|xEL5CV`z+x!7)09$M_f^BV>q-kwG#_hRHY?C?jR4jFrJMT87Jb889Pe$c&jmGirv-xEVMjXXuQb!83Y>&-fWYBWMVXp+Pi?hS4}0NF!+|jitdfnugPO8c-u@NR6pMHL8ZyxEfd^YiNzF!8N*u*Z3M>BW#F`u|YP<hS@k9Xd`W?jkUox+J@VB8*n3T$c?!{H|mDnxEpvQZ|IG^!8iJb-}oDVBX9_g!9h3*hv7IJh$C?*j>W+^8i(U}9FQY&NRG)tIVy+cxEz=xb7+pu!8tmI=lC3;BXo$4(Lp*&hv_&Ss3Uc#j@7|BT8Ha+9k3&I$d1`TJ8FmRxE;77cj%7Y!8>|~@Aw_SBX|gp;Xyo#hw(Tb$Rl|ukLAHUnuqgv9?&CtNRR13J*tQGxE|OeduWgC!9BW%_xK**BYcRD@j*Vyhxs@k=p%iokM+Sm+K2miAAj&8e#npcK|kt;{kR|aBY)_R{lP!_hyVB=03?72kO4wK3WxzYAP6LZD3ArhKpKbxc_0uZf=G}FLP08s1-T#?B!g&>4Z=Y>hzI!~AS8r{kP$*cN{9(LAt)q;sE`%HLRyFmc_A<)hRBc^LPKhZ4Y?sWB!}pb9l}F;h!6Q8KqQC=ks(4viii<8B1j~OD3K+?M4E^bc_L6Gib#<uLPe^G6}ci<B#UT~Ey6{*h!^=HU?hx)kugF>%7_^`BWNUzsF5|oM%suQc_VNnj>wTYLPzR|9l0ZTB#-EkJ;F!&h#&bQfFzIzl0ia93W*^(B#0!DD3V3ONE(SFc_fe|l1P$CLP;u#CAlP+B$H^8O~Oe!i6{9apd^%tl2JlRN{J~sC8#8osFGE}N?M64c_pwUmdKJ>LQ86iEx9GQB$w!tUBXLxi7)vjz$BOmlVL(kiit5fCdee2D3fKvOqz)^c_z>#nn;srLQSfPHMu6(B%5fHZNg2ui8uKs;3S-glW{^$%85BSC+H-dsFQWVPTGk(c_;8Bp2(AVLQm?6J-H|NB%kP$eZo)ri9h)#041OZlz~D}3W`BFC<rB?D3pc5P#TIuc_<JiqDYj9LQyJ;MY$*#C8KDRjlxknibwe<ASI-Tl#xPGN{UH2DJUhSsFan$Qd){jc_}a@rpT0;LQ`srO}QyJC8y|=ox)Rkick3|KqaUMm7zjZii%M=Do7=%D3ztcRGNxYc`8sPsz{ZoLRG4YRk<oyC97zat-@8hidXq6U?r@Gm9aur%8FSzD`+LHsFk(CR@#bNc`I-wuE>?SLRadFUAZfGC9mj}y~0=eieLFFfF-a9mcc?;3X5SmEQlqsD3-;-SQ?9Cc`T46vPhQ6LRl({Ww|VvC9`Oj&B9qai)Z;Ppe3}3meE35N{eYZEvO~6sFu~jT3U;1c`dLdw#b&*LR)H!ZMiMDCAa97-NIXXi*NZYz$Lf{m*GNOii>eMF32UhD3|5JT$+n>c`nc;x=5GlLS3qhb-6CsCA(;s?ZREUi+A}h;3d3>m+?Yg%8Pk9FMsGIy{MP<!d}{odwDPLCBDd)`9fdni+#B-_$9ySm;J(D`ip=0F90UM2$%swU<!<ZIWPz&!6=vo!(bYWgLyCzCc;RV2}5BjjD@){7$(DLm<_{WI*f<;Fd!zxh?o&WVoHpOIWZ_E#i*DS!(v*Di+M3HCdSB^8AD@gjE%W5I3~yFm>t7odW?_xF+e8B2$>;6WQvTDIWkBl$tam6!(^I_lX)^wCdx>eDMMwdjFq`ESSHJ8nJvR*x{R0kGGHdmh?y}%X3C72IWuS`&8V3*!)Dryn|U*ECeFy2IYVdajGehNcqY&2nLWd2`i!6XGk_-02%14dXbO#?IW&kS(I}cl!)O|fqj@xtCelcnNkeHWjitFXm?qO`noYxLI*q6KG@vHbh?-GDYD$f%IW?#z)u@_P!)jWMt9doBCf3NBSwm}Tjjg#gxF*-=nq9+ddX2C7HNYm=2%BL;Y>JJsIX1{9*(jT3!)%(3vw1eqCfZ1wX+v$QjkUQp*e2U(n{C5wx{bH_HsB`Qh?{XkZpw|hIXCDg-Kd*&!*1G*yLmV8Cf>-Kc|&jNjlH=y_$J@zn|;G?`i;N&HvlK#2%LdKa0-sWIXDO>;V7Ji!*Cjo!+AImC*nw)i9>NJj>Wk+7$@UsoQ=bAI*!NrI3OqFh@6o_a!QWLIXNgN<*1yM!*W`V%Xv94C+5hUnL~4Gj?K9_I49@moSnmSdXCTeIY1}q2%Vurbc&AAIXXxu=_sA0!*rUC(|I~jC+bL@sY7+Dj@7w3SSRafovp)lx{lZRI$$U4h@G)RcFK;~IXh@4?Wmo#!*<$^+j%>1C+^6dxkGpAj@`LCcqi}ZoxQ_%`i|fEJAfzf2%f=1cnXi<IXs9b@hG0f!+08x<9R%gC-O+1$wPT6kL9^Mm?!gSp3TE~I*;f1JfJ7^h@R0ydP<M!IX$Q+^{AfJ!+Khe>v=t}C-%sm*+YA3kL|fVxF`4Mp54QHdXMk<J-{dU2%q6Ye2S0pIX=iI`6!>|!+e^L^LakdC;CXA=|g?0kM+4e*eCmFpY6kax{vqyK7ZgR{D`0NLw?GS`8hx6C;h0O^}~MJkNbH)@F)JrpZP<7>W}@oKlmsA=%4+=fBKLA`9A<C012Q0M1TsA0XjekC;=&;1;l_FkOO)^5GVpkpb12QDv$-bKo}?kX`l_nfjW=}`amEk1c{&#M1o3?2|7V2C<UpY6~uyCkPCW2FenDepczDiYLE@OK{zM}>7X6NgL;q;`awV_2nnGfM1+cv5jsLhC<!T{CB%f9kP~`BP$&vXp(#X#s*n}BLRcsZX`wB|g}RUz`a)nR42hvJM25<c89GB~C=IEhHN=M6kQ;hKa3~JRp*ci{>X03}LwG0;>7hNuhx(8o`a^&y5DB6|M2HHJAv#2eC=n^5MZ}02kt2FUkSG#KqDe%FDv>3+M3^WOX`)TUi8_%d`b3~86p5lyM2bq0DLO@{C>5!qRm6%~kt=#duqYPEqFF?XYLP9vMYt#z>7rf4i+YhS`bEGf7zv|cM2w1&F*-)bC>bfEWyFk{ku!Qm&?p*7qiIBqs*yFiM%XADX`^k#jk=LH`bOX=9EqcGM2^alIXXw^C>^Pzb;OR^kvn=v@F*V1qj^M+>XALVNBAfo>7#wbkNS~6`bPjMAPJ;_M34%SK{`kXDIqDOg~X5=l0$k(5Gf)_q=`h4Dw0LINEj(2X{3$Bkvft``bZ!tB#ESvM3PF9Njga=DJ7|-mBf--l1q9?FexU<q?tsMYLZR5NjNDd>7<>+lX{X*`bj`3C<&#ZM3jn>Q94RUDJdzXrNoq)l2dw0P$?=&rKv=fs*+W@N?0i?X{D{imAX<_@=9L`EQKYpG?vIxSu#s!2`!~1wX~MlQd@FMZwW5NCAl=0=u%y>OLqw`<t4qem-td&@=JdSFa;*TG?)exVJb|9=`bOt#H5%O6Ju&jj_EN$rpP3jCKF|<OqS^~VW!NanKlz=>P(*LGl8biB$`GOX(~;o=`^9H)TEkL6KiTsuIV+wrr0E#W)p3yO}6Pa;ilZAn|2d#>P^1sHvy;MB%FlPa3W5{$v7P+<dmG0({f@?&B-}EC+HNNq|<bwPJh+OI$bC1l%2HGcH&Om$vb@~@D!fJ(|96J<;gsqC-jt_)YE!mPwmM)y(jn-pXAegqEGe7KHVq$l%Mp|e&SF4$v^!k02QDF)PN#T1<F7jC<K+D6x4!ZPz}mKJtznjp(NCVqEHpeLR}~fm7z4$hT>2i%0qo95EY_C)QBQcCCWsdC=`{VRMd)MQ7y_vy(kzJqh!>KqER)<M%^eJm7{djj^a^0%18YuAQhy9)Q}=lMaoDWDI}Gol+==9QccQ9Jt-&^rKHr9qEc1LN?j=|m8G=Qmf})f%1eDIFcqf6)R-buWy(yQDKwR))YO_{Q*Fvky(u^qr{vU}qEmIsPTeUym8bO7p5jw|%1`|%KozJ2)u19&h00JJDnym26xE_)RE^3}Jt{~QsU+2;qEwa2Qe7%cm8mq<rs7nc%2RzRP!*~~)u<v>rOH&DDpZxKRMo0tRjtZZy((B0t7O%zqE)rZR^2LGm8*2suHsd_%2)j=U=^%{)vzK~#mZP6D`b_dl-06gR?W&;Ju7Gxt)$hoqE^+)T3st_m94bZw&GUZ%3FOaa22k^)wm*8<;q;0D|D5v)YZCTSMADOy(@SXujJLdqF43GUfnBvm9O;GzT#K?%3u8}fEBO=*1#fI1<PO^EQFP?6xPCGSPjczJuHY7u_V^SqF5EnVqGkZm9aF|#^P8V%VT{kkQK5-*2p4RCCg-;ER>b9RMyI3SuM+Dy)2j&vt-uHqFFV|X5B2Dm9uo#&f-};%V+&8pcS-)*3cqaMayU%Eu@vSl-AN>T20GoJuRpewWQY6qFPnUYF#a?m9@0i*5X=S%WHituobq%*4QFjWy@@xEwq)k)YjT!TW!m2y)C#Ex8&B`qFZ&#Zrv@smACZP-r`$*%WwTHz!kUz*We;th0AaqF2t3%6xZTnT#d_dJub)<xg^)*qFj~Ba$PRWmAN$6=HgtP%X57$&=tBw*XSZ$rOR}kF4UE}RM+ZaU9HP?y)M`lyJXkwqFuGicHJ)AmAiD;?&4j&%Xj@Q;1#@t*YF}<#mjgdFXWZHl-KfNUVqKYc|9-a6}_a_^rBwX%X(ce?3KN=*Y@IG-OGD@FYpz<#Mk&DU**euoiFs2zSP(HVqfjceZ4RE6~E-y{Gwm=%YNN2{FT4-*Z$&P{mXy-F8~(61lRy0U<J&89WVrzz!ca5V_*%;fjuw?7QrOg1fyUT%z|Ao43@z(*aqWZ9n6D$Fc22PMA!%;VI|CjoiG%Z!c^D_V__}Kg}pEs7Q<xN45MK+%!b`C9G1g$*bd`iJ<NywFd!DhgxC-xVnxh|9Wf-9#FW?)V`5Fri9InW7R9946r*BQ%!*wxESANz*cRhrUCfJpF)$X!#Ml@kV`a>YoiQ|)#?;svV`FX1jlD5A7RTh+9HV1(%#PhLJeJ4w*dF6!eaw&jF+di`1lb@XWQEL-9Wq3g$Q0QkV`PoYkv%d<7Re;pB%@@N%#vL)OqR(s*(T#;oy?PcGEf%EMA;}KWu?rNoibFG%2e4ZV`Z((mAx`p7RzMWETd($%$D6UT$amp*)HQ{z08;WGGG?WgxN47X2r~y9W!K>%#_(OV`k0FnLRUT7R{vDG^1wK%$i*@Y?jTm**4>5-OQVPGjJBp#Mw9_XXVVCoilWn&eYjDV`uHmoxL-77SH6_Jfmmz%%0sde3sAj**@cE{mh^JGk_M*1lm9&Xa&un9W;cN&=lH2V`vS{p*=K+7SSZyM5AaG&7xg2jF!<f+D7AO9nGVCG>{h3MA}FrX(i31oivn|(p1_?V`(kTrM)zm7Sm+fOrvQv&8FQnoR-sc+D_wXJ<X^6G@usLgxXLeYDLYc9W|tu)Rfv%V`@#!sXaBQ7S*KMRHJHD&8l5Btd`ZZ+E(LgU9GEmwXX)&!kSncYh<mgnYFWq*3z0<TWf5st+}<g2G`=6T$^ijt*+U%yN1{DnqJ#$e66qfwZ8_~0-InPY=o__8MecQ*b<v!TWpN2u{pNK2H7H;WSeZ1t+H9R%ZAx9n`YZ=oUOBYw$BFILYrtCZKSQVnYPo0+ESZpTWzeZwYj#}2HRqrY@2Pgt+v^=+lJe6n{L}}ysfwSw%-Qaf}3y~ZhyqBxEZ(OhTM{ya$9c9t+_e3=LX%Pn{=CQ)UCQ%x9f)8vYU3>ZrrWAdAIKd-ol%B8*k*TyqUN2hThVfdRuSot-ZOo_XgkMn|zyZ^sT<xxBG_Q@|%9!Z~U#l`M3WD-~yb08*l`!z!|s$hu{*Nf?IG5uE9CD2M6IIoP?Wj6t2QqxC@8jGMt9na2&3~dAJV;;zFE=8*wDA#F@AghvHJ4id%6kuEn{y7YE~FoQ#`sG_J<kxEqJ#a-5FaaXhZa`M4hk<bs@#8*)Uh$QijKhvbr+l3Q|2uE{yMCkN%CoRph#RIbWdxhsd|vYeLNa$K&<dATnK=E9tq8*^l?%$d0}hvw3pnp<;huFbi*HwWk9oSd6;bgs_XxjTpF@|>RAb9}DP`MEy_=mMRf8+3%O&>6Zzhv*WWqFZ!~uF*NVM+fO5our#|l&;cQx=V-YGM%Q|beyi!dAd&r>O!5U8+D|v)S0?dhw4(Ds#|reuGP7^R|o52ovfR6w650Kx?6|qa-FW*b-b?E`MO^R?1G)J8+OF5*crQHhwPG_vRih{uGu-eX9w+~owS>F)UMiDyK9H-vYocucHFMpdAn~1?!uk88+YWc+?l&`hwjpyx?6YbuHCu2cL(p{oxGcO^se67yL*T4@}0ihcl@s3`MZAy@B*H|8+Zh-;2FGwhwu`f!drL@ui-hohX?T@p2VAY6tCi0yo-nNGM>iUcpR_edAyGY@<N`-8+jzJ<e9vahw@UM%3FCXujRSCmk0A=p3IwhG_U5_yqkyfa-PoHc|5P@`MjS8^n#wy8+t^q=o!7EhxC%3(p!2=ujx6xrw8?-p46LqRIln;y{m`yvYyu4dR(vTdA+X(_QIan8+&B0?3ul@hxXE*+FN^UukE?Lw+Hv)p4^*zbg%B&y}O6^@}Az?dwj3&`Mtjf_yV8c8+?SX@EN|thxiho;#+)-ukks)#|QZ$pX8f-l&|txzRQRCGN0z#e4MZIdA`pF`a+-R8-1j&^qIcXhx$^V>RWxRul2dU*9ZGzpX{4`w6FHrzT1cUa-Z(oeRsUC_xZlx2mFGc@Ed-_ulO0i<A?l`pYmIN%&+-5zvl=2qM!7ee$=n}S-<Ot{j#6-+kV`y`+2|b2mZpJ_#1!Zul$+6^N0S@pZZ&W?63W~zxN0K;-CDRfAp{Z*}waT|MH*y+kgD8|M|cF2LJ=0033h>umBps1Bd_<paNWg46p$@zy}BcBcKGFfE2I-TEGj40W+Wm+<+Xg1A4#@2m(W(2poYVumqaG6Nmy+pbA`pEU*Q-z!wMuW1tM2fi$oN+Q1u#19PAb+<`o>2l~Jt2n2(m5FCO;um~E#BZvf(pb}hyOt1+$!6yg>qo5R=f>f{yTEQ!b1+$<Q+=5)N3wpsX2nNHT7#xFSund~PGl&M$pc-6*Y_JWw!8Zs8<DeXzgLJSC+QB=B2lJpF+=G0u5BkAB2nYkAARL5*un-!;Lx>0yp(0#_jIa?p!bb=RBcUXmgp{xnTEa_+2{WN4+=QI46MDi=2ns`?C>({PuoRlYQ-}&vp(<R3tgscj!dD0jW1%dZg|x61+QM6i3v;0^+=aZb7y80q2n>UvFdT-&uoxP{V~7lsp)y>C%&-|c!)FK$qoFjMhSabcTElCI4YQ#(+=kq+8+yZU2oA%cI2?!MupFAhbBGSpp*mcL?64iW!*>V|<Dop9hxD)>+QWN@5A&fu+=u+IANs?82oM9JKpcn!u^<}6gNP6lqC#AV46z|P#D@qGBceo{h!n9RTEvTp5i_Dj+=v{pBYMP-2ogi0NF0eIu_T(rlZX;iqDoweEU_iJ#Fq#YW1>u)i8Qe$+QgfP6LX?Y+=)D~C;G&n2o!^&P#lUxu_zkFqlgrfqEcLnOtC3C#is}rqoP!tid3;GTE(k~6|<sN+=^VWD|*GR2o}SlSR9LFu`HU!vxpYcqFP*wY_To6#kU9-<Dy)gi*&Ir+Qqww7xSWC+>3m%FZ#v52p9vSU>uBuu`n9O!-yCYqhef)jIl8~#>WU5Bco&l04AdF1soLw88r|91{oL%Oks6nXk}zyVRRJ?7OY4X<f{c1n#KesfcFF@h^he`7zhB^aGvqx1ppWb0Pw;Fr=b4-7XAS!2msh{p7G=b02l}W@WKYCp#J{=87vh96#x|i02Kfg5ETLd000#P70zB2)Fn(6<OLM~5&!@wwJ-f(rxpcE02*wR6fKaBm3i|7k!s-YD2Qz$O&3@9$GNp$Bdh{mj+H$Iz8X<P1pH#qc+fM$9!d%}0X_jd0bIp}@e~)rPp<CH096tUDI-7C?`X6f8y<FZcL<!pj*my<?he;A#cr#gT~oJJi_7|rt%v<GZu^c+2CwM3Sdrnpv&LkH`3%CM5KaIz)k+e1Ig!;0tlKP4>0`S;4c6hd4;M%FIvjTXz?^aShHGXNH%*uI?(UGy$U&^AL%Z?C9xE^@{TqUpyGuZ_PLjye89mv<lQ9A^M))1(O?7tx7w7HaxEj&jDK0r9m%aUb7|fizJJ=20>?su5ZjYQ?7Q2e6+X!56!-}Z*=y0Pi_gVB<a9i#^K`D)q%ih9@7GI9_6X~(ww*IOlk#p$C+mkzYZ=ip{4eKZJxh(4JY22LvrN1-yWnRWki&cZkaQ6yHu_EYa96E6K1`cgQ4z``UKh%u8z?gi;hj-Yi?mi%sC{4-~QB8{EDV4xhhu47peORx$dxJ$uSR^tVMM(>Usg%fDlqn+z;c2{tA24Sk`}sKfVr{FIy9WpWVd_&NPvgbiA=C41Y{6~KxIcU+2>9sxkvE<%LojJrrl~InUl6ojf~<0XiPVHi*l)ul1T*#*+&lE@-;F&$V}|^T?WZkwf0$yoRf?&V#(E(8N~BG(TC|HPBCDK60va>i9e}J{$f)hEUx_s8sSL!Fn#@-sO=9D?EE3Qtr4PA4c$rPzRuRao5^2|zpY8P=d@Jq_*&?PI;3h<66q=?8r8FMEp3;ZyFNB|rS;$&j-?6a};nrmoxa4~qZMo;*yt#YC1x+(D;L_kKN#rjLi)o88!`&I=+fLS@=I##<GwO?Vc)jc}Ux~CRVcD&1r@p&Sbk>Xpw$1|L0?{?aZmSt;lVq$gN>Y#W2DFu`VlY<{73n7GJBa!Du=nzvl?~<siv_RV7fH_QyGu1G7jHRNS0YPgqOvdznhdDOFYpLIj>~;_K>qbE<Zyo$L!!Qmlr-O>G+rbbtMA~x+o}bcEGi+H6NOYJ!$e(_?p&O?JHu9gf=H@K$;iQ(BX_RVxI2V2Q6^6nfZwL*6uImzCS<Hz=k5#_BqveA2wc#lX5>El4g$Jr{TcZP%U6<&k~AeUT29`ci!=5XUvF=1w<IGx<O1@9I<%U|W3NNIGyb><k~BcID1C?}c3a(M+}du4lBh^$=`erT%YijY-?~H;1x?kYTwwf#PhZi_9a+QOBQle|gElD(sw5dDib<?KyFtqndMxK=+}&Xkr3p#EgZA6#>)}xV!c>U`O^J$hkd}<MgM+h&z2)3a@&PgCug+NHCkdpiKG&mfX2x!-81CL+y$)#o2c&TISD7(Fi?HcgY%73yk}YUDpI1FsU+nko*gW98vzNJ@&;HKmd9>XX@?wm>-Uf$P#c@6Mfx9zU7jtHS_j6#uyrFOBbCGhu_CRv6VzMcl@rDmVZ-Qpgu&NJxKOJIGy)u7Il*iH8<FgePan^ftL2XvC#t9OlN}A?{7Gaa!*pLn81PKu~RZLIu>3n+E*S8Z^$)RoMdi5>b40ng%Vr9_=@~yTU94(~D0dp69$Oe-_ewe)rpA9kG9g;n6_Bex|r=xLM#6`RDf(x3Kb31nra9L4PDNE(2hKpC!)B>7HL`Ns7f&6%iRM85>po$RXd#<+PC1!0i+`VB&>tP5HEKy~0HNvL;DA;<DAh1cBQwxFFsL?FRlrl3TB1w{DIbnpvFi=}6JrN)<$rMux(bObKI*KJ;JW6Z2sH?;Ql(TpMK(?>2X3C`hBRhK#R6>FjAK{wGM@gasN`X#i#k=jdG!S2#)21(&PproJ!-d~kmQ<qK;8tpYB!KcIG(wDnAqW~<GI6Pw9~01%LBKbg#3H~K!<j+pA@&u@dH_z0WuW_a-_W99Uz$%U6dw+Jjb%1SQtVLIOs#ZgQ1s~7W_5|f_`#YqoPQf{Ni0ne>kL)sXjH9I^IF1E8<uG9Nfe7q8gIa;r>$f9TJXancF1vtE?U%wAD~BNOQ)Rcgo5OmLb;m?VIzxL7pT46;P4zQP8=665+<SO=0x{BlafBM!h&^wUp&U&ZMX-sgPLWh((r1bHda_8C#YqMR;0ky*vjC5ODHwVvZX`=XV}VDtPGoFSG;B!V9?^C5?g%ubOa$|Zex7LaeZ(Z+uP+oLIwKcliAVm17G3Mq}URPm3+@SfLD6KlDZyQy)HI9;A=su$TwJ6_QfPt1}UU!wyQ3Z3JatZsn1by>i;<>t91Y8N}K`Gr~$}GO)034U?fDBT9R@siA6x+jqVIVaT2Hm8kxXp1oGlVCA3;o;D$%Uq-Ju$hGpm)b5f-TxG6%PlVOnvj0L(btah=OK&%V};^zW|0&V;35keDL2;zeiws=rp&R;tu&w%{9Ax3smC9Wo=5|JP~;zb~}GA8xoayq6%1SgSkjWB;n?}()y&it;+qMKN%`0Ok!o^2x;dfN|Z@*mL{L6jxD-BP%a**kI@Y|j?A?Z~ogL5v{;#=%$!p)`h?*jWUbGzxSr3>J?EJX7F|uXPa75^_OOv<~NlX7Z+=D0X0CBy)^qC@LMBPR%t3s^1qz42Jsi+5=Dw)F<ymU$N{c3p7T&|40RQ*OT&QVQHaop1;5gAPJ-kVj4%-U+Huu>d8Tb;CwziD}Ri6tP-Oi_V+bj_2}U}ZRMj^8v2R0M6T0050Jb9TFnAIY{*mS43JYUQPtLTH7u01mGrcZ@ybpMyu*0dbr)U?=Y1=#KH-v`bJi_TMA7cRiwJai$;;-Po}>w3Y??1G@0iwua|e<gsAoW_cf&iFTEe?CkM(3@$lToKKtUORb+fioFm)PZb;AiSFptw{JhLJhhJFuGC=v`hp)?=Q;|2QUm-fqK%_*w4xCU4!|11U?l#c%iJ_i<9Uu{|SX9`RMiu%__$}W<bdgNX37j+!iv-=WNm4UI8#ph23j7EVwRM@aH%)pQg3&oxVD<58mHV9J;@}|8CT(>{uqC>Rr1U@*0kUUL0KvBBOWtqq|ydLb1?JSDCAs$m8lFzRMy*%#uSi`hZq#`@=kA%sTzLTPRv!&)N6^*0QAEOx4LNC4F*v)r}lXpnTT4j-$8WjK)+EEqoPb?LzNEHwj1{DSzHUKCHT5oJ>VQyh)7z9C6OjZB@04TLD{a|eqb)Nv*Mx{?o5D<jz4JrDw@}S)Uh>bIH2N-W(i=G1l`p;@^`*Hito*7o06wX#>)3x=FZ8PH#_v`#+13!`>^tF(;C;`w0#Q4-aDs<kA#tCBtv;?OF0R>Jz2mja`n((K`JiNs$|2wq2?yL36zmK6v41c%qJRiH~zMb5%y%sgf#ZX(AGJetm4IIk6Y{x(<O7Pb_Q>P}8&em&w+2%@j3E^*cnMcJU;<)pTLle}bF=uLRWdB~OT?Yr7muWu%rHz{{U;h2%-a{7L!o;~fuXD5Im+h~JqrB{gT>1BtyB@T2D*x182Cv_IwH0W&ku2tZU32;SNn%=5t<@7j?Z6N5=*+V1LyNgM*z5mWU(}<h(0o<6UhO&2^%f>Bq%Y=VREA6uYt~&a^Nq{4*lN#_ezR)$)yd~#C?oz;q5SY>t2csEp+`Q^H5aiaZxx>-_4#F+TD1$4e6{7D3*C8wc1^uq#wzAvU&`N4P4YUyx~4ZhP8N0YZx&3Onk0_H;Gr2xmGZ*inqU50q`k+lbNandp~XBr=46Ia`(jQO$d`X_U+jslv&;6HRWTO_`SQ>0AcSVerj_wRZQAp)8mHy&M~C*iF(&heT21D@T08S(;oNm@Xtc|p%Cz&`XtU+t>on>%Y*{AKPwsknOvv)5Mw8>48mDd#m1!tK5<o4GkSi?;@4nh04Y>Wj2iI~;85U5xK4S`(qMj4UU3fP}=l!|Kq1><AvIK)8y6+^}iY?nzsa<&Y%`SfimP8s5w*2zvI(Z!k{*_D~)w%B^nX;vvcSE{I5VK{MX%^01ClAu-?XKj6@eHk&@8L?=ch>7KChm0}hc;TR?tzOA#u|2J{_kfXnd^9;{nNljvY3m%*m0XhvH+YU-z`fm+vJZvL#zF1e{k|-;ji3s`XO0>knKcgox3s(q22XbnYZVLVuTsrY`Oh}7IU7)<l5TQ3_@jgTVH=Duo8gKp2p<Bv_~At@FANag-*+Vb>wqqvqd+~qw?(F*lo#OVY@im!GY3dy?$LsK4t4Vxn%`cM|+N4_Dk${P5$7l>&(`3ie?dKt+ruJKb<)Qn=P^N-*q7uM%8hDZ(SO8n|0j*RuNAOMF=+8xgv2UmN{lnJl%Bq%uoz|op@_ooAjX(tdkj2&~>!u1l4rQ^Rwwg2A=u)nQANS;HUxRmUB;@9y2>_7CL=e@bP^*-iqRixaZhp`DNQRNwiU`y+w*xIFeBI^fjXp@j*h4ud{PS;-nOIoHZStwM->S$myl<*te&I9K6n({rR&f?AWM#v7i5W%yTGyZahUw7=qW?p|~F_;|{KtLihZUL_=`hmpOE1K|&5*_Z?b#g~Xg0G=Fh%D3U1TfY&oae?F3D2d7cXTw!1-C<lMDLt|)DP>%nVg8ics3)u1N#Polf<k<m#o#Kl82#Gs0XtLPfYLu|!tNCRd^10`P>9R{NH%Y|9P&yQG)Cv-Ez+Zm(S1=OspqdWF|3f6^1ZlF%IT1->?$c$Laa1EBF80kX%U0u#<I`l9<qE<*_n~yqC6u`5;NEEng_Ur}sp+#;OQ^9Y_tnt9F|?T11ZQ}CT0xlOHC{S>i4^KLHFR_1sgozKk#X{3tw<i6pcgtf#*sWTH8e7RSOajOjf|Mr3mw978yXp}SI31kH8V0$sICWPWMt$s(>ECznVRo2-l)@-A`EZ$d=M4-`{nkrOXi)kap-OLyiw<-#tqCI7}J<W@Hn%9SmiYCoR2eQAB;EFI3L~0WBNV~FR+WA8w?oqN9Xbk-98N7xP$%<-9FjUuP4Xc@HRFoRHF?kRlfF1UKsRJgpUa;cj#8GUIg1<8~9=HNb~c?E_E7sR_<brD$0+2<M8j@Cz-9RT=D$8tDJg`2e=HM?G_z)Os84Qrgsnhch1IPm>~9PXM!Gca<73o{Oq7<hWMD?iN~W;W}5sLyiR5(ffyYctTTuTfo-V4+Y23|U1<)r`2BLH0pV)s<;`UplL77xulPM5WQ9CBfdSJenN{)Q3{C-9hjP`FW{3m!$}!npjT=rRjMvA>@6gZZDvJ@c?inpU60eJ+zPe@q%3+KaXdJHJSQ$$_(4t+$@HH+mjV=8SaUaG~C$n-je6ID*pPUMto?h#D{fuUB==QlBa@0T`XUf-JIX2rGhh;A-cnZ^~t0CTovGk!q!{>(kU>C+@Rla)oyNVaGIUmWI=8&90c@TU!;at9mW>YC27JQDYOjEMvGHfF9wc*F3)WfDW($ZKg{cgdb^hy+@)<>CiyXyJly<Qh@hw(qS^xIC)^+X;{qQ+s<6|VBfqsC!Vpo$GY9@V$gKG<_i0|J|#e(Q;5)u3@`^}qO^2+1#)wBPeTJ5;p8vLE7^h6l*!g!?^`4n7~}((hi$tQtJ>V;_mv!RI4yy|QiUXW@Q02Hai<no6IHl&>qA`dRp?Xgs%dQmCT)VHpr?86<}C!CTqAQ$L%*6Na-_@Hy0QA7+UC#RK6`TRhj_HjB8F&y4?VpK3z%69VIQ-_*em?ELuME7kCRZ#W)rmGm>;IK<mkynYsb;@3VHk`C~>3*UsKZvqMLo}9-1R;gAa`NWUeee(y89(nxQ^FTH~e7KdbY>PWvTEmao{ZkE(e#3C~hh`C%KJi|*lQ<Sj$9NO$EzyBI|5${#w@n{$^f;7e_s)Gu^vL6W-z+i-9{DB;woM6n{*m{tRT0th!u@c}-Xf_9!{0FDtFs8CgYJj8&wZ-pfyUw3zY3)>3Gz%UyO*)+{@tGbvy;Ufs^nMy1N%J(pN&_3BHU)q)SAn%%tq1N*?rcG^}lvqEd36DYVXYPus%Y6Bp;MxvtBzK`^jdJEfr%nQA6zdS-6gD>?et1|L%!7*WNmFFj}ksR0a4vJf>nO-R}3?uXE}Sv9Hct+-I3My91M~?5-}XOznB%`tHf8i0@RQ;Q{XHKXtoLnD$z_GiskCWJ_ntKQ}2vCXQ}V!>?NmK*2la-=>zZKqiJVcgI~@KBp1o%fH|6x?i`YYl59@=HYKv?TjQ@+`&G&%&hR8yzbk{F|AankQyE}y7<{ud>+>FL4WFX2NDJzhkh<n@yATN#l)2)g~-HFV;J6*<RdKkku~F8$)fJpITguECz-#{=ea)>LoxT&+2!wt5K_wtH0nPU1D~I5_3WRjVJC*QS}Z2~Bp*SETC4wDq+N#{mBO5|ok%u(wbn(O>SUhbX|rAKIJxU)>g@mf0eO}TNH9lilU;aR+pxL~9Suh+8nP~=J}nTIun0*&Hv%V4bTHXaj|q`(V5`i4t1PS{g1((_+6)-C3Lrs8EohJ)?5Q9ErR#<qCaj_aQlw&0LhVO@6$u%Mh>uDWEGW`z0GMGUZ?eZ{2oZq=6tfUGue2YU3NAo<aNP|wbhyZU=Ofsp5j2!!9_v0UXav=lEvpAxvN90gT=uZGDOVvL3jpo|_~Yvu4TBuiNtLBLAo=Jd2{Vh+U7;L1$`pF)2|y5mLPkW+p6PfcYnJd++CS1|3i2AFXa2TzbsipC9Dh)7<ZEfI0)7Iw|11k=5p2`2b9~e%g*PD2kUV#E+&~R2GI&XsLdU`621km>-Ul>=ZPJI&l5Clrpflu)gYW;v1VQDKM&Vr*Woo(YJ(IUI2{<heV7BaB*o*0N7seq%lBVi8bcjlXS?yuXe+E5MSt}qWf<9>A!)AB=OX$B5_z2WF$dj^xs<W5+l4)TeyAjj4torMbc$$IliziAJ(`QMN&*oetiqv{bGSU+=0Rl%lZfIU)g=wkgPX!!+M&h1K&sQ2qGbApW$IzoBoaI2zb7r^^RYl80*tZ=5l$T;hLKEQ1>|sK*myMC;!d-(zHo}zq1S;eJ5;g)_u3;g_fd{5D->?y7BA@{ktR4@zGD0*Dz{4ek?KCz>3-7A&K_*!W<)C7{v6RK2IwF>F?e&%Ai9l-ML6I;wpu{TV12v0o12={iQq`N55c8N0gb@hp&5~Z1U33Qzl87zp!I7;C);F6gpcUyXW)+ZgF>57`{zMJ5jIQ`LIGl4V@xdB$!LsHw9Di!g52Ea$g%hYYui%1U)578U%JmTm3{@cY)pAz9Q=5*cJ}eun2&$4kMp|-t3^WL%;gPcp3kw)aL994G%(>P70nQz!d0}K3cP;Xn<`D9Mj^u;ThbYmFAy!~mND|Os8(|{CA(Z$u$KJp8wk*0j+5#FeU~LMwlR?kp_9J*Y>hY0F?JN&0p{G)C^8yiIQR5KF0Ti_^Fe;MI8QH{ZYH@WVvd8-9To8VUEj9KYz=|JJ9$MT!xm^G8AqWVZF)Z%)1R;>D@Qy&D?f+`z17uB>TlLc(Rd`6iyfyJt5fzZJ8Naq0^(cRX59qu0P9tK}RTu|N+@)W?qZw|n5?{ShwXN8aTVX%!z@xI9`lfA9#hxWKGksRrsE#8EpPSh#Miqi9Be2ofM}xqjSH$Jix5Q>0;Zc1le826(IW0)k6IuP>i+d1xmD90LLvAZs>bNX@l!sQ)ci5N3eKP8R?rW0|Mm1J((tu^3yEI07K+DOUCA{P|o${yJ+C5K{qljl%_IrNk!x?kK*I+R5(7FLH{c~hW^cCJ#{o{eyLr^t{+=2DYWJLXWl`*%zDJ->U$4!D6vy{z>O?dO=`SHtDWwunHS*${@MC&Q9c(O}oP~&lT3kU)`Tq+&SO#&d+cGZ$kgODZVUgP#bS5iL0^i^nJ+G85^Qj|A)4?)!+Qtcc=#v5-0BAd~7&+|-zNICDj%o$Y0on=IN)l?5XX^oqhkjwOAcqMDcbPTq`aT=9Xg!^Dh{e}|D&ArBjGTNMxVt5;ADXoqE@(Ab9n0Qc~k26odiWkz0>f(m4fja~p5DW}+dmvsKlLa2#@GMpQ4=xR+n9;$M=3(2In>#WxK3|GnDah3hSSNbOLK<?_3}OoaV!XsUfK%Zlf)!A_lE}FZ3aZ>us$5g5Xg(4JctHY5nig7#6E_sE3}0l>OfXon!vvBo0Q|rjaX|n&Nkn3x@316Uxgd#bb)kM^?$AmiS7Aiy0ui%85*Z4}d$d8?0#Vk|AE5cV5?l%Hjc}v)MqDuK=_1RJtI%GaTmW{HLc{8&!3?PPw)A*X(2^741`izBg8?i|gJPUi$yi)EgbRR>vpVLGFm#<?9IaleQIi)_Nc1j9V6C$2fP%!U8iazb4oH|F5^@9tUpFqN2?}|O1k^3P!)pftsxbIU*uXNT#H*@<f-8<E7sT+Y#$CC=9qCIVD`3v*0ajMxZl+3pqQQ^_E=VFvc|mY_u>dOzUX|RxIn}_D?zq6^b>nb)+~}%izAp1^;%eqfj#`vX;{b<Tb+P2H2g=%lHa8F_Z%9+Sqzza!1XzN+Ac2GcP8vfBa4wbj9*yuqwY)U&BS{7hy;tS#gORkAfcZ&_^`3G^4&iN500NdFN#Ls&t2^~&LsFa=wjxRQ4zCPOIDnWdN+<c%5aP~(#pNRA3<U-U7kgc}B3Nq&MD?I5-4)ba$x(T)Kww4rK^cMz>s3LL>T;s5;$jc$)50!;6Q_$kG&htq5&noaWkA-uYC*;dx~~g|QHc!_pmgTr+F%;Yq65f9-%!sE2VMy2UM#mEI9@ot6*mu6E*L=($uezvN~Z;9ds@TuoR60$8<K{i$VigIOPF6zMmoEbZ3r`BdT1b_gh7uBF)?HgD(big=zz=l0hNy=Ygq;OQ2@CHy~F@VDmeK0phpoUdf|dmWPt!Q62EcIfZYVr9US<o2{r(Ik^0~>GHn>>qA>vl)d0>HB0f-HO3jE9w+{E+7!FO{_7>x`dH^Rwtq9SU+<_e#IC2|}@8&2=ivoNEF`%t9JJI#$<H*knmh*|O6b#k1LYcvhu2dYw)^kNR30qOiqoTLf95BV%K%QR~9G@F43}PcyRJ4uVn87fkNb>7lGseRJR+@6*33AK=9K1(<?=TtYfyspHq#Q5>Sw({`27zB1(3CIF<S+5d;ORw6BSxHu!HE`4BwYybLeX8*v8xqez#ja%C@oRKjY6V|{>s5X6Q5@eY9E&`WfuSjimOR24>U2Ei-N{ZHj#SMb8-PJ^|wEljHwWaBdUjxFHLytKrtmLSVTW{6O7o1l(;WUH++<6N`O~knAWJGfTbdIG&pgp__QQv3pWw~R#|8v<&v9#36Cz>H9}Ow1=g1;PzBx;3sOusZmOgy*=iDrg1{KQ?sLM4DCdi+310ONswgJ0JS!=twp)OnPGI0kBLc-s2hyl2Sthlu8bSIr;nJ;>5~RhtM$eHJ((LjXfEyc(DWVu;iDHt%6QW4+<ASG6J*}Lr{hEa3*ccPoRf>Y*2@@V(o`Cbr)KIflgae))wP;wsV2V)VdHibgKx`)9duNP5S;K?wrfUR);R4Pg9t+HdIPiXQ<k2NYMN|jQoxnALP8gH}8(bmtpyJb|lsB}doiM<P3?qL?Ne(oVQB)}DS*YQ0h=yG=+s*>UH2X`5r@tT&*ocT&nW6L(gvHUAV&Kygg?CsjzlQNL;@7tBTusQd=^k2&@R*5&V>p4>VUecr{tHve!|8j0L?%xLiC#xlLmtsN&v*W1X@QrYt(4Fm(9%T%)IpT4lLA_zmfpd>Ya}#P!2~g$1avp_?MSzHbijpQ3URJz04B2N1{@U(88r|91{oLzQg35xWpot`7OY4Xny~>Ewst1+mj)*M@dX?<04NArZ)|E|ZeeH`1VK|wRsb0+6$BLk6#@Vi02L4w0ssI26$BM36+BE81Qh@h001bpFa01DsQ>^60000|WprtBWn=~b002Q_bZK^F6#x~&1Qpf<EETLs6%Z8$6$TtO04N7iWprtBWn>rzL1T1jc4Ytn04TLD{a_&g2?+oL00022NC5%79{>XZXaEBNfB^sl0f+$r0|96N0|8zD13_E>0|A5r00RNc0RRO70xkdp0X_f&0TuuQArb%s12O;u0Wtss0Zsq|0TuuU0R$8t00}_?ATSaD4FL!SL?{9h00jvs5&#Ja5P%^Z00V&#00|igKp-3d2Z00v8~_6e7ytzUKokH60m6V10Dl<>0iZ#E2vBk(L;)!S5~>k^n!${0e+q;I7X>aNk>t)XC{7?%5eQM>Q>P>>Wp3-tuTP(|x@I4X9Gd-AG7+?0es$&4&i4`lKh{6J-);BfT6aF1{eCWM-=8gSzwG+4xx3$Xeg4#a6afkLzJH!N0R{Z~A^{2hf4%-R0R{fwBmo2b;sXH#{-6N?CeZH&92E>1H4p#>85j*xZ)0m^bYD|+VRUtK6$}=vNEX@!7JvpOsOknL(CG#oHUKCGQe|{$a%E%~20>$VX?A4*87vh96#x|i02Kfg5ETLd000#P6~_Gt72cl%Ocj_%6#x<d04TLD{h(tX0RSC81HR$}Jq|TM${;Ix%L04(HR7=73gir$#l1}(6bH|_PnYQcdzTa;WyC~E6ce1Gav)6i&!z12*j$hTwG9dmc@ACyLMcuNA(WmZ-KRGl!fB6%gClzxL1^p5ID!=z-w0O7dv63SDE`PW4j;`{yFq$Ha`y;%ZLPJ|T4jwDRw#jR!L0OBNG&2dXPxmsGX3y1>_b~Gd8z>XOv6Al^^(68Cg*Y5hF$I+Vda!@!a1ds*$%-%unX=U0VS@xL)%2K?h~RAkTHU?)12Pf-63S8blBadK`{AACx$Ub@U`wGjG)DY5#&PI-jIN=t#ryLf)$Z6BW!PsB3MzQD1sFjV=TcGW6Z=@LX2q#!`&Yuj3d67sxFt5uT93?EAGW1A=-$ByF=KEWxW?;dGTxASBs^^7Gr5E#`{Bi=+FbC$zK}hlThQ!x#D1~KXeGjUGA<x*2=+=y{u8i^ipamhIZOYF~&G!Fc^1-fE42i?~JUS7{As%mJhDP8$^$28<jL=xH|-<G^qJHEZYpg7-Nhv#&|{<V}udod~w|UA&MB|oq=EwV~i)n*kX*Y#M%gBj4{R$z8oCcLp&?R@JbGj>>W&erNlMj`#Krpd#}BfgCl$SGBobJ_P*9VwD(3ATMmxwqs8@BTW_uR-g}?ZK-{g7Udh3c{q^9|doR6G(o659_ud<CrSrzxAl`c~mKX@|N-L|pQ(h|Njq<+MJ&kw9O>;W5fP3$~nBR2Afub7k%@xPpAu7E0PN^Wmd#{b|)eyd~;FqV(SFQmjyfC^L-2H(@_uhM7bDMT?_lPLE7-MW7MA%x|0ACyLwf0sCJM>QaI{DfuC+5A^Mps&EF`m>$n*e5Bg4S9qYppnjLNE<?hme$74vy^MPbz7okVdrg*biu1=R0m+7A#okTv>AW0#G6djcEBz9#dF=r=8Q<DyO9}qH$V@VOncn>psc|R$N;pR8nlM?zE>vk8JnOXrsL{zF29bTu;MJUf&5aS}0?**4k;U9l`YF?hh45)^_`|=`OqbgpI7V)>;_Z$l{7?BrEpW8TC#Mj_f6_HEKZPeDpHpOpP@@i?qP8a&Tl1?|(M7-FoSr*IHX4trF5!Y3;S~N!y7pL(Uf}2S?Tba&Tm?KeP?oI?rO(T5GMf(rRg~w8ly+2S@fA@ol=xv;&kfn6%bfYcv}~vtBICS7-z*YrPZBDr=S1Mp-AmH)9@1hJ|1oFZm7`<`K#64gty<BUx*$wMO7r>ucRxSRY7<gtcB+VN|0!<-5!Z0+ymiwbojrS}8E5lv4Uy_xDm8>*r1tL1;v~8FIeh?hy4-3NMA1+Dj$2(oR}!G(UGLYAK!3(po936Y^P=g;I0~eLh;}CBJDMrzyRZM)7l}>d>E&knHXflv0W*m6SpmW27`f8qrDRq#PXC!$~Qfl+sDB#nN6$qol9_jq@7SX7U^B?h|g6H`+)QR0<o+NG}Xzq|tWV{oyu%ky1+Uy^vZ+r54FHq#&8*i2&Q3&-6$G32Ck{?*0HFeXaW$(FZc3lv0dm#nR%4C8iM5`ne-vBgXe$NGk_N_7P|qhyr?Nz4Mx^{F1K-$Qv)b*V+m{cd9uf_}ku@hIJ&haoQ-#XlIPi@-jKU<QqV{x60igB0HyywN_f|oExSiC^J?H>!eYgbIxe#oKpf{qj~u<>D0C@!c|x;opVk(=bU)XIp>`7$!Mc`=Yt#7M={FDz=t#kCXFHk+<8E-&xTEPcL(#viKm<~PAq4fFwQyeh4Z!UA)F5)I6E2R?hp7z*S;>KVITd`xSeew?Q-{t8qGQ9?DXbDK%ooKw2{G#W~Q+RFi&>(35+kcn#Us)qBGn*qGAaj+gzrviKoo`{7!S9YOTc>Lk6CDu=6tJ-h1i&XcjDV+#Mp$d!qwrx!eB8^yW96g*LAdugT*8Tr1_%S!mPAm<#xFhKbTlKB|~L1a!w%xqE_YrIoi*Yo(2LLMv;nvPxXB&1INJR$1TVZM+boDy6j7R!ZrlmV+bvDe3O8&u4d<d&&Y*8PRxaeY?Xx+K9)Rd=%~LWF&Wwfajcb$~h;MQ@+-HeL&@dWLn09WIFR8nTBz92UE&=qm(jA$wT=1v!%Q>N(~M5l9x0z8Qi^sMk#HS9<?&?ng=^CW2BT&N?M`RBRbpm22RT~jk`C97D6c{WrCZ@e`Fd1VCMnBJ{!K{_T}ys5tK2KpZ%dx&vBaita0}Rl+GK;jtXBSCCo@hQgRxI(>%7_Wg2&1aBY>k!l$#)XYx@bC14yauJ~GvqkZ_n&Vq{}rbO!Q4dT7GV}H6X<jEhORaxA9fwd95S6*Bp#u1Ja@J2U+lEwztR!c2dus|*4;NU#2k8<~lIOT=#!Ho#fMqA^I6TS>L8|m&1G=)!s(rL~^Uz4}gM(+XLwB2pW-4##{j_jqEF}VB0tdUy!5rjsxh*@c@7uFbKtRz}#rIc=5+1(!|jg!`jBmLZ|DE$aRBU%KZ5p7O8=cIGaNb5^L&KPHmCYDxK`EKoe=bF)8ijDVmGScMXXWB@nFYXRuN-3kH@WG8rMl!}Y@09q#De>n{jFB?%dfOXhj1k5NA&gO_QNjo#jC0BbRU(2hiZ_ZjiZzN6W#F{~4`QgGQKa)h$S6V%j_mVB0gNJzqIe_57GsQ~D595?Co6-yLr5Gkt}?>--b*jV6E={S0U8_b4gh#@g2=!_fPFLr++8BN7GFy_II@q^+H0Yuk&O^OxDg@Zc_$1^g?Y)-m#58Frj+<WDe*4=8F;FCI>SDjyWD+2yc`_aPg^Uk^;%dfrF2U8=tlLG`Lb1g1>0I*?o?m7vet)yO5^<8sWgvGQ=jPw`IJhLLK;zgZKZQYamF~|262373{&OjqlrlFE`g)O4@QX>SojfDR(wBqBp?Sz_8QgGupdEaM57WbfG=NC%2)w46fj;F7JPG~`j>n~zPV9-#j?PhF_IQXDJzbq1O^ImmAgMg_#Tf7qjL9%C?^L;_EAHPl?mT{_&WK5(YSkr2;pzL!#cL=w+1#rjS*64p!3>DLJBFP__74!g@N&sw@~5-p~Rm%mAg-f9+sX4jfA-*cTWH*@Vpw$wJ=sv<?aviefEb&IhYVe&<8iFi&;UntPxVkD84MYJ46H{&NNPoXbj`-5;R&&BV^#CsWBnrv!qL|z9L`TsJ=2^^0ESqq*sA88j5>6U>irrN$wtDF`iLGf8&yH#Brl~$;X#38+TtYqm2<q__gjUy*Ije!^Vfn52K~k$_q(K_%f~2wvM|?Q2Sc<u)&QM*IPF<6Y{~0N^8xR%}YKmu#nc<;HolmN8)66mzWjH`jU_JE3m?f$qO!}mA>RD{mP`3frpZe417p);9=+GJZ;?lK~nhOM&<4g@v}cP>TTM{hF}Y2cXtpWoeX@8h*Q$9(63Ae9zOlqTbJGafxI7@CuAZ{NN0snx%&hB4Whe>Dd$T*GJrFhFL^A#av?;}R%wYBQl#=FFR_$S>JcpaXq3A%fDwF>yFc7WT1v4D18od<m$>c@VI^v%5&lP}F<|mhy1PZywk~9UCU<8*pOoD_0Y!QkY4RA(7-Q@-?4xzuT|&+%THu8QUw`(7yHn688F(mR97XdxtOKMm-o6aDfRZhY$-}p?Dk^2*FX~zf_H>xexH|(|Cyfj|>`26y=$kJiWqySceF`eYLg~wsuNIY#=+Cy?Jwm#>14^rW8&rg_P>f_rS9W)Z$iQa`x;q2~KDTLVT0lB6C4?6Qf@ODSFejZhr0XRQe|OyuX&=emAK;g*=_M~6L>VQG8&q_63GqfyB2o$AZ(NyeXV|7Gcb|wP-gL)(_T}yq6;d1_{EbV3MkwR85agv4Dj%db5N+#B9%dfCj+8O(K7nHOrfs1HRe~>ZIFh?ZQ1-_I^X!f9xP46?zKi7U7BoU=KO5U5caN~l|Iph<%kDlg<-`;|r-3-_;_ea^zA9Jl{%|81f8)xyy9A{^iJH895zNDVWE<Nu?rt$9w{1^Xz2v3%G*_nDxcdW3;mep!dvMiDzEXf39NEX$VcBMYyDOkjI^#u>tm`Fjfk0)ZCJ(<0X&xEAjB$4eDWimPMiNW-+Xl(B<?a$OUOPXZZTXRI+a1`(-6cp_BZZ%Z9>_Fbk>&z)MvI!feUSFC_m**Y2NWqkMC&+h!`&rhgcX#6u{?{KJjSBH#JUaI<|S{5K#37XvC@|(k0HF?cD6S*V2l+gl440x0NzSpo-~kATEu5jlZU@Et>ZqnRl(L6;d2^DXLpaFzz@MPZqpP6-QB_xMG5}4u`Q%s+?`@d@HLM|goIC`CJ&#}pH6xsTgYSEl)F!$L=EWf2}JlTl7;b-m!d_4|2`dh(=^=O0esElF}XVgMM{c{930t8ORg-<<?a!b(;pb+?hz4OfIHVpDZ%eBF4NoP?i3OJ)-F5<W^wn4N-=AcAV>;-+uMdf^WZRyyDNz94l!BPCA<5Blo5WWdFX9%cZmomBn3X5g*KCi930uhH@W)*X-&RXP@*+?`a12SfC8<_Pbx8!m(g!~XByUV_X$eGOg>Hu#7rK(PWxaTcUKVK#wNdwO=b`&WZ<O&2`M553j_Gu-n5TMhsoV3<i_<Mn+}0wdc)lnMEF9mtP6=`cb^E8Vh)b%tEXVToHB-tyC=A$OAf(83wX&#{PK00>oAR%eC1gi%vYuWDjw-LjG8=VKvkEG1q1bx&(@@|tm$%h2=rwddjRwN1PPK1BI+fdB@G(OBDp&RPRq0qjk`lc4DK#rWyK`X>8yb^#@!<(OOwIf6HH%`q=ZY#oR8gcn`YrFlw4t0(!&RFXY#qiuq1a!K<&8D$ELe{N%>M)?k@4sI?rvIlC=Wgm;AlE(;)0~iMK+QGGup8K)=HVb@#q}WeNkQvbcK$r1<44PZ(d>bjM-a2FcwSJYX#8B`===rt&K>g9OTbo66!$Uc<ED-pjv-7jAdh=d(MVUqS>Q;Dclw92`i-!7%~?$utKIcZU$cE4zCFD6%)k-4$H>lCO61_FDcuv_y4MaCZm{q(z`{+#SMJ8C@;IsI<^%G!hW&4D(PJL79AQ0O?B}R||YFg0Iuu{$Lz;j}Rk#k*v$zA8vigLpmXDrMRSgNtT!VRB^JqFTgyU_UsU?;qDXG-4#R#9|Y1ostks^Q=plbQh|)g7nEXR%*3X39$SRdwvK}sUzR!_8`d%M+4SV@6<2ytdJstSSTLgtpYArzL2n`Y@|F0w5Vm32-6z<I-8o<KaW=@mX`K!|VEPJ$fO$BrLkqz&E;b1BU|aQ)rzq=kcLeOEbXx=z+OEk@2NXP|6d&d?Iq((BS1u`2(sX?#<8?YeKvO0!AI#U8tjJ{>WF(Yf!GZ-W!#GYq2G+U}-z8;@lzGY5Y2^fqMEVDXun%n0xO)QAWmOq>fA~zpI*ijqK-%R$wnwHR_>kN^0360)Z`}Ps#-~3Rh~(}OmEM=H%wc026PF4~e3pc9Vku%~<~5q%G|%;$mNmd|%9wSAc`lT@C(!t4YzuY#_Ru2Sb6Cgi&%V6mJDsr%quhM}aLRZ|+42?n?hZj-DB+Vb22BLCFL#g7Bbx#4o&ZKSqQ2Js#8z6K+gylp_lPLL|Ll-QbG{PagkfnkpF4L`SsZtlP^F|&-fe$m*alChJI`&}65&6(L;GMvu)K?uU-Hv6Ww^TnT3^2Mz42|j<1~-QG-0@V0?V5eq};U51KW7X(@Ol0*0C*cWhvwC3G4?(z2swqiHQ>|#nyPSVBz|T6e&pXH{Ed=lieKvnW`>#PjKz-xX|a~?h#mX<(Df;`bvDzA%5;)*H<bCXppidBC;*+E}<b)?hXL>E-AmvlNLg&(Y%Jqa(9SLKhW2@htG98(=cB0k(3Nr(!_E11lIyDHp)(OdQ)Gqq=a~BaCZPuY+FPG3&}6}3w+tq$V>c7e30g`BUBkxcJ~BvWYang!M3@M>SJ$u+mLD8J%MRoz98Zy<&1?P|3{`R2_sqVJ|RYFRns+5Q`#v?1-O2vIlVVc!`&(LhL7}}&Qj(j58vZ~Wp}rbe$!ok9Cw$Hc|tmv6aGi**mjp`EQI#uD_b^S*&Md*%U2}$2~a5G%UAA95=sa!ygXHr%{Jxk5b<Sex@1ancL@1H_J)eX#x^>(>LnjDnFoP1j{v~`*f7g?TE<tR^p}(=iG$%KpJ5!f5XM(x1xX_)F=X;fo<gXRj4xmL<tt}ClYwFK*FpRbZ0k7bB@e&T9Huj0fda^RvN{?jcaNACsw-Dk#f&7z5lagCI?d?}^JE$ZUqkb>T|I6Kaocit2DQG7W6ZD&?w$Z65#vKZP7PB>a`yxg#|W!*V1br*cLeH<7R;tQj`NlH^6N~}0$=hH{0-~MUx^988((LV=(Y$bv|a8Vfo+U=sxaIg0@F*%Qpb`oFZt**4dXbB`p$G^cdrm>1Qm#y=X9oRn#Qe^$-@`gphFs8nGC>}GZ>6=_XXMm+6eWM$2J!lvD}?Ov@@*BHfVn??oMHmeC6QCUWRO;>njw2s6q~o>@WBLK9J^tY0vc)__77#?haryf72cJvDga#Lw{hK{=h2K8Y`_aHlT4Hey6#QOmEzMLVrHH%U_WcU}x4CWsR}Z90uCgOCBOXkrUQfp^-UPobMnlU$ID_U>V_JP@M}(j1;D&F-8kZAq7H<oo#NDzH)I8Q95U&S)*avNbU|{<&<>Fh?(*QC4v!7z{;4(z~Jr>@JSj|oH``LNtla_@kSXblrhE_qm`6O=@n!<%eKZts367|sf7_n7~e<-{n0O98Nx`P3x#0Wwna3J&l!xnJJ1j8E%TN6VA~LEo9n2aTVTH;!S6JuMK~<O-6v4$w4mj2p-v=<*F|*mS7fGrV4KrA7aFEcb-DWhU;`TG<I9jUaBeixRZSS~9x<bcGx4SPCR9u%CB{p!#&??gP)r*bCU;LTF^u-YIDzNOSI)#|nK!!g<tt<Q@bVRiKy+b*pRMTvd=`yH^ZAl7lfM!o*q}yAWhVYtr0DJl$V_|%P+DkdofXDdVYC!RNG0}YAs)>EcZaZ0EEbD=*%E0~Cxu+6Ic@X6sJHH3Az4!Xiu5|ob%d_3Xm}uy=FzcLUx_hW37|x1F~tx@Q*WBYopQoxfq9aYA?M6YKE6wq+}*-XAA)6)yGPt9C5)Tnw9P|r++BiJEbbnGN*E=K5ylwbraidI-6dj#y3@Ej1!;bDNgQ{Nzz{+hEh2=GM(|}OY6RhvDufC<4+!?jyaw8sr#3J)-DQlgz{`U)k4|S8Wdt)HU#GcEgMQOIm%BsMH_}0WG{#rz%a$w~&^Qk{II@qFD{B;Cgb!xoQ@B`?58FZxOum66U$(gWgT+y-IEr&d(c<RGvM%oaU~h~HHm%d25D4R*<22|i@NFO3@)gVDLY+wE?gPN{N{NAgNtvT@cZm-2bFMfqd8)c#Hrd@BTvD#ADB5YG`0^DkuSN7ncP=cws0!eBI%|xR+<gMtSv#FaAkdtbe5W~(-EnsZQC3S~jbapQ{Y>wW2&y5zZ25|1qO8C8=^}01o#Mh^nJ|CxQM`Bye7U0By+Q|k8c3sF@*Q6ZZJ`LTt#bDSFpc7z^+_2+eHzW@4#wmo`XJjKmLcJr@m*CXM={EmU-FWqQIs@_mdr@?JI#F-NNdWMuUVnaD9RbdE2B6ersS)&o+Vq{9YS)N$EHO@u#B%n2-b}+Us*;`av>4W$ft7miRp=8V;`F1?hF86V-ywWC~;+tQG7Xr`HJ*DHmqaYBBAW=5H4@6NWOeQ4R6{^m%Bqy>ZZH=y8CR5yIW8g#n-yOQ4}pKEal4ucaLy!tk5#8V~4~jid4RoF-#sljpi-s${P~L-6g;%ikM1BCHQ*lIO!{v`Q6S&LbAJCST??VU2L)5LKb&_kn%|xLk4rX`-8O@TQ$CXWjsl$I3asO<?av``q`4dLZ5*IKMRe3WE(;@s1%l{(#*qmf!}E^)3`eYOfk;%4yoKdV$uqHo#sF~)19x#?=+|FZoi}$;~Axd8A*Ppxevw|OYmh&gRvzkL{j32En<vVzTQG1c0!CJ9AS*{eVzO+DQ{fv9$_Pch#`(}=E47plwPMfE+n}-0<Zy%^YBu8?WOhJTJOD4r8m+`@71tQclo){NCf<Ho-@uVYtEG=<&8Jq3tt0i@m{MzGOWUT@1+;sdvArk_fBlFh4@|$j_f&|=_Oz9gzA7^d#%N_7Q@nNt;IBlJs`d0G5wKY7rvt5V-JKf?v4PicE)P0rPkVMCHgweedwH4P8%gyX|077AQ={dZM@{+yQ)sM9Z}kh<MpKYGBOx<pV-72X}nnYTK5%NiwP}^5=VAgEQ~CyFJC#L930tmTu9q=$K4lTh-<Yq!u7(H_10T!x3h|T5M51$*ygZMc6W$rBb%vJ>pBg?aCZm@Yps=13w)dIGKRZbSQgaD!IAyMHEKXc&*@C=?f?@(DyzkmRofWu4k2Z&6-uwu+y~?IX8DQ)U#Gbay-Dtlzz)$MScr}`){4u6^yMqpI%TXCQaEAFJV~NJSQls+!Fri2iTX;6AU#N<TBC{))mkxy6*Yn{cQ7!PR?rCXr4&9$^Vpw#eI;fdzR=|E7396v()gr|!QB;1Olhr{QVW>*ZfDy=i)2b?oEOH+gY)GpQ#j|mche&9RPGK@rRBjXK_!KAMwB>t_!+J%yL*Kxsg93rAqOaqG)8J6B>;w0LQ3zoHKJ63j3}iPR@|5Iw6X(MSa{)$uCzF^6Tb|N$-`))*TBNhm&x57)LE;971K)RoHXJXDZSH^BwH~dodl2?l<mviAK-jB>-c&Lh3IVMgs*jv<FvSO&df!882X(|VccCo#6WT|0)6?)($l;Gp2CN~g>y!5Ml+hQV#cRo8<t=476>$&9}2-VW&|BX(VP}T2Nd6X<&C!@x>8;%<@V4blb@CV(L!6LgcY+|S}CQILV9OKol;5}L5P`!v<((4=u280O)RCXpi<r_@g-ee^6=&9Vo8*{JFxe)?xlu(=m=6qDWfQ(g%ZbTPADam`=jlNiCbliWF#qmY||Vx2+MeTBebA5-l(?_PV<td0f_J-vBkV>DS*(%id!SBsItabW4)9{8ZGdQ5K>^9)@d1*VdspnLdKu*&UodeGQt>VMBi_Gr@2pq`K-zkWsLF0X<?)=)+k1?%4}gAEg;5}g6FMwUdxlD$N*joA*`q`cQ9<U7D5PfoUl?jDTEP~?~)$sgi|8n%Xwim;l||e#L!9zU+X@S&_dD}KeYB4(VZUw(LP${@z~d68RpR}_nW4)4wJiAWCI%KI}0)u0+x??JhX?)FpZb|{LsjzWqc*$4IoK6XO3tC8t18(v&5-381C*M<|nBSX_yKN{*B`#vCp=+`+|t6%)1uVwAq)tONjGH)o1HMA*52)Y}~!U2GL!nH$LVB)KcGqnl93nztZWfLo}A*?iC<>8A>0gefAb5_}b+;7LL0^(BNkpdmz+t_XjwlHlj76GLP0NubnS*xv*SF@<L&r1_pPpV5RurYaUpKP5nqn{tBIM<Ek>p-4k>=YaTk&sEa95(EeDkkZn+f_%@Pt(d4gK2Q|)!K88w?0%wYHcK}$v<93Fp5dJ0Q&2(XyUh<M$z}l!FHZ*A59RS+{I^*sMs0NA3?#@8c>22CarfImlM1)l4;RTe*k}i{nK;eW}X0nJOAx>v^Z*ad7$;+LUW^-}(1QG18sFx}u|9+>l#_Yx={oXnY7BpyYp4%Xsg!wL=oRK0%<?ajOji}745tX@+5Tfc**>_c)jBSj&OIYNqxG+>!Cx0b=1&k~1bgrfdw1p9tPtLqF|0@={H|_GM4u-owpj_w!%RHTJPbYmPzHE`)-D2~yg}FMm>L=>Ngc0!JyRt@l$x9qDz8cf=<te-S17%4Wvb#S-$(c4J%H1EPPNm6Nx`Z@O1egwKxI2ZE-o?>a9n9<4s?XL(roY0kOn0X+O&Dq8?hn(#|6tmK0B*Xl(D(wNl~#<bY&1O0cbd~4k&oo=6k>#De97ZG<5%u|Idd$HyGvw^rE&KJ_EMQQBPw&zAuD&M5W$L#OZp7k9hYI#ciZmxNbYVyXGiFA<*CydGg+LCuWUTs@e`+d(sO&$T_(Bvf*3avgiDd&>oli5ux*1hdHA-67U8xXf%FymBv#`R-z8;<Dftb$z`XIw*J-Z9roMuql=vN%VVJxE(h}KcQ6MW87%R+($~*~Qwl41eAS0NG530<QHC>v@>b&GLN0TQD^pdX&P&(OSO`gm4=OcZlH{6{9j4z7+k?EI`hnE0SYBU=WD7@H`t{mdHI|PPL0rBNaekBwViU9LucUK@*WPF*7=`p<g+t}oeyFY*tl42hp4U%5_*tGUBxjO{-a)p6%cL=W2-0lc@ynTrVeWb5&d(#_t55NZof#$gT!_*x1nZ9yWIe$fh&+QM5S+MZwxO)XzF|ui$-n0(A`R$Qy%p+5PuZ27y8Ro!CzRN-z#^baOE#vMKu152kqc_uEe5b>C45Wo5#E8l~7*Uzus5Gzb5BAX*?k<7bp$A|h+IBtd0ojzhFK{79rh!n**XitG8_f9fl)rMJuhU$I-Xtsp>%cr780GF28_h!liWNaP`3naMK+8fG+&zKywk~9gL`bdbLq}lV!+n>OF}@PtmEB#zl<?&%R};o(OJm9IUO~w?Xv}lioXOwl(GIvf0Xm&MT}X4_Y1kfHNaMEU?my+*R91ArL}{!}10KGQOn-&jplxS-1-?$_5sj~mYz;{H+|DxX(Jr{VMXiy=lY=As&70u+O8riAdQ<4ocS#u|U)3c`8wWDJVqugqzm7#(B+l6~-=?xSPd%>NSf*jr8NXs{0pQDIOb{0QufQlKV0oFUE?<!-1gzmv6Xs*n9$3fS8(1WuM9gS3pF3}n6Jo9`Nkj7$EF{ErIz)2!3KWeV^&Gc15C*btT$Q^&%y&r{!`&gGl&I?!Q1}s5Br&`QLL-)mDNFj1bF09*L)$w4k?GGBmEGMzeVgXFUh)w(_>SAxYk2UvePQNF41JwUaj?AP<8wOGBG4eo-6?3Gjd{I2s*Nkd-5)qo$K3&N<GUmY87(fRJ3^RAXMFj}AvywWL29wLt<v%@DN8w5)@5^1SsQn!sGZASyyiQdLpbP+zj*n(BXrTWE&auJI&09TJ)OUJDMLIm{pq~qKilKMZ9Bu=8KBlBy*y#Tz>!|^@m*5ZSnlp1zW6dm26un3)1|_2_XHSj`y;Y7I1s)}>)7<=K{Bkv6tKMHrMEwN!$k5|@XML=l?ZMSwsoGP-~$6y?w%miIxVw6`@l5y6)Yswp>cN#m5Lc8k0*TjiYD;Mm+6rN;9pXnIMar^Psq$meyT6idPHv@3p7j?jk_m+pQ|b3>a^wV5Ek!|>49X}1DOtGxVr<oN2U)<L|g9OAmgBAAsGhyzVm=!pNzXpP>qJKsFK&Z2r+^Kfiw?EO8zq8%F+hI-5>Bv5*x`r8~b1#A<coWU^xkJKUb9G?hq0JFnXHLH1^3fcDefkxbc#Ym)}|S6mq8GTwL580%FX1<;Erb&bGbr-2Q|vxO)Sgg(8TSls)#PNAwo*T#|<wX#o$Ud2rftcLeB+uc9)%{LU)LTPVoa$ryKskQ)IYnf6@VeIk-kq%d*@cYlbIhcM%yG47tgA^{(Vjct5<HZ8;N4()^S(H#bYVcZ>oi8F1cI4={Dlo4(REZdr=<L(ibS`p)n&tcro_KT#3XGxjD+K)|*gydH#khz0lz)L<pfbWtrRb4PN9Cxp<n+TLfa(4hsmL|h-_XkRnUh>mMgCV(lMJF->GP%12q$n)zPGNb;OEiM~3VfYwLn@Fp)Rb|#I|SzLO?$Zgfmv^|@=HDr0R9#UZJs4%cc-}Ubvo~CW4z?!>vZ<em%B%R6}}54z2xEBp^xR`gJp1c3rwVt7D~)mP1bZ}Onu2;;)9syLY+wUm5c)rG2Lm9zP#l3hn8U(Ux^Z@AX;AX5qy_4A-+y$t?}6wcXtrsCC0a@tk_|?Fv{H@Dts#W`Z!LDfHV#G@>F3=p5vg(9nD6%e5KR*Bcy#U?*0INra?6AfV)drEDiX2>nQSFQm!bg%1r*Ep>lO`cMJSFP2ZI}oiokjqciSaA=#IFr@0K9fNeTNddb@c;7=EZORiuwJj~;PX$+TX5n!8^@f<b>BU3MVX}(L!9Qcxt65`9u=eF(XDiQ5+_Xkm|^fwps(Ax+F_&S}nk?lf3>vgU?`4GLg?kBJf!nXAvnSN~38>Zpz4?Hr>ahT3B&0|{%z_;lxcd!OD&d-VoLm@hXP<D3+`<~Mt*tS8^v!EK1^CYR_P*TQA9==X<TDR$oyIWNFMl=VC%aSneo}fxV_;S`TU#GcEgQ|^blX;!yJe>B)Ux}92Y3>1<`ig~NdX{u)aCZhM7W<Nytc+L)*KMrBxNSp#Wf)%a6V4cb&O?iUG%vC@M)DMV4}^G;|B>nMbd~_4?=+`nn)8)Sl_g8+d}UT-C05`AVVdKnuSoGZ4Qrrw8!!&p-5=u1^oT@-loyGwe3`}`Xiy<w0~+V2HDPe3oF~fNC!)2cYoaEMyF0jW*J#F>t>s5L3<AAjxO)Q#--VL2OmklH@MU^Lf%=`!7Rucpw*FwA&P!f*-R3mQ-5pTo<mmt+_%0Jt!2Rh6X%rA<zPhOBc8CUP5rj4jcc-9O>Pud#ml7wGI1xY;VFMcH<;##Wnhk5p?k+)r(FA^mbpXk9$a8tg#|qI>YUgE3Gnp<HhAK~%yHB9+vLq^hWq)Oo-)WB9wx_!!2NA<+xujfiFnr}QT~c=U1zSY(;Pz)<+m4{aU^Jr{Bfxh_S#$YKclkMJ9T}!Acb^#Puq@PVnuth6ZD9QLHm$=ljdJ%1QhLO9NtcJvVH+lLv5ef_L^@2D_&S|A{i)Dgs6&tF40o4^8m5he;qDJJzT_qOE-7;&)C)eqoBq(&%NUxk!2f6utP`nT#?ZKX0#bVUChWzkaz~SK`HSy#o-P`9cfesE4coMfyGu-oqq{q(xtcP3B|f%k9~kBC6fDxiWT>xfT9@rEf5j5uf+l00oX>T8M0+C8sIS29bpA;0UI3ZleLkP*&<Mr=cUKUf15EC?djbl4I@2N_tucA{I-R>s{rh=w_X--MKQxVs$xvT`4<l1wfeKWJW&Dp!e}p4w&}1fz<}37FRfmCvp}IKLWz${eyyWTY^yjnf#TyoHWC<6IMpFSPmGOaOdIZxMFL?}n6m;kTlDj9cFK5oZ@?BECT=<G4AIRw<Ss3nKp~0QzFbJ~A-6Lj%H?rn)o-!<Vhsekh<|VH=-4WuhuSf|O`JLvn2w&?yg7wM+$Sa=$W}-CLUp#!7#_0?0-r(l>q@}VtFL{imv3w;@m%Bfhh;zd44D)cC_Q1MKe>%zC8)T}wLa@*RF6QH~F$f?~Ec7KWWq#Wqp{>g_la~p^$=bZ+<9DVFcdwwkL)$vfVcgF40xGf^vLi~K!$7;+BzJ!>I}(+_-4jFz7~yNDOS927#^f!8(YvIK;qDM4o8v}4s^>QSC=KqOK*!hVY<bDU_pxCe5n=>iz9MFZeN^tA;AY_a=*>oVr-=Bq?ya>NCJVFq%6${YS1=Ny2<dZWP3{h1GnaRf@?SiB)%3ApmJkmtv;cRnz+B*OSXcfEMs{AOIgs=f3%*WgkTj_;q<vu9;_eeL^PBGS7SXoQq(}4?@<7Xrc)F$x_?I*R-Tgtd_DvWsc}slVphocJOJ<(JxcdX8!$?+59>TY&tO)*BW(E9N>bUy@Y#@H8^GN3bq0h>&j*#_|mo5$Ul@29kT-;qk&3M_uT<#75Uq|BTkOw5gxa%vJ0ZV)u^5yOi6H+E0GiYwC`4fgjY25u`(_PjWC%xn?@>#%_`Rbx^_XvvSq9(s>5Dn7&M}xNQx&EWK&SQ&kSoaB0?p^>~C4Oz|xJ%9;#dk@W(pVSiC4Wh|Lsc5L!U#s_ZQJu{E>d=Ph)nA^Y|f)74em~HF%M!aSomCC@)inFNb^LHZBKT0ib^q~2EJ@fmW#VPu;6c89(%(u?oMIhOHf%WNDKMw%iSd?k_M7y8tby1!QCTbjFjs%w>v_4vZRf>L!iV8KlJuU&xL5(=CBOzJ^+|6noeb1@jV$Wy)nNIWuwYun0$mUlQRZ)XFyF==OwRsma4ksuUJwJZO&J!>1B+&2O!3mCy0qtUAZGgA0vbrKjiB)r#I#97Vv>&Scgnw9k*|kFJ%mw-*m@)bjQQ@XiLiO9)TlSF*9f6vp0sjFF>PzKjUjquQib{?Q7lJ_%1TTG>G&e9@_FBnf|>+kY=QH7#TeQDtv8op2D2af>JUyNt1^Udw|Bc`vOdbuY)vs2-2_)lDkisly-VsUVj(TJRO$7-6zZ_US8{7`uIRHOeDT66cQhZgiRD3L>TqfaTXDLa|=;whsjI8lzVYIlwn<_T`FK?hJCOL83PuJ+dztWbJ=ir1yWjjF<|tTl;3^H)9*+*W4L>S%6){i&*itL`wfBCAzfHH8#X2&7f=!D?hx>NEab^FHX$Q^S-QOBrx-nqK)G^;3zP5Y*cqPNAbr8z2@s=~Jd9q1pXreYF!S|k8cfTyz?ZxP-zDX}F<yKY10}uWB?d~0fNA|qV-G->IvO<Yo?s-yI&Nd$(_tB2cN+7OyIXL33w7Cs;6wT-3P6Hn7z7&iS@j}&%P0eY`Dl*^wsoGu@LtA;od*QtGR=3~hGo8!enX&b++BjqlQmtYoU%r;+}*+D!g3)!mEQoqOUf9S95WVtnE?xUdCHl_9-tWU2yNUwfz+XqOk>wep2Cswo7+>CGA{1k0KE7oFmhrdTm&NoNU`9_TW|s~dRjr5JS9yQMzZmBtd-HfhtbQBEqAZLm1X(L6o7=NlLE_2UV7ba%L0mp$xASLAer8vQ4=Bt6zVb^T7UrdwliJ?!|xB~x%~cg9kzL`z>FR~EaXw3LqeMK7#_8uUgmrh<BxP$h9P>Bk5~i)pwWY$Y3wsejFh|uMlS((XVrI`?tF#&e75B`{RvU96hDnd^SJ{l@og**eNBF3bKJ;B<?aund>|S2fCAStpT=%%AThKqz-{gN4Vs08AIY}>-JVQiFM0Xe<~(kHXl#E4zR(9-fV)qKx5AenZj3%sop~+42!_`%egr}k(JV#$5>bR4*;7x4U|q;2x%-0Gn1!UcMo|NmBVV|lyH8vkL3c-h`|9oxV)PLHw!2LeSx`GJv?0)Yvpt=bN$$RY)S%%tM{g!~mzWZbuQP0Cc*#?&iJX9On9lf$rEq8TGR0*W$hLgv0l_%WA>hNI`t7;geM02Op2DEqJ;FXpL-aBm?*1_6Z@b$d?SpAN+CYTvo<Mxb!>6Rn6rTo>Ofe^Jl#w(*gfCkd`W_GLgY7NzpRGL}81+(JVA~(r&aYjcZJ};k?(U$|oVN2zp2IS|>C4?6z{g>4m)Ed8v`Dl7MlV;ByIYKWGN0+oYuw%9ey1nQr}5A-pK07(qDtOIuYjG<O4(p;aD1)%jg1`H04(t(FU3oInZPARpJ`YZ`e@v?-UEVVC;%If-|Y|&&2o2&7(Ijw$jJFJ`JL&Hi0-lt!nQ5ap}|G#JmkneQ#rf4f{*sVI+5x-jq@A=I?ZngHul+;?+}pb%WK^IC*+HI$<wEWx=dr&SLgzm0P$^1)K?<eF~8H<;_eBIgyawp{jt2{afM6DZvij)89ja$B3j08yW7-96uSEY8Nru)bRWm<O@s@X+&zKqk?Cziu(@q_++6{D3>p~^!v)UfL`FW^Llcp{BBPfQx;bbxFKe>Ik=%WPdT!IyZxJoS-5=lxCE{167%hOQug2)>%k)S^wnapA#&-zFJ}}I8n%}DD5Qx!p!19vUKw1d%Qc~$P8qI@bSO={06&Za2E_|)~3SaW~3BW<ieuG{_>$vX_kZBlqhk$_=BTX4E`4~MMA!fXMLBoG!`Y{?*{5Gx(`!YFWn0$R3SM`#oWZDzTFnJh#eC}R>vOghCL|>l6-Y(B!b0#l<2{n!5?hrbJSy1asN}~f8G`Rai#CW;Enb*3%Jd3R`<)%N{Z+e4ffV)T72q}D<%HsURZ`;%9oq7EmwC6rH%;N3=kR7+L?>4PN`b-1S8|FFe?c(kOh@|ADX|a6gv9nCm7yx|RlVJ|Hd&Ir4F#3;7ckB-=!_yc=>Tw<RvApCRK;aAV&^{dv_!_@L<5y<1V8Oyu&)qBX%2dDYYx;^b6X;Y^#^vJf6X5f}HeeoF<1hY3h%k(nB|gQR^g^1CJs{KA^%rm9MTPIcwLP>*{)@L<NbzA1V2ROt_#jX^(@tJ)8zjRrzoGgrR6R(BWm(8__X#+{Cn>-uSv1#6o@SoPN#jdCP6!cNz9PN$h<v2C(Qx+(6xw0(@M)|ANQQCToq-gi2fqSt9x{;j#hC$u+t?@b9JKB7+jBi9ajJ`EW1?R2l+tAzv_14kWLuMuC_q>zPor0H-^P_8qlAwOZ6S?;WBCduJ{&y_8t%>@n(%#K9!<$no%|#K_mSz0*EnC%)Q4!=#@!)YSTP^=fCuz5854}al9!*QjRP4MmzOQf<n9Y#2{#vVaAZ%tOk*F|Mxz(Wr{G%b%hJW&8)O>BaTw?~orOLh6`*8HCoeJf$n**>tuJ}{7t7nWh=>M#WP0<J7|9IN)_2(NkWOq+;k*8lT++YfFBXAJ!#e%>?2gN{%h&hOAc-4@Ha;Z7KAV<uXRt(x`+;$x&O=`wB*Q{9ZSx~p7RqSP<?aEn@MY^^ArA!js*It*;MDJQridbyc@}n}ojkmxtf8h%V;>O=&vk%8p6fLZm%A^pz_&vW0Lie8yHiM1)>s_~O1^aR@lq8;4YV<@VF6^|J9dVhRqj5~?d{?Awk<FDP^a_jO?R2*LL7HbKzbBd$AvVEyF<*^>HIkT`Rt6BJd_ix_wdnM=dne&ZHtU#2msobX;`PXj>|OA#%u_%PD7w&na15OHmpO3Y#2!T{Xlv|cijEKrC=tHi4P>hI)G%FhXL-M0DPIQkIENq<ku*GT86t%Y$R+z<Gcg-RkjZ#!?qpbfpvb<Hav%booUZup3B`4m~SHhWa1;!Z=o;wibVgCGWHSD+1(eY@MSB$YQlKQL--JoUX}9$O15<J5JnkEi>%2b8SegIp}^>6(5NO4A4rCMXzapQ>dW+q<U;BtZz1&(gG1>+JNXE@`vi`^LD=;iw=;|jSs+|qr0Vj77%w}W^#<&tJsMw$zW}#wPgiAn1SHckz5-u{J)mh11HN)exyoGJT>{_ULR~2H8`tIH?h9rE8t3!lLY=m8cLkQHb%3;wcELnurIcLh<Rb{97YS(_#z*-i_*8YNq@1xX+ZT6la4+IZeoJ>hfSocwOUfDojq{R+Z*%3`={#NNZ@SAJ=`VicQlMPmb0A~#7x)n1dpxp`-n`@?gusP9+Lj)Lk=&hP(;qGWwnH}Ead!xmIe8D(g*xxi6Cix*B~NXnG7oQHOzA{+^4MxV=IIL2otHd(Ia?ifhd^KQ(&v0ZgS%5?sXw&!8AC(q<Z(uf5b!njfEL=k<m+d9gH~nUbdfBKmwb&d;Rir6ZSxgPV-MJ&1-Lr`@P#}dneNaanf`2V&@@KQH0~a8slVxt6Or6~;$q@!-AnP|!?Y*lVSu|ou*jUJYx3RB^hZSNFg-|yby#H+A$*rk&PZr3maj+;<<FO;jRTyFxsa9x=8Rs9o&lv^^7sLbRH~Fb>E!RM64sX?k_;#|zdThAs-+@*hIJWsz2q4nb=(~RN(a};-$}jX<pXIR*mk-5M4s}+-5<;+zX6RSfC^up@?SupVYvGP`8?Wz|41)+%%;M)m=iWHd5y1J_((oThIQP&{`0}Q?CuNZjlN<d3h^sT;$$g<#wK&Am%N?POI}9*K!ZXIaQ6ftndI&hnwNaWS1@9}q)mRwUmjImFx;JirDRDbZzX)$g1C^%JPJF_fi#bgltClL1~kr7Z-LB9zA}9U^OC30S7!9u{=hbJ?p(mg={`w%nvMV1AdvQGl)Ep8)Jq;xFJDN*U?BNIJhV^dfkZ1Jy>;@oLtpe44<$^Qv$f&w5PEJa;qsEVd`0?5J_vX|1<jzZ)0_s{w2Zq`<Vcb5Weamno^r5(@O9jVKm*YqN{)2$HE+$qnKoYXQ503~9)Xe}oji5-3JuL~JT4@nWm?1CD{Lw+e3m0kpa044bbd~M3=lQ8X^>CI;_eG%j5K})Cosi}(vacq3n(31Cto3k55f{Hj2jGCfV)4$mo+ALf9SY<y?zb>oyOfOD13Q>n3<;!ze~y(7Ys)JiiJ=qIii!F53GbAK?p44Z@S|wF$;xEVEZ<e)v0yzG<rFLFIyK(mhgQrPH&cxkbJSD0U(B?AU;mUxch^os*A?D^a$q3n1+`;e3{ni%U5Ld@MYKsyWsAU`1!&W64@G$jcChDK7Iwh0O(gBMne1w{E$tHWD5*ya(4h=$iZ;n;_eXA{JTB2kj8E6g=`iqbRiZjV7R-2IVshWROUrUWiD(5_%Q9sLJqjQ#C#x`#yV&k)9@Ae8xp6Z!QBI3@nf6jpg~y2?d!LQ_TZ+^G?T9iT#e?p-Ekr6wa1&!bvloPY`f#`6=H|UdRb#>a^>z67Dm>WD@uCV-k|A;x@CoWNf-H&ufPYAVI8o|S8|>(EWq6>)V)E2(RT}Ah0)7Yg};DasK&B<<w6UKg)mx-kIzaQ%wIf|Z($*gAqy5>@-ccEjYfeCFO|87U?eA|1V;Q$XOPY>`3fe!j>Dv{K%jA2rh&B0YadK|LNLnRDO0Dq<jT5esIOSy|9#oI%ox2~UzIU5AJQ<`CO-AJO<UZ3qEb;@Kw+lGKA*j55si5~@=G+vZx6j)&jpkrsAR`bSIFXU6a`U`V~R1R$T$H569_;!BqW*7N9^bt6aWSaxSW`vgp|ZIRgFRjX+j_%0Fda0u<ea*a6|X6x~ge5J?NJ#cNlB%h=@5Qu<dx{NX0jBTliAkoM7L~h}<Tw0L#DjCGU9sQk~d1fi=b<1&=^5fipX=EC4e@At1!@SYkSK*Iw!ZPb5eM3)I*@H4>Lx5_ljdTp0Fo{8>S-M%A`K-tT(z2kU&p1}a?r;J5f$9$=z_O+_J@8@VOowFp}K1{}vRr!VN>ch)9DMWg(06+Id!b$<E**RjKo!+6FfAhObQ@ydKe&J5j^9p2y^O+}DC0{rS^X_}6}alIMkCOJiofwV97t+U9Q3-^asFi-?Yqt!Rq-}?242;+jXI<Z%Hl^HCFyCx-4OB~Eyn|Vl|j~X}{@h-nmx}34WS)~<7?^;U7-}M+mz3?Ail^RS*ba0(buV{%_nu7x*_?edG1M+ZHsiCHB$%4~2Hb;b4k&9l;3|JmjENJ(!i6Z?{pTwf>=yVzV8A7I_A;m-rF$W=CbndG2cZEshj5sTCT(_`PF`iUkN2#Xr)Hn1MRHQi?uBAPs&{v5*^r+)DEZgFW;8k-G#!LM@)w(>PC|n0`6`2cCdDx)T|K{ol>MAy_7Tk^e4S*gMGqF5+JO)>4XvGUM3;8lY+wXV{<kFl(dI<p^h=Lu?HHBzw<w=PjGZjdmTT_)ikmfNaoXD5JDLw2cQPYq-^a(4|1QaARfM)`fni)JJKy0RqnJ>BFU2*xHqi}&R<rFh+5faCe$F7;|zKV--y-|YJU~>v$hBwPeL$$VxZ)*%;=&O!LV5nM4;i_?e#p4oS#|;X2JQe+l&n*8@`DZG&fOwuAzsMrUK<0}tv2!^U3Jw<v*7ee^k|`~Mg+2gQOaVqMV}l9;m5>EbAnIhgU_r9X_2FciSpg9<HT()O$8m|xIDlPVdhsqL(Zf<0qN&NEC}3$<WC>0*&*5c7D%w&`c4!kk1aOU{?>~kz?BuwJoh)#^>I%!?bPLPW5D{m(G#9}o2~#|NVHv??D{!L?;J>+eZzjp@RM75(X$6>wa6jJFji5a%gS*;MgKW3z8-^1N@8uUgfVT7orx%a|Z)WHo)T?+dyv@v*UU4<d$2i%j)baHRc^2Y7<4|up?_kf_5*`2-<iO=IJ>yn<i8X5_Ub0n(2H%)G!$w&pQKqLGK|N5Ar7fqbzwh9JF+fAvf#aT*^~8?I1D{JgW1vEzYSg9`-6g`OL?vt<P}+9A#j2vc4?zSFLpP(;#&|3RW!Yl8#}6~yOy+Zhxk18wXWi8#XFk0`>0}C$vS1$~W9%I$Uw0AQH4Q(>x67sRW(lQsNGt7+l7_d5i@wL9!!!G~y<E1iVh(k7M;C;foZ7lu%*}n<#d@n_8HH!Tl7(&PUZX6Vb-V9i5L;{FNm)-q$MM%|n74ud6&w_hUSsxAHO_b201K#0_x>3JHeJm)YaUJa0tO7sKZ5yTkPDYc-0;)j+p&F?*;tg$R&$`V-8tJ!nGSd`vMhERk8F;v@_o8g2gC9pEdc8@K&hek+qe|3(Krs`8HF|PU|p%6-h|30MNq__A3La(pY=Okw1(y!R4RZszS@k0cGDz`(fE-Ths7mY1wabEJ}Uq0@s1g><L*LeI?T}8L{ppeX@Ki)^3{JsyW!tN(Bu|z&g4>B5L*r(_Q2nJXm%YZh)RMU=jMz5AuPdt#ZL_=<(T&IalAu9RfLed7`NeCNiauKX4eUi&5Uwgm8yhECCjSw1wzo(m~+H+D}#B^Hr(N-R*+C};uB|Q?ZNmk1sgfaDv?rzO&Q6$)(E?9u>n9_yww~~FDcuIrXmH))#yco-ce+#W|k%i-O>&4X`V<@z@qvJV2uYu!Se;J4q%v6kF3=eW^l2O07^un2i=9DQxlUDtUZA-j!>zPMZ}^!MWU8CdLr>A8HS?Y;Et1){D1n7U5LX<bPKO^jL1Kgv#TO}t7$qY68*LHiy%*DvuOE?=Dsp3wA~NR7@~XJy>i^lE2WHf@WP>5Pu(u0fN7WzRui0*qg*krB9!KouM8FiFnc$lLivgV;XRYuS){cp8MrJ;!4IXRkYxxJA2y%I8e4Xr!`X(6TQ*}*Mox8i0p%P*RTEkNvef19@PJyichAt^HAR9HRCTk%;}QrvbJ=3kya9OiDdK?Pl*!>c0&ZLTZ&;;(Ft+5j5Vu5M8+0C`3!xQC(zQzA#lL1%Bw12X@&ON_0M~mztO790@>H>ltQjq&Dwv2(c)QyngllvubIT^)rP3ObA>ojV5QqY;RxglWrUzPPRSot`=yyi<>l7O5Gi?!lUzOENu}{?gZjEn@^~!axMCzPo(d3D@;_fq_7*zF*B4O!rep1nHsT9=@U_nTwU--0vT)b-96xxB&Hk1k3s~|+Je5MJ@t4W9X|6WyNvq$jtX4E)k6F$7cibrG?;x>$cxH?z?jQw$W8*)%k<m?ql1bK0-C6LnWViN!PC^*&87+O*I$#qx#k<)}%b=F&F{V4Tjej+Y?F2%ilp*aH4^WlM%X|~t|kcVDRalvUGLy2jphhVlj!62BXj{<U;yr@o<3ZmHEt?=z5u5;au#2oO=G*BZ606iJFBn%rF9jUFt<>^t}hRtm49U_sh(5?aOKN->GjRRbkDM&)m?W@gYJ_;P_ih>P?q4lkW`u`hDeP0t!Kvp12OPoi$uxqIZ-evITY3@7*%rMmDL^EW`vu$ougS0C+cPU2efkX*=cwKUmRpya&Uba;C3vF+MlmeBEmfe3%=MK&C(+n$YY+@wbWNWo-?;rCO<IoRqrnu5n*?K*Cm?=j0%P4q!6ZKVaKXV|#=BFb-LTGdnp{lbTlKNF{wDBe|R?4g{Xq6X{b2p%kN)L#=wyEci-+2cMDGkN)k#tQ+tE6_OVKsxx<<@OeRVYPygj*`n9f#L;_i>ybLILRa24q2B9`<N>BwbWi%_qeGJo(@d5G0662BFUq*|I7%VP)CAoIZj~s+0}k4Ydr*Z`;o=q<0IsBM>W14fs94+RBMr4Qq5O3lJEPOPpAod^-*y8n?1A2L@KB9E>7pDA!d$$QAT?HcudRJkrTj24osnPk!0^>w0Ct`v>v4V@f7Wp>C@pbbD&XLd+7TaRiw;hKY}3A#;0Lc((kr)YFX<v%lo0n6bv3re|r*NSvi7D`1l<^WxYVVVSs_IJ4d|lyu_rm4b%Ct0KC{>Dwmh{5?x@cS(_(cb#&~HUAQMWyylNst0Q!rhY=2qBP@X#l{e7$c*QRElPzse5Zc}K(H|`%3#U^`@9Xifpk!d#11+D?B&R=Aa!(OE@f+joqS--%at$*t{<N^cPR}BZHTZWZ>m;k_V4iPeh-mJWM<|Qs-RK3i1(YYrGfA^nRpkPb*w#-A6e<AV|2634*x4Y?;A@EiI&}UH+TUmO7QIuDx?_g`<-?MFhPq)x?Dr)NJ*=?Aao)_DJ%M5ar|+^pG!+72S&=#4Me#AjPNp`<~FTFLnZKrl|w&(X)+L%``zgbw|6nc$2OuQb9moCzfCkX4q@J9pN1LNpw;O?FfjZgM&V&=_{~U&cWptn@QlPIM^b-zy7RqGxCN~wabTGN@ROoH)8BmBcWK0?C0!!KC775Yxrp1=-+M9@Kw+Ky08FGZ`Nhto^d0qQ=r&G!qQHPwS$cx!M`iMs%x927X^)Uz^F2VQz)nzZwr`JzfbRxi_p-UOg%O6hgNHCDnn|AVs{%QG)3XX|ix5v>X$ZVd(}!Mni0tgwPdekwI`9A*u3SuB*mU*EuN)|TrhaBgQM1(yLC=|{C;@cOLC#atgH)zFAj{0SqhClm)iB|KV^u9p;93!5R%_f5|NT{o=_`R%D57om*ALb*_!OQu_tl6Q`tWXBxP^Z1j*cAcjLpGfQr<=^ChObIFZTj^CvjTs`oa7#(}`Xyx!KeT$4;1K3<ykeo7}-=v`oW409$($P>c6yB%v<$8d&&8sBpNXkk{<@#UwlYjh0s`P`(qXiu+XD(W-yu?HzW{{)^G!{9#!2;14Vd1QiVvtWYwpwD&z=75#v#jq$G3ZIJD3D&uK6@PX@Ke$rrUsiygLaTIJ^aHILKBTEE<fg+_Ks`|-*2NN;frv@=n3LGJH$m|c^>Z?M0RNv=o=~nrf-<agK7rjOGx^$ZpWYpSh_7=nc3#sDNd{~Lx*N`csjc8OB7kU;-3*D|TZ(&{5v*JcYh)*I#W8Y)S?AO6)L&*9l?NMR7{$|w3b?`TqAp~Wj?wwc866n9z1dgIjj{%&TW_=|Me16q$W*1(!?GAs;4Gf|2hNIy%6m0~yv5OG>qzpkp5wG|QI6A=$u2TTD){-5Jz@4J?1_=-Pv$%b+X@G)^ve`-U7WyYB(mB;KV9gU)0nITwGwF$qsKhgj_)&Q|n4<XeyG_K5uTq51dVeXIiU6H8aX|DV2aJzZ0boWNtZpCA1hbl1|K>-?sYW%VYeZxW!o+7NDp;a#Np?WZFHpE%-O!OTwUp!?Nu|U5qUbD4F-H3ubjETasDOdo_*gJt(_^ctP0tctMHqNv6g@?e=PH?e;(=1Z@=krkBVhShUX*|(Mb$RDX+0<mB+mLqT9z*9Mh914_or{qMJT!o6>_+uiN(h?IH8D~L^PO(Dkd5A1U+8}?mVelR|RQ1ubQF60R&C@64TY`$3B-0EP6;o<r8m}oHi<wbF+&yZZT=U3!NhD?#%QrO2M@Znc*uYf8z?}>nd6QONrCfw%=$(ddESeU?EKjhhEB$n2_<t`<y-D&bs!v6GT%3(u`g5R*bL=&rVv`#?siiPKhzZKnb5YT>@%Xv6L2w_XQ2h8#Ew@`18+~QWcACY8iuinznl!y?#?nUI~83lL#-4E?}$4wEu9JvqncAuv?#GhDkWFEf=tliS=@8A^G)k%BggnNN1lxk*Iqznf7<SlCX24P7O&uI=Oi&gNH6}RuDDQ0G9**P8zpSS!fEK!F+r?nNUr=DnGJ6s<oZ>e5qcV=b*a`3qn=62+l4QRbtSIT;t=)(}mS~0Y0`WQXz}!MQ<<TqqLf`>0t)P&6vJ7RwSM9N*?Zs*lgxYgZd6*k`yrMHQt+AT!cfQh=GQoUT{ET#>@2&VPvpC)JjFxY#jzqA{B9-BJpiw8kIgUpV(jf)gz89;mn`Wf?&hn;`S*ISDhJfFCj-zBiYV6`+$k*@s!b^<+cz(rdK@>Buj&)00T`b88pbaaDeQ2Juz>au&rNnl)7Bga^>zk1pU16(IF`}`2S5iEBFqI(JSh+sGJR^{gA3X56oEH#BP)>r0WeB4s*;zGT!jmT@$_ND&JNofv?6p#t7j73vvM89aBEDg!wY@VZeZl8^l8IvKu{$hVdoBu0c|kho@*fJ-nfAV)pS0`z&^DC{u$tsPLkU!D4<n&s`^_MD8}&w*ObO*aF!Ta-m51UUl>7$*d)MLjc;#YRaZ56&?>r!MM?h>OPcaJsxozOP3Y}Q?TPHoFPgG7ZimlrFq?9$sku9%H+>B^U%P95I_{69@WFom07$%{q;wD6?CwScI;Ga0u%MX%Z+4e$%UD7*gyrAf7KHdY<-$9D`Phr)sn~)B8x;3gqHod8ttnqMOBf~4(LHG`$!U^g;~d;s)pi~GXLur^eEGjGJB70YL%9syF!)O_68rYlGU(;IgXTTnFXq=kB2>*)mkR{uYrFUahG&|#bU{0enNR2nBAtn#MflVYU6TXa>Bqg=?NKKg<?c1{FX!i1(6w6jN)^(enT(`5B##}EHPv!-MCJMH($~y4i%Mm#f%0E7&}Mt26DqjjFsw`WXmfe0M_(BF3x-nm0KeM61h7@?5UWIFeer7cc!yK%*cysV&h8u)L8_+6|hEuPo8w8QHoOG$iHFe;H>md(5?@Vf>X^_iJ>!j!*j#WZ`4UbF+3I$uIs)4*c<Tpzz>wr5m9<N^m9N0fhB&Ua0=yx-zd|>Ce_GPMc-mGKfO45fKcWrFig6oN4>NIW~C?$^whLdDU>GH*uE;1)6gb=t2Il-{p7e87xXs}I_l-mS6f#<coT0+S-PM!a>3C;jYdLmTaG5_0^+h^m>9y%VC9+QHc1;EOHFY-Ss=;Kxmk6kuSmH2bR#yv5l?VQJ`kgPY8jCNuhw9OQz!VoipQJJscA0zo3K^lR8~LuJn%O#dHA*IOqclK)5{2`P$n?^ET?Ma5Gx~`kUHs!9R*X=^dl6)!Z{B}*;fa=G(9=Y`Hx{2;Wfd2vBa6^`m={-n^A@5WHGNef$ueFJSwbIQbZCctJlETNBw!$iDH>?ge?l#SCzA+J`ePKCmvNFg?-(A=!3-YfKq89Uz;E)-2ihbLPbqGCOElka;{obaO^~RC*x>2;hX=uH>@zKWB`6kBr>F-w_PQkJ>sciDDguaLs*V-bDp%UfXYNWuNlicGd(garw>f**=_DmQ!MUQ6{C!h;B~oldcsG$wLFh7_P+St+NTXB)&_=H-MfAmV_w?}qqKf8Vhs%%U<cv{BHe(#Gx3}i$4o8iZp1r@oU0N_o*@57U|(P@cm&6M^$a%SM@j~n$Fw~Xp>r}(Q~A($ylX0CkYR<~qrRhv$S-Hm%^|Ok0~QM-v+~BFxHR1%mMf0z{MHzldrPoNHaxF_Z(|HwvISPz^iWhj061DjBGo(n%E&n`v-+*N58~o_F7^HO(PxYe$^)UI-*nv_PRi=ui4(K+TQ#{R>{5UVE|e%v&^s-J2_sLi7~Xlz!siT8oncRr57Wn#FBBvz#gRCuh{WHw*~OOt-ztjacc(47ACpIfS*26Zki+o!uO3ceRVG9DTpezPP9qFL>Igq5N8Ueq|GrI^C>IwjqtTKP4H+Nf`}Ugad;yKPZR5B!UM~MkEbg|GN^6Y^!JSY87}B{Nce0BE>!?^|G5F%ggQ!Op2-PZNF-f#ZWUEK%PqB?vh7kx>rS_8lURrkbSfoP<6(qy-Ez`feqsN=oVZyG|X92b`Dx8KlM)lbw&Ni4>Q9o`(#?Bjop+cxSKzuBMU)pX&@#eBsiR$B_Gw4yG@g9pGbA{lQ^$+fQMoYpVh`{s5kLISc%R;xDI}=1Jp$|?uQ9B_4L%{0*qCmjSodD+rET$Lz3Dx`hDm*ci03gt6LhKTy<}$cZclKb@Q~)E|AYxiLnI@u?@qJMZAn0rs&sFpt(z_djMpuA;DjfD!jxrX;yW)brR~E(<d$NZS2BQCW1}$>$4y2Xq%Qbnbke;^f<24=TGr5bX@W&Wz&ealu;`b0_k8-)G5Ag5*{~&$|QW4xQp%!7_-HzqsAvfNAur0vBh0!~}v1KGk**IY|PLPN&M~2iQjr|vtGNwtw_W}rnNg(WfhP32LvmQsk|6-A%)v2H@o)I}&{rm@*T5$pi(?~SFak<(4Ew-dKr>(~jD~rmLkg^q`-W(n!*6LsN7h!M<kI;ICy(3mg^H2Z)ReLZsuDF<e4Ctah6}t}t?*=?R6eE^~2^(W(!H`Nu$9}@%%}&+6$695QFrcPGP&MwyG2m$)Ze&U7L=x5%x*$QE+8cy#r@;rl>Dd6Kq6n{FYR;_VcT7NTnv-&&`ZkiMKwns=%7I4<#44l`eZrgKRjX&IRGnJS@u#y|AP;q{)$;cLK55LLGm*#1Rk~J#_0F?0$29Md&f6{ri50|!CXD7|F>j2Uo)i@~*{9-V3>tiG6*%+*GVW_0D0Qe6q2i~&KeE4xIXjcLA8i&gS5Oh`RVdV-T^_N50OI>aq^-a$C65dFZV2rIMD@NvY`90?x7O<1Fn_LtVQGkWWzjgApcSWhTyaz#KH|)NXIgQ?fx<glLYt=o-54@;$*)QV?=tBS16I;53`0`yFY}y8XFZnKvFGzt=afQwVpe@O(}rR2y8WHJSl55-(|wzL2ODJx#ZVi;wc?SX#*<FS?9%|F*3FSde?E|U`$TpZLu6OU#6SvHYQ)zq12^2VCTJ38IPO8E?XdoF&-xxozx|BC{Cqvd!8aq1SLc!@UKkUJF5GploS1-pKM`;kL)8OBL!k`c>tiXJLd&K^=yr*k*P>Qmmjc%Eu<FH0crJDNhWQn+pO|12FS<k-kY%E3V6jXG&D~8vVf7;czCC+A1z3Uo<|{%FG01a?2v;n1^2-|MMF&lL!tWF%I_r5N&2e8xci;x~*367y@|JfEPoiF@abIWKmj~hCFc!53U_|PqB8u*ka5m{hmKzGee54q(N;=xlZaixtOwAEsi1<yGVq*&$cPm$zRhi3vYWZIgg1&H`c;B2PxSNAL_v*oBF~wzzT?yObxtV*$`x)GSOCPn9x{Wsw!MUMN7@%A_it=+=0{@ejN9`avZBpZ-)+YeLbDo4DGS=%1S}4;EvH;fu9{C*^<7j~z=SboZ=JkVMhvkx=@5P+wr~<9tzFehr;mT8)0;}JpQ(E;Nm`86ij$k`Rc4hr?rwYDVDm<2<DQ;RgTBitmT(<y8aXWj6EuMkOG{z$c)^bPHDD0$qWJPSTh{iDGqHVqmVj{dbZ0e!~GrePHACG3w!`&bpdijN1SJD&~#ybaB>$WwREGFzL@;`S>%7eP&`c)q7Mb*^X^@MmKJ{}T7HgLx4r32dYVY`uQx-*|1yU$NjRB?cQ+81hI;|Mh8RBga<04}OaCskPmk!DZnSk^%#(K4p8{G9xcnBg1Fl~_Odwy*9F%Kchla*wD(KB6H{p_`ku<`j7>Ah&lv=IaH<*u^(jL_k_R-S#|I9%6x?4$pDAeaAy23pn#aOZH03OJlYn$4z5yG}|R939tL~C{iyMK6WnnIq9$SalqJ5D>BImp)u7l)kUhP{q?x*s5?5jNC4jo@`6f$mGWB(0)dA6V-|dwcvKevz(!M`K+=v#3^(>fD<rAI<okgJ-{NiY*#(gfkCbE@1Gv-M+S1duO*L{z-hf*jnbSbESNAau^aMZi4&+lGv%HS3o(aAMg8w7OdTLw@eBx`nywKg_yzA5U(i|aCBUv~^9*+-#&1Mh>XnX5atl%oxFgs40E2L{DQCX$ar3b;V&&d`;q&no<cC}ClxNooa#V`%`WHc^&%+e>1leHTi@5ogtzv*vbvACdwDV1U>0xI}vYW^*egk*{5UkjR51>Tm-ZO8-0IK>b_fTYHGNK~PTxWo;XiW%`?c_y|Ec)a(P8+`o$IjR15dWq*<<Z1u(Z!e=%DriURi0y=DSQpoeO0_<UQ)f+CVXS$Og`kN#$)8V`dnHJ>+nt!I7aB@O^cJ+iVV-s1P3U>Xc2^TXH_6pz!Cmfvst$NJ8zMkf5(wv*;OG+%8?fnx;-5ntK#63ECPc2Q35Z=b!`;`7qv6pMH9of`Pc+1=KwW(4_O&JJ8I%q%#mQd;%MPMb(uAf!WUZq=09L^noxFWWvvC28A+)Rn-DdnD^F4<EWT=&d3an^x5*PSor}N&CVswOqJ+uej+2@;}(Grz0b1*b*^;jIyu_AJcVW-(m7_I|5ErjS_>Gd`WH~=WjmCgMr+36jSnoYh;S`>W$D&hUbHv7ZKi7O&#vI8xT4tPM1$0xvD*AzoNhYmXxVcW45+1?Nb<r#2OA`8(9MkcB6dZAkSaw?)V8%yWlij;0{13ef5!O?9R9odh-7L#e|o3xl`Urz_O$eHDM$L!Ki7AkP@eiGh+7^6U_8P4y*;m|tCm{^V7%@ZZOj_P{FA!YAhOe<2TgeK1v0Kv0R(|kcn&dbw2tku0PN6hm=ZMWJ8?s4$%fT^C7?t25gv!ZKHsSSrY4aB(^P(k8q$fXR9IW{4^P8`Mnoy1V#!J*Wye9GG44oPQ^itv+B&<B-JDbr3aE5@mN@^3W$&VdqKrJM(3>?}Y!G7LyE`~q{%U9Y|gp&Mc-+A1;1nM#+d_gWDGA**O=O{F?SVn<~gUAY@>R0Q+*q#w_y_1+NBXBCaFpgD50+v%EFVD?&{7$N7snP9$36^`~2aa%weTFR~X;J^vHXXySKdvi%^AsUnbOjQIhJ^B%Mho}$42i0H_{!RGu7U11Ap)cyea!5-ox!4297subDL+CIkz!;G#qUGTM7<$PRHHc^(`LNr-k%L&UCKo8<Oqyb$k4ANI>*Az>d=iNPLmHU{DN`vzrRY6oQ!v(Mbld0`ZdHaSLe+^X2?{4{Qij@q)M$iOoip`ts}%80T47C2^nX`wOHQ11fMZz&p<=_fzXqo!lxMt+b@_7H)PzeUh>ykJGT&=|c0SCSrI~xXB}hZK6J<~owA8L@(*OP~b&7j#{RI<~q?4%4^Y&BLWZM8uM!-vjLPO{RlYI(E4tU`Yqx2?*Jkem%n*7rt7)t0#c8ZKaR7N^aejjUjXO&f1UmvDW%Znhx`bYA4oV|)Ep_fqQ&Ve;*DG;Ifif$L9=LP#c!P4C&mkjSAA<948nln8p`A%zL7LE!#9@p8O4aFX4W$D;xkkNAm!xTRqpX-YlgzctfY$nx4r<bs>$wS5Trh3OKvuj9EB%B2HFgd#;oSU+I<ttvUwPY<={Yw_IUSgb2{rVz;-XspN?$zI6&!l3x9}np!=x%*TBtC*0xmw8J9>haPfjh_Ql`8&M=ohE6QKboo4L3v#b~yB}@~K~r_FxcWQ}RipY_429(;=l6c<wk7WG@icv~5(X9rawKvW{7x#@D3dc9y5>5*K5$IpVB=YX9*=(0&up`cUdQ+OQqK=N$a#vDb#oYzayT_HM)rI1WP!2ZowSQv`>poNv3l2VCB|EhnR7{4HAmbT31n1QA@X--NyN_N7)NnBc5kwBabAq$<reVmFi1lxnA`c)+jxFo!;uSd?kjprLv_VgOfgJg_7J65Co<WsPdfd!g~F6LE#Ww;Qh-ZeGf6gI6465`5%s*m&^ppOxA;3<+Fv3E6x@o!l9?LlXomGd7mF@k5pDY1iUbgG*C>{8pm13m6LKvWwqME7(GymYCdx-X@@J;sKMZA>7ghf{M|Eg1fMo>&i?GE(@dr-$}f5=74VhwlUx)wI(SV^g!$UDKlmu6EopkluFo?!CEDYqgbI%j7@tCEwP9(;rW6xTN~Ruua%`XWm-OE1gj!55$SrIXx^zID~oopyZpSRLBcpqlA0FmF~7HLH&>2=)$wV3O~4ygJNxqKG`C#{lBFoizOEil66;VlqCv#ZV}kTB-EtTRa2I!Ji!2>~x;J@U#hN^U0T9AGquxv7f6J5B^5TW!t=<xra(W3b5ER9tXX+0ce$uyNhxSdjED7vAVlPMNJs{Z4g5T!)UKtX1hsszTgH9uB{*I=8zd*|Lqm1w$yl#hj%GGm%g-`-##EL8!{5Os)UIw96^gG5_nR)3o*+Z~~{rzcCclA=D2=V8L4@X`EeiK`=?z8EjGsDBY&e<u;<zpE9lDyLXVbd3#jTl$5!(ZDthgyVO_n7m&^zDMoP?BZRnVh(k92e=ne)<`yW4U_>f;xCQm#<ccDEd3ssoB0e&#iEOSn7)9^IAO<j~I@0uxaU;Uy!zUs&-QU@0E!dfmo|uQUF9meM_{G`Nhj!r^K{Azj)^TTtjoOVz7HI>R3ff5JCd3nB&rH$pYv$;w<zrD1i}=AQxL+x_wV=^g*TSRNOpc8QCzndT{8zdth&ON{{C3wwSX0F`<QKPOBI7Ytmbs5^RzqBQ@89VLbB-*}x_Zt{2SwKT-oXwh@SH(P|=(5Eq}ApJf|5Vr?s19cvS-KLI~B8Osfyr^&d|p24I@*IVf$w9ew^O$nk;p%IwBRf0DTO{^ZkB(~tKO@OA$m|bAKlC{6n!K4iMo0jgYn{44%+W}^_tc5U57oxhs%cw`tGf}y2#pVf~L-vLRH;mSGnQJZcR)8NsgbVSbuAOfEwK;Q9$#lbC1EWq2aLx*7Cl!>L@3Yo3Tp-rsv+i$Ocb{M~O^KiMK`!|SHA2;UOF=2#tjX+H)Ryltuw@yAD{b;rmJNU(w@BvJ;}=Xt_6)J=0VG<Y*xb0L3#YSk)*6T6_<@TnX0%!ey$VR8)3)bwI7yL7IW-RUu_MWVs@a%k(G~IrI(`0pwNU{Afc)T!V8OoDdV0soGIZzNe#vA)N*$Y1aD$FYy{OJXX4yPP(fg5$c|}W{HN+1MJfgQ%5Wa)oI?FOs2TXu_&}tFwHSvtVYuo2shZaSudG<gWIfj5-kIIxxc(7uU9R+8@CTRqLWgoaM#Si;olgbhZ^-sZclz1i1KAlI?9b$~wG#ElMLP}ZRXC<RTl1Izz-z{VV6)#~JD8#?@tsrayL}ZTZIt;oaBgH<DRM@q`17{r2FNi{&hb>Qo>k$VOhI=yPkWwX?#^@C!*l;!{g65rQ7pSl+XD*M<wUJV%TtmU^IOHQ}SQOL4{~SQWn8pZMIf5K7o1=t9UgR(m+BN8PSK@v#V~2u(a+6!8NO9tcwv*f`EV;lAF*t=gnI;3sjD!jpb}TT}I2E3VRQaA!`$?0)`;KNDR4e2-)qrX;iEj?&Gt^#z$takFM1(W}Dk%#}N&uRv3&=SC+U7C^L)^|l<pcf?sx;skUQ4zy-y0e35jiV>Tg76b2V6p>b<av>i>P;~qtL|nw=$5j)RRZ}YyNORCg=@|tEUtnOEf|U(%dEm#)TQ70b*9$06mXY@b?@tG$dSDcqCN@-2qi{N2h2~?pB3|OB<C}LGlAGx|0SMcF+(!m2Lch1sLuJ&!G%8BH((KL<6&D*K(1We^EGd_+=GH48cyk#OBN>#-MAHx?V;b;UXTH{Lk?j15|Cd>P7lFUWzt>y^K`V+i?<&CfEj6I_Z{rXx@@C>frNs{J)JSrnx7l(qj)`18MVOR*cc=_k@6_X6*~AxpB~4Q`fPP6vADei@dLJ77p5%Hy~pm13spk4#qURwF*y?U=l$~d^?9FBqhp)x2}wG)V>81xBx<ErAK~c1zAdBLdBnlKGC8zQ@Y?8gs7tk5?*qGb2W(7P^?b6Jk$uE9Ntn&9aFh8Nw)48gz^6DD@DSNaMu6<wN|lOHyBO3zZMh1j2)ksb9*lHkpuJk)y*lOE*gDg^I_!ZI{>7!q_V+d+v@z}iKmC<eGc!?Zz?g-`S)etP}?cqNa9%cvNaVWtE6O$Q#9Wf43kE+&Ux||viZnW15k4u?m)c0TN)L@rms=&nUlA`ig<vTbQn9!fIk6Fj6V+H*nvWnQ9O;!e9$;36+>Kz24^cBxZX#ygEz0io475~3mOG{hJ-PgBB0mVxd*(QV|?7}towzTvigd_CvfX-F))h63ZS=_95`g53<9TqC*Va2_$2|gNmpM_l+WL^JXzJimJK~y%$I=>o9FwvKbS84o0W6MK<1L>j-v}-6CE_<PQhRYfbExdr9Xtr8*d`Eb}{5)3UK0KNp-k1Tan%nEINu`BDdy>^B9yT;Ayzz>)Qel_nQ+*0re9j>KSdUCCso_H`v|CE4V9;a#C{q?n>6QNlTw*pWyox!c_x=S;OKw>UqM$yuoci%r8AZvMfxIx*;yX7`bH@s!tI3j1I`bi$ue<Ll@(@%KMreJra<6NR#s`fdQ7a6pCb_5dXAkiab!?-`sfcN+gotau9fmcZ+(akzy-h15y6lFVHTsCaz?o1bNr8`I~`Hr#I_6djGZHzXp0r#2MNi`v{*jk?s8%c48yUjD<I*@K+#p@HEc^TJQB6+`pDc;^*j54CgD)u=60tZ3N8X1^`KO!dor&`pm@L*-(wvgcSv&y|jaqI+Jmlw$r=$gUm$*%$(0cG7q@3S0fB(uJn4@iIR7;J6Nsi;gvp-1kClqcKKBxEo=E<gc~o<S(b0_mF<vY*p~B-vd+*VCcsko<@a@sn#(`Cw=o(8lW>%bQd&nNgg&Ad6aynqdjyrIEzn=2$$*ww;m}0L(up`TvEJ`8;TleXvW#VNUZyU)&mVrL!2@AVK=ic_F1{>LJ!Nk<J&yE<zCF)DJIag#1FVBzXsPHO^pYD-fq5B<_DINzdH(4H5uN_A;gsjKmV-nT@k`f0p-n@hU*jvqx)}_G@cS&g_^GRzt$$)6(xYi5%8EA-4m=1Q9p8$Z^@tX$rx3KDCFTk{b8GPe_Ae--oI)eq8FuAhfjIrZ=$Tw(7`VkFRiMN*A<|hGe;x{ejfrE=+aSeHF!GUKo6MM=Pl@$S$3?xNb~1{cdD3I%TI^c{p+4S*doMwpK{^-o!+NJNc-c{2ze~>#r0$RxbU}TS`<EBCW>TL2=6%qHPOTz<1UC_ans7rJj=F-G>yA=Ukv8|>+uVx_bPZu9cWg|FIHO4_t_6ZU!I;NGnw&yP>d|$aNOa2%x!9pO3{$?Eo90vU&g(RD=$0Ue-qDdm>DxCTbobNc_2i&wxyfH2=VDsXMn?ddqp2K9Ty!lUqC-LNN1%A?5ye|9l1F^o!wG?PA?tts4_${)V!}OSSf-Nv4KH2w@PVEq3ny2muPabX^8(gTv=&EUQQl_A$i<JyiubWY3UF(<o4Xinin~HJm!|qqz{RF*=y<R%oa_p#Xo=c1ilkORrE=B0dey2lus&2S>KZ+!rDg05Kj=t^+@I@C=!ot-Qs3%i<qk+);?#9;+=#U)$GOo2%yO6yiPWW64Y9;iH|^Ms?S;7fHTX4+)*wV6ujoe}dQS=^fN;R-z*XfLnZ&XQ?N6|mWYr{Ty;Yj)Qk&OJoK2$^TpK{d>B5Y9;va-;2(C;H**|pTWWluX(Q!B7GxzWS*xE>nP*O!p6lQTCQQq8ABB7k87<#qsQg_Dl+!6Y$q?mZ}b7jQPL+3(Eii(q*RK?U3F`|xOcuhwx>qu!B0Xr6;um1%(xwC^Mei`D;Z1R&F<26;*M3=6`yu_I$z7DF&9<kcz1H8awDW0wXpfOf)N5!u7YgjE)r`<6E%Z6MIl;@EZ_Z}`@eNM))i?^@<XjZQVE$i!-%`8_9uOI|4q|GlB{Eay?*76&rUY|&mb~MX{IWYgOb>NyXba+DC0Now8MRd~vbydc)p&6Haz^bQXK9QO~i4N~sm1$i7M@9^QZj==lIunATnW$-WJwZJNZ#XkX3p$EHaRc7FrnuYpTg_J^lK|pp|9knvH%u7+2;qZ_N6eS%7r^nwS2U1N^{w^d|9081c<wQAc;SBu2ppu>_1yt{h=vz7wWFirTjyM_3$0!B3wzra(EaP0`NfjrR#$elwV<cMp%IUWMfoTH(s%j*mbj9FQm&83kV_vdtSV+qdHO&i0zW%ks1G6WypJkE8hPB1sX}x9`XNXT*ffl<mc>k4l;B}VENAs5H3H7bX_?xjCQ(pT0LHdsRp7`a%VEk~)UkFeG2-&Q9|$j86NT^d7nDWNZ`=b0j?8GV_5VipVmGb`G<8D(hZa?H#%DtxqNuP7z>0SFnhgAE9u{0yYZHa(@SBpB<iJd0(^l<IS||XkMC;TgYakBFPP-<P<Oj4AFihdS#|LttC{F$1eSn~0d3vP;4oEIziEZBKYZnn_SQJT@g_g5jk`ftqQT$?_0At@X_Y)y18CEGX{0%npp$hcB2tkR0KzOZCfeorWc+}fos9is%!-t515UkS!<e4G?6#y0TbrptoEETLs6%Z8$6$TtO04NA)P*ZeaaxF0!2`yAgQ(rbNFfafB04TLD{a|?<$?E_E00022NC6Fh03ZMefB`@N3V;DP00<xfD1ZgP02+V;cmNO}0!V-fKmjU%1-JkhAOmQC4Zs09fCu;hARq*YfDu3fN`MJC0Vp5^sDKr~0$P9zcmXgV2FQRJKm%%k4Y&a~AP4Ax9l!&6fDiZqKp+SRfgwNyihvO~0!SbUD1jxw1e$;ocmhx$3P^z|Kn1FR6}SReAPZ=LEx-l3fEV}zU?2>LfiXY^%77U-185)(sDU-W2HJodcmr@C4#<HyKnLo89k>H{AP?w)J-`S0fFJk+fFKYEf<ZtC3V|Uw1c)FJD1t@62pWMScm$9j5=eqcKnW^=CAb8bAQNbUO~45{fhYI`pdb{8f>A&UN`Waj1*jkusDf3%3R;0Hcm=Q^7RZ8GKnrStEw}}^AQ$L@UBC-^fiL(4z#te1gJD1nih(gW2FM^8D1&9d44Q#6cm~iQ8c2g_Kn<#aHMj=YARB0dZNLq>fj9UD;2<1`gK<C(%7HmJ2k0OjsDpLD4%&e`cn9zx9>{}vKo9DHJ-7$>ARp+1eZUX;fj{^M03jd<gn>X13W7m62nZn|D1?Q;5E_C*cnA<7B1nXZKoKf}MYsqUAtPvnjldB)f=BoWAR#1(gpoiJN`gr^2`C{YsDzck5?X>wcnL5eCdh=DKoe?$O}Gg-At&gBoxl@%f=~DfKp`jyg`q$cih@x%3P>R-D21iK6q<rlcnVM<DoBN?KozQjRk#XRAuDKwt-uw!f>-zoU?D7sg|R>u%7R%q3uqxNsD-t_7TSVacnfeLF35$sKo{zQUAPN)Aus5Ky}%dxf?xOxfFUplhQUA>3WH%d42U5yD2Bzr7#f3PcnpvsGDwEWKp857Ww;EOAv0)(&A=HtgJ<{*pdmDfhS5M8N`q-Q4X7bCsD{<R8d`&Ecnz>2HpqtAKpSd<ZMY4%AvfrT-M|}qgKzi^z#%vYhv7gRii2@D4#*)nD2L_19GZi3cn;7ZI!K4<Kpm=sb+``LAv<V??Z6$ngLn82;2}JShw(rj%7b}059lF1sE75y9@>L@cn|O)KFEjpKp*OZeYg*Q_#r>&hyB1G`onne5B~u`1PB2!AP7W(Fc1d<K_mzTu^<>kgK!WJ0zyOx2{9okM1`;r<KaSJhzy}2HUx+05FX+~fQS$wB1Qy>C=n*&M4*Tip(0iUi)axp;zhuS7$GBO1dXT>HsVI$h#a9Kb_9>;5kBHa0Er+WB!&c$C=y2ENFa$Mp(K_BlV}o7;z>Y>C?O@L1eK@~R^m!vi7cTdwgi{x5?+Eyd<ifSCd9;;AQNT6Oq>ZcktWo{nqU)c!cDvhI1wl0#GIfLb;3^E2|SS}^u&|c6MUji_=!IOC<29`7!-t}P#6j(aVQW)qEHlzf>AUINAV~iMWm1vlY&xI3QKV*Fh!=&6q|xmbP7-LDL_T25EY|>RFn!+aVk(ns!$cHf>pE%SMe%fMXZn&vw~LC3R`h2a7C`r6}y60^a@|`D}Y6?5EjFNSQHCmaV(HUvQQSwf>|^RXYnkcMYLcN(qdXri)vvlt_8Np7TRK4aEor?ExrY~2p8gFT#$=$VJ^-Ex=0u5VqLI{cHu7G1-ytC@?u`li+W)%?ghTc7y4pf@QZ%oFa8C<2p9rmU=WOgVK5E`!blhjV_`6ihT$+C2E>RM5@TYF2Z~WKEXKva7#TxjYz&UkF+9e{02v`eWQ+`wQ8G-%$v_z?LuITCmeDd?#>;>iF+*m|44P3hY{t#N8975|jE9}UGkS*4_!&SWXb6p=K{Sen(Ks4NBWWm&rNK0shSPW&P$Ozcjj2I3s)p6L8dxK1XpODGHM)k^_!?j%Y>17q!7s>0*)SVt18t-YwXrtXM%!>3Zv$?`4Y@Hl=tkYJ8+QY5<PE*CH~2>1@Ed;va0Cv)F*pcE;V>MB192n{#j!XTN8@lDj{|Z<4#_b&C`aY69G3%gWDd=-IXFk>@Eo55bc7DkF*-;`=`bCq19hYh)v-EQN9%AMuLE|(4%sm~Xh-d^9k&B_<PLtJJ9Y=}=pDY}cL0yzAv}f$@hBd~<9HyC<e@y42lHqi&f|GNkLV#irU&(?9@gV}V2|vfJ+=q;=pNqVdw`GdAwI?j`6wTM=Hq;zkMtoo)W`Z@AML|^ybt&hKjg>!pdTlre%O!ufj{zx{@5S<qks61{{cV(hyWQN1f+l%kOP815{Lp>APl5|IFJVdK_Z9*nIQavf>aO-azQXi2GJlJgoAVt5As1kNC*)jBZP#M5EF7jP)G_<AuEK1v=A5aLSRS?ks&jLhSU%nazk)P4$&bygopGHAM!(hNDvVsLxhMF5hHR$kVq0yB1?pcG!ZBAM4(6%ks?!sic}FRaz(I67SSSG<ZEz|F5*SL2p9<?Vq}bvkuqXN&IlSwBWh%gu#q<6M&1Y<i6e4kj?j@hVn^->9?2tmWRFA-KGH}0$R7bDfkcoD5<*f)1c@OzB#0!DD3V3ONE(SFc_fe|l1P$CLP;u#CAlP+B$H^8O~Oe!N%Zg}p9GYI5>YZrNJ%L%C8q?Hq!LxKN?1uNaV4(=mc$ZSGD~PlEwLrH1efFzU9wAfNiXpwzXX^B6Jat;h)FRqCdUMsBok$_OqfYCaVF0MnnV+6GEJySHL)hw1e;_NZL&?cNjLE(-vpe56LB(5$VoXdC+7s6q!V?rPS{C1aVPHtp2QP*GEeA9J+UYE1fS#+eX>vZNk8!?{{)}}6oE2O2nr)9C<f)AAe4lnP!<Y9X($fmp+J;~B2gv^MX4wj<)UDejG|FC3P<TE9_6Eel#n7)MhZzODJJElpp=xNQdSB}X(=w{rNES!B2#7xO{pn1<)+}2oT5{93Qy@NKINwXm7pS2h6+(BDn{j~AeE$|RF(=;X(~?TsX&#eB2}geRjDdg<*HzntfEM?%2wejUB#<>6|fRk#L8G9D`my3oE5Z^R@BN`VJmILt-KYu5?AEPT%jv<#je~HypmV+%3k3seZ{Z*6~Gc$1j}F{EQQ6e92UfqSQN`*VJwZsu{;*Y5?Lh6WT7mT#j;!$%#v9&%Vyy$oyD_!7SIw}M9XL)Ev3b@oEFrQT2#wwVJ)r2wY(PC5?f@;Y@sc+#kSlQ+>%>#%WmN<y~Vfu7T^+Ggv)RtF2%*T92ex0T$IalVJ^+ZxjYx>5?!RrbfGSP)y2A87wnQ<w99tkF5Shud>8N%Uc}3IAur{{yqp*Gl3vuydSNf^#l5^2_!3{_%Y30P^~Jv27yOc6^vizXFa5>8{1*TdU<Ay7Aut8Tz#JF^lVB9gf?+TX#=$%o2oqr>%!HvZ6~@9`7z~qPG|YzKFdfFjd>9ZDVnob{Au%P!#GDuulVViNieWJ=#>KoC7!zY;%#5KiHO9u=7#x#hbj*(7F+Ik|{1_k;WQ5F+Au>hA$Q&6Y6FriQl36lLrpY*&Cj(`ojFg!&RHn*UnJa^3vW%A5GF+z1c$qH)X2Oh^88c+2%$S)ogJ#l<nprb!rp>sSHv?zljGUP>bf(VOnLC4L@{FF@Gkm7c_?bTgXabF(88n2Z&={ISgJ=?sqFFSIrqMW>M+0dhjii}0l%~>HnoEOeGL5F$G@Pc>c$!ZGYC?^u88xJ))R>x6gKAQZs#!Ixrq#HbR|9KejjWk9w5HbBnp-1ba80h!HM@q_^cr9DYk*C#5jMky*c2OMb8L`JvQak6hS@Y5XY*{JO|+3V(}vnq8*6iIuuZnnHrs~VbQ^E;ZNN>q5jW$8+>{%0b8gU0x=}alhTXIqck^!GO}vpe^M>Bk8+&ta@J+taH~WU)^c#QkZvalf5jX>f;1nE#b8rw&!cjO2hv76Fhx2eCPQ;No6Nlnd9E)>tFiytNI2(uKbQ}reaXt>n2{|HX<dB?_V{%Ro%1JpYXXUV*mg90>4$O%;GH2${oSI{EZVt}LIXY+O@SL9GbAArc2|7Y&=n$QvV|0!V(n&f>XX!AVrsH&;4%CS{QAg@b9ja4xtj^WJI$1~SY#pxCb-d2k0Xtzw?2H|<Q+CYG*+DyLNA0W~w$pap&f9@IaYydV9lBF@?9Sc6J9$U%>>UZiclwUs`8$9o@Ccs4LwE|0;W<2rC-Eqr#lv_SkK=hfkSFp;p2<UbDv#y4JeVi*Xr9f(c{-2h`8=Q}^qd{hGkQo*=`lU02lb>L)w6n7PwR0#uLt(T9@#T{Xix32J+}w<<R0C#dw5Up@jbr>_<W7vBYcJr@hLuk#^?ATpX8%_mJjo3J`%?HJRj&2eWcIyp+42e`dlCElYO+$_TfI=$NPLA@DqN-&-fuf<;VP-AM}%c)X(~1Kkdi;ydU@zf8@{np+EJ<{@fq@lYjKj{^39U$N&5v02F`(&;TMp1;_v$AOw_v6wm@<Kn=(NJs=1afh5obqCgeM0$m^slz}wR2I4>+$OC;K5EOz$&<G+yCCCJwAQY5>j*bdiK`f{Rxu6%Meqc}xl0h?w2Gt-Nbb}HQ4$46~Xb1729^`|55D*GNLTCsPp(132jt~+`LP}@}F`*{pgq{!-ib7Io3Q?gdWQDE}7Ro|eXbW+nF64#25Eu$WVrUGJp)zEK&JY?(L+VEjtsyqlhTPB_f<tjg4$UDtREO-)9l}F-NDu8HKGcW&&>sRsfk?s#qCrH63Xvf?M2IL6DWXNhh#HY2dPI;Y5=o*-M2RYqCAvhIC=+R-O~i>hktg~@pePiHqESSON|7l#MW`qhsiIZHidvB?dPT4(dc-1GG>d3aEwV+o2p8odU9^jMQ7`gEzX%uwBVja*h*2>zM#l&lB_n0DjF?d~az@Vx8bu>%G>xcHHL^z62peT1^`nip5jW~a-sl^Fqi`gS#t}IxN9O1pp`&!9j@A)7YDezq9l@h`B#-71J*r3c=pNyte58-|5kKlj{^%b8q=2M;1kykvNCn9t9VCR5kQCBFVn_|iAswBE1d$?=M4CtxsUlgVi-eIfl1AD{9H}FDq>luWLXt=tNhGNxnWU41l2VdNQa>w+CAB1%^papwOp-}6i6+$~n{<<KQcluIJBcUtB%kz?fKpHrN<)b#6(yr|l#o(VQc6pSDK#ah^pv1dRFX<li7Hhkt8|sHQdZJRTZt=mC9m|Az*1NeOJj*Fl_j%ume5jKQcG)zEwv@L^p@aKT#`$3i7wS8yL6ZEQeM(adx<agCBO8S08?NROoNFq6(+-Um=IH9QcR19F*PQ~^q3%1WRgsii856t%XFDAQ)bdkn~5`ZCeQSlKvQTEO{0l4l_t}4nov_}QcbIgHMJ(!^qOE(Y?4iXvxzp<CfjtIa8qv5O}mLV^(No+n}8Ep3QodlI1#7fWSou@a!O9hX*n^c=H#576LgAB(rG$Tr|M*#t`m03PTFZZai{L&oxT%z3Qyu`JdvmJWS-6wdP+~~X+5#0_T--46MTwK@@YQNr}|`{?h}5>Px@&;@u&XepGMPv0#E@;Kn*AYRiKKKfjUqKDnTiz1;wBml!JOu5Gq1Rs0l@(DwKt~P#7vhX{Zgwp*oa@`cNP$M2V;oMWRZSi8@gzDn+TN6~&@jl#6;%Fe*mLs2N40YLtz-Q8+3`>8KsWqk5E&`cXhCNC~MSMWl+9kvdXHDoH7+CB>wgl#_Z=P%27EsVPOJs+5&#QdbH~WhpJSrMOg=@={+4Oob^iHKxc^nKDyn3QeUcHMOSLRGV^BZwgMuDLFN#=v1AuQ+Ena<taV2r}$K#@>72bPz5SMHK+(xp)yp53Q;90MYX6H)rx9Vj_OfCsz@cNCKaWsRF>*eVX91}sWug->QtWUQ-P{bC8|ahsVY^b>QtesRHdp`6{~7huIg36s#qnfW)-cfRkrF@;i_Dvt9BJx;#IxMSN$qr6|98Sup(B)%2*vMWR<Lx)v{t%&B|FlD`*w1q}8;dR@KT{T`O#rt+ds)id5XHTY0N*1+K!CxEfdFs$7|?bA_(bmAYD2?5bV4t9J#j;+4FbS3HVd)hl~-ukcmA(pUS6U-c`0^{)U{z!F#ki(nNjgLSYFR>D$P3yWdhsZrIi9M;2vSP@HNO)QF4u`Jfb!dMwgV{I&s)v-L*#{yX)OJt2Kl2x)y*2zLyDNALoESA->T-M8iSusmy%`BQ#vuxJQ!dW>>XOX3y#j|>r&-z(FD`*L=p+&TcmeD#|NGoY6t)<1ZnwHagT2L!$Nv)|xwW^lYx>{H(YiX^m#kIPY*ZNvuD{P6au|>AZmf1R6Xe({0t+mCr+LqgTTW~9G$*s9Xx9XPNx?6ZFZ|SYQ#kcyF-}+mCD{u*}!9}<Vm*F~Gh%0d^uEoW;8kggGT#zerNv_F7xhj|Cx?Gqmb7`*4#ko3{=lWcKpeuBVuF*xhN|)(6U8pN{sjk(<x>}d(dR?$9cFC^UMZ0R3?YdpKD|hLx-Nn0lm+$&rz$<tOui-_!iWgZjUdIc0B`@W*yqH(>a$e61dPOhkHNB`;^|D^q3wvcR?X|tQSNHN>-wS+&FYz_L$XEF?U*`*br7!ihzSvj$a$oNYe#I~OHNWUr{jy*83xDM={k6aNSO4-~{|kTxFab8e2pCx^U<T}fA+Q9dz!n$-YhVuSfkChcCc!2c1*>2d?1Evi45q<07zgWM9_)jGun;D~Mi>bzVJ7T^p|BLD!d4gyYhf<zg~6~GCc|bJ4Xa@`?1tg69Hzr|7!T`VKJ149u^=YIh8S5QVnxh|9Wf-9#FW?)V`5Fri9InW7R9946r*BQ%!*wxESANz*cRhrUCfJpF)$X!#Ml@kV`a>YoiQ|)#?;svV`FX1jlD5A7RTh+9HV1(%#PhLJeJ4w*dF6!eaw&jF+di`1lb@XWQEL-9Wq3g$Q0QkV`PoYkv%d<7Re;pB%@@N%#vL)OqR(s*(T#;oy?PcGEf%EMA;}KWu?rNoibFG%2e4ZV`Z((mAx`p7RzMWETd($%$D6UT$amp*)HQ{y^JjRvR?+wf|)QIX2h(R8M9-C%#xWhTV~8Gu{1Mh_ROGJG?Ql2jG9$5Yj(}BSvJ#V+l-raGjI0Iz*#sGXXA{Vm9z6@&dwP+OK0kAow2ia=FZ;PC4gt~OrFg%dREWu**(K&`AnbfGk(_3{MkPPXaP;24K#vQ&<xr^Lud(2p)E9q*3cZ<LxX4$O`=USidNAq+C{@?8BL>YG>+EMJlaPCX(3IdjWm*0(oEV(Lun~ZrL8oU*3w+sOM_`KO{UE>npV?n+D*f0IZdbSG@eGhdYVuBX+SNg3ALd{)QXx>J8DQRsVTLk#?+dcQ+sMqEviYisYcbRnpL}MSS_n*wXMe0x|&z}YG5s_iM6pt*2<b$J8Nhyt*N!O#@5=JTYGD8Ew0J6xklIOnq9kVcrCB#wY|pI`kG(+Yk)1V3AVvT*b19rJ8Xz8u_?C2#@HI0V|#3WkS(%FHpw>GC|hN-Y?lqQWj4*W**IHg^K73Dw1qa&HrhyAX)|r74Yj2<)wbGLTWfP|uMM`vHrY1YXj^TwZMO}#<u={6+jv`V^KHKkxCJ-iHr$9?aWihm4Y?&Z<+j|ITXS=6&kedoH|aLrs9SZjZr2UFWjF1%-MCwK^KRb_yoERMHr~ivc{6Y44ZWo|^|s#FTYGbF?+w1iH~BW-=v#fWZ}$zq<v0Dd-}qa9^KbtRzy&w~H{b|dfirLi4#6cj1-IZBT!V9P4-UdbI0-l5C|rfJa2F24WjGDD;W%7}^Kc&y#DzE!H{uE#i7Rm??!=+E6sO`=9E)plF7Cy_xWX3WWZaCSaW&4y-8dYV<8<7P<8eLC$Ne}U7vzN8kRx(M&d41(B$wor+>&E*P0q<ZIVcz9q}-IFa#haCT{$e5<+R+E<8ocj%Y8X87v{v=m?Lv#&di-TG?(Vo+?r!^ZO+ZTIXD;R<lLO2b9K(n-8np$=k(m3<8yt^&;2<-x6J~bpc{0AuFx5}Lx<=RouXTGjIPl+x<?1;BAuk0bd;{rS-MMy=`x+B+jQHE({(ye_vt`gs1tRCZPbyvQfKN;9jZ%ps&3V>x>o1vULCB9b+T^O(Yjh^>uw#c%XPYL*KIRi*Xw-UuLE|$PS_1QVpr^p-LXS<$xhiVJ7(AHoZYj7cF|7SO*?8=?X2Ck!*<zD+ig2;*X_LBw*z<KPTY+<a#!xm-MK?|=}z6PJ9gLZ+}*o_ckxc%%{zKm@9f>Z!*}^^o9VlK$M5=`zx#IpFW?Ehfk*HPp20hK2ruC&yoJZ`8lJ;@cn~k*NxX?i@hYChyLcEc<7vE&$MHIz$NP97FXV~5kw@}Mp2<6TC@<xyyp_lDTAs^$c`z^L$-J3I^J?Cwvw1fU=jA+|xAS;j&+~ad59kFwp*Qr1UePmpM-S;GJ*Btwm|oL!dQT7PMLnrE^{8IevwBw#>t#KyxAnMQ*YkQ`5A20Ku{ZX}UfDByXAkYAJ+-&?*k0Rndv6c!#XY$<_vl{TvwL?B@8vzcxA*v7-}8Hae-H2lKEXHm2w&kde1{M5B|gQs_!wW~b9|2v@<qO>C;28H<*R&_@A6^3%%}M_ALr|Qp6~O4zR)N7Mjz=beWvg9p}y3o`c@z7YkjWo^})W_C;Mg}?W=vZ@Al!o+^73?AMfjZzVG(|zu+hQh9B`Oe#Y<kA;09O{FWc{Yktn}`9Z(vC;g@$^{al?@A_fC?5F*<ANT8i-tYT?zwjsi#vl1Bf9CJ}p}+K}{?;G+Yk%(V{lUNZC;#Rj{i}cW@BZPx{HOo+AOGur{_p<*zyK%!2Ot3~fClgYBESTw02d$wY=92%0YbnCC;=xR1+0J;@B(7M45$G&AP4M#9`FN#zz`?`M<59-fhO<-qQDfW0#_glY=JKD1;W4>C<A984XlAS@CM?*9H;|#AP?+;KJW(u!5}CEhaeFwf=2KNBEcl61eYKaY=Tbk2|~drC<Uh=6|90*@CstVET{#yAQ$X{UhoTo!7wNW#~>LjgJ$pyqQNw%2G<}PY=ds_4Z^`VC<o^t9jt?P@DAd^Jg5ivARp|5e((<h!ayhp2O%LWgxkyz9zsNz2o>QXWQ2{-5k5jl7zrieB&39u&=OukOqdBZ;U?sSozN40LQohAMd2tUg{9CGo<dZZ3RU4MWQDEJ6~01P7z<_LETo0C&=%f8T$l@W;V$Hbz0eo_LSPsSh2bzHhQ-hr9z$f943*(BWQNVq89qa37!9T2G^B>r&>CJtY?uwT;Wp%k-Ow9;LvR=lx0yH`hvcvvn!|I54%4AJT!-S29kxSv_zvM=Jd}s?kRFP|dT0;tAwJB9`fwle!+z)w{~<sOhyqa@4n%@j5Dnr%M2HDdAudFQ*bp7!LxhMCQ6f%6idYdX;zh)W8Brr{M2^@IJ>o|Mi6K!Wjzp4J5>4VsM2RU;C9Xu4*b-ghON5CrQ6|nrnphKU;!VVfIZ-F>M4s3aed139ia}8*4#lZQ6pNx!Jc>v$DJsRK$P}BRQ+$e0F)B*Msi@AVVpX(?R}m{_MXk6MxnfuJieC{dhDEVB7Rh2+G>c~uEv7}axE9%BTXc&VZxJrWMY%W^>0({9i+2$(=0&}@7x`je^oxHHFa}1!I2Z|IVKj_~5iur4#kd$5V`FrTj}bCPM#(rCDPv`{jF%BJW=74p898HT^o*YoG=@geI2uV~X*7+e5jCbp)wmj2V{3GcuMsxJM%g$UX=81)jkggu=0@GP8+l`I^o_p}I0i@II2?&%aWsy{5jiGD<+#n3BLDyZCg6t)92E>1H4p#>85jpmX>)UFZ*CO~7OY4Xxbz7Y<dy^`fRPF&{O|@GHUKCHX;4#iVR9`o7zr&@N>g7pE-)|v87vh96#x|i02Kfg5ETLd000#P6?_$r0ZbJL6#x<d04TLD{UAQ^0RRU8002{UV`F7=a|Zwb07hYHY;|&F4*&oFP+@X(X<=+2Mqz1eb#i490000`a%F5`b#7y5AVy(nY;|&F6#x~^4i)AIEETLs6%Z8$6$TtO04N7jbz@^?b8{F6Mqz1eb#i3@001bpFa2Pr0!<MB#;|oUAa9d&01N>{U;xC3X96HFHMFw(s3Rl`^LSUX9n`JdHUDOY{~KPTPi*gZLwj!`Q*i)d0B8WX`DQWzW)Qu^Jwe-XN1}7%##>L0+*1mO9_k_NCv_ZgrU9cy=0ihJ#bb;%51uj}Iy3QQGu}tcj2hzkW~Zfh)L7FZXZOuR?7ra!-@^q+ros>I4CXZmB!C73RC5z75d{s13KohE92{P%hKRocS8hTl=K@1&13xL<9B!={?`?7G47a{W&XiLv0XdxK?e}rybPtDAMSgDxw~lO^$E;&Z`d;S<e#T8nJWn@9@{PMdV(+H7wZ&IM{qAs<Y+tT@<}m~v8P9y)i7W8>(E;D!#%$Yl#(+OR)>vx^woVYCHG*wpC+Eq}8GWPlxN>Vrp1#f#dmy~d6n%{)oG~g<S44`zG0vzF%6l(Jb)~I0O|`}wbw4yuH?-wr`a-4{Qb#JM8o{kCr@F)4ap}HD$<dbk#sz=x1Gi4hDQ=8qdtcld!qXFQ#_fr&Gv%u-Hha6<oftxX-4uiFjaxeFoM1ao&KgcNbnA<~B%kXTlhH)o;pyq#aBE6NZ`_l#r?+Iwtt;6Yqfu}=-4kqmIa4G4-IEIj1|0wqBbH{8YeIKk`JO=0fTu}t+uJp3iN{KS*~MLJw|5J5(<V2J2#8j*>s(gwYIi5M!{OSo-Z6||r#q&RnGq;K4{fT27S3A2ln%Pe6ejYM3mg>;88r|91{oL*O=)v;X>V>{Q*>c;b#oOA7OY4Xybu=V3MROU3nq+-3mi58C<jw@V`F7=a~KCkVQFl2a%BJ+EENP502KlN6#x|w6#@VN02KrooHYO#26JO*Wo=;<5C9bnB?1@+LvL+xVQzUP08AVJ000#XB?1@-OmAahbZKvHB>+qu0000L3MB#<1yFKnV`Tsp1SJ9(3QS>jV`yb$Utx456ikc~94r6;0000L3?%{>22yWhYh`pL08AVJ000#XB?1@?Qg35xWprOtbYXOLb0q*w8~^|S6$~W;7za&hb8~5LZY2Or8~^|S6$~W;7!FNob8~5LZeLS$VRUtKB>+qu0000MtVkIg8H^^-FdP*O88r|91{oL!LvL+xVQzU93>K_N7Jxt&$S@|p2POy{HUKCGX)RN5VPj<&13^VX02wS51Qh@k0ss{N6%Z8y0000c&WZsX6$}|Q5C8@l7zj*nV_|e@Z*CO~7OY4X+`a)8>{up*P$uFr95w(bCRk}>Xkl(=AX8y<Wo&F|bY&n+VRdd}XdpvnZggdGEFeQ@X>MT{FG6f}Wgt&-X=iC}AWUI(ZewU5Q)zT%EFf29b95k7Wq4t8EFe^6cwuuaAXQUA02wS51Qh@k0ss{N6%Z8y0000cyr=;j6$%+O5C8@l7zI#rX=7y-3>K_N7V;hzz8faSkpU+Di~$@N2mk;8001C-Ko|%B0000000cl5=rkw@0000003duo7zh9W000001V8{8EENP502KlN6#x|w6#@VN04AdF1soLw88r|91{oL%Oks6nXk}zyVRRJ?7OY4X<f{c1n#KesfcFF@h^he`7zhB^aGvqx1ppWb0Pw;Fr=b4-7XAS!2msh{p7G=b02l}W@WKYCp#J{=87vh96#x|i02Kfg5ETLd001Vk=ms1W3>h^L00tQt22yWhYh`p53>K_N7MigE7PfXK@|OlC{P6`GHUKCHT5oJ>VQyh)7z9C6OjZCHEENP502KlN6#x|w6#@VN04C7y1{@U(88r|91{oL)Qg35xWprOtbYXOLa}^90tVkBx1r~q?CaCHLCeY~y95w(b2U2BpX>w&`7zROObZK^F02wS51Qh@k0ss{N6%Z8y0000c;D-ww6$}|Q5C8@l7za&hb8~5LZWRm`tVkBP^a&Q^mINk%kqRdK@CF<<04NA)P*ZeaaxF0!2`yAgQ(rbNFfafaEENP502KlN6#x|w6#@VN04DO23mg>;88r|91{oL*O=)v;X>V>{Q*>c;b#oOA7OY4Xybu=V3MROU3nq+-3mi58C<jw@V`F7=a~KCkVQFl2a%BJ+EENP502KlN6#x|w6#@VN02Z2s6BevUCI}Xci3=0}02v$@3_(&-Pggo~V`yb<VHoTLFE1}IFF0pHK|w)LK|w)5K|w)FK|yyxLT5onK|yChLuWxjK|w)6LP0@IK|w)5LqS1FK|w)5LP0@EK|w)5LP0@6K|yChK|w-uK~X_LOhH9KK~QHwK|w@CK|w)5Z9zdnK}S(RK|w(@K|w)5LP0@6K}}REFE2PjK|w`EML|J9K|?`7K|w)9K|w)5K|w)5K|wS@K|w-JVOUOjVOKeISTRm8Sy)mrV|PJ8c2GAjFE3OpFE2PjK|w`EML|J9K|*IiK|w)9K|w)5K|w)5K|y0dK|w-JVOUOjVOKeIK~GdGFE2P_FE1}IK|w)6LQ+9NK|w)hK|w)5LP0@6K|w)5K|w)IK|w)5Rc$$HVKP=QSTRm8Sy)mrV|PJ8K|)k7FE2SwFE1}IK|w)6LQ+9NK|w)TK|w)5LP0@6K|w)5K|w)BK|w)5Rc$$HVKP=QK|w({FE1}IWKb_JFLyyfK~Zl}K|w)5NI^kCK|xVLK|w)5K|w)5LuWxjK}C3IWLHjaT31qLSy)j)K~7>XFE2PjK|x7Da8NHVFLyyfK~YUnK|w)5NI^kCK|xVLK|w)5K|w)5LQz3MK}JG(VOLIUK|xtTLqS1DK|xtTK|w)5K|x7DF;FirFLyyfK~YsvK|w)5NI^kCK|xVLK|w)5K|w)5LqS17K}C3WSu#d2VOKeIK|w)5K}~8eFE2PzK|)bMLqS1DK|y0dL_tA8K|(=6ML|J9K|w)5K~YsvK|w)5NI^kCK|xVLK|w)5K|w)5LU%zyK}Ak>Vpu|GVs2|eLP0@AK|xVLK|w)102m)|VRCVGWppiLaBwYQa&m8XAa-SPb7^mGAUQ5DE-)F48~^|u000~S02}}S8~^|u000~S02}}S0GI{<08l|vF#"
         )
+        _table = pq.read_table(io.BytesIO(decoded))
 
-    return pq.read_table(io.BytesIO(_decoded))
+    return _table
 
 
 def schema():
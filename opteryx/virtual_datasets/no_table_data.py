@@ -18,13 +18,20 @@ from orso.types import OrsoTypes
 
 __all__ = ("read", "schema")
 
+_table = None
+
 
 def read(*args):
     import pyarrow
 
-    # Create a PyArrow table with one column and one row
+    global _table
+
+    # Create a PyArrow table with one column and one row, the table is immutable
+    # so the same one is handed out on every read
+    if _table is None:
+        _table = pyarrow.Table.from_arrays([[0]], ["$column"])  # schema=_schema)
 
-    return pyarrow.Table.from_arrays([[0]], ["$column"])  # schema=_schema)
+    return _table
 
 
 def schema():
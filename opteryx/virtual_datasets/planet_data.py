@@ -33,8 +33,10 @@ from orso.types import OrsoTypes
 
 __all__ = ("read", "schema")
 
+_full_set = None
 
-def read(end_date=None, *args):
+
+def _build_full_set():
     import pyarrow
 
     # fmt:off
@@ -64,7 +66,16 @@ def read(end_date=None, *args):
     column_names = ["id", "name", "mass", "diameter", "density", "gravity", "escapeVelocity", "rotationPeriod", "lengthOfDay", "distanceFromSun", "perihelion", "aphelion", "orbitalPeriod", "orbitalVelocity", "orbitalInclination", "orbitalEccentricity", "obliquityToOrbit", "meanTemperature", "surfacePressure", "numberOfMoons"]
 
     # fmt: on
-    full_set = pyarrow.Table.from_arrays(data, column_names)
+    return pyarrow.Table.from_arrays(data, column_names)
+
+
+def read(end_date=None, *args):
+    global _full_set
+
+    # the table is immutable, so it's built once and shared
+    if _full_set is None:
+        _full_set = _build_full_set()
+    full_set = _full_set
 
     if end_date is None:
         return full_set
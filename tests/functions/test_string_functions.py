@@ -54,6 +54,21 @@ def test_random_string():
         assert rs.count("=") == 0
 
 
+def test_hash_digests_are_objects():
+    md5 = string_functions.hash_digests("md5")
+
+    # the type of the result mustn't depend on whether there are nulls
+    result = md5(numpy.array(["a", "b"], dtype=object))
+    assert result.dtype == object, result.dtype
+    assert list(result) == [
+        "0cc175b9c0f1b6a831c399e269772661",
+        "92eb5ffee6ae2fec3ad71c777531578f",
+    ], result
+    result = md5(numpy.array(["a", None], dtype=object))
+    assert result.dtype == object, result.dtype
+    assert result[1] is None, result
+
+
 if __name__ == "__main__":  # pragma: no cover
     from tests.tools import run_tests
 
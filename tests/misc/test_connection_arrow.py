@@ -47,6 +47,30 @@ def test_direct_as_arrow_no_limit():
     assert cur.stats["rows_read"] == 9, cur.stats
 
 
+def test_direct_as_arrow_does_not_copy_morsels():
+    # the battery reads .shape from execute_to_arrow, this shouldn't copy the morsels
+    import pyarrow
+
+    import opteryx
+    from opteryx.constants import ResultType
+
+    morsels = [pyarrow.table({"a": [1, 2, 3]}), pyarrow.table({"a": [4, 5]})]
+    cur = opteryx.connect().cursor()
+    cur._execute_statements = lambda *args: (iter(morsels), ResultType.TABULAR)
+    table = cur.execute_to_arrow("SELECT * FROM $planets")
+
+    assert table.shape == (5, 1)
+    chunks = table.column("a").chunks
+    assert [chunk.buffers()[1].address for chunk in chunks] == [
+        morsel.column("a").chunks[0].buffers()[1].address for morsel in morsels
+    ]
+
+    # a single morsel is returned as it is
+    cur = opteryx.connect().cursor()
+    cur._execute_statements = lambda *args: (iter(morsels[:1]), ResultType.TABULAR)
+    assert cur.execute_to_arrow("SELECT * FROM $planets") is morsels[0]
+
+
 if __name__ == "__main__":  # pragma: no cover
     from tests.tools import run_tests
 
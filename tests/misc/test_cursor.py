@@ -1,3 +1,4 @@
+import datetime
 import os
 import sys
 from decimal import Decimal
@@ -10,6 +11,7 @@ sys.path.insert(1, os.path.join(sys.path[0], "../.."))
 import opteryx
 from opteryx.cursor import CursorState
 from opteryx.exceptions import InvalidCursorStateError, MissingSqlStatement, UnsupportedSyntaxError
+from opteryx.models.connection_context import MAX_HISTORY_ITEMS
 
 
 def setup_function():
@@ -24,10 +26,21 @@ def test_execute():
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM $planets")
     assert conn.history[-1][0] == "SELECT * FROM $planets", conn.history
+    assert conn.history[-1].completed, conn.history
     with pytest.raises(InvalidCursorStateError):
         cursor.execute("SELECT * FROM $planets")
 
 
+def test_history_items_unpack():
+    conn = opteryx.Connection()
+    conn.cursor().execute("SELECT * FROM $planets")
+    statement, success, executed_at = conn.history[-1]
+    assert statement == "SELECT * FROM $planets"
+    assert success is True
+    assert isinstance(executed_at, datetime.datetime)
+    assert conn.history.maxlen == MAX_HISTORY_ITEMS
+
+
 def test_rowcount():
     cursor = opteryx.query("SELECT * FROM $planets")
     assert cursor.rowcount == 9
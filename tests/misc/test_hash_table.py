@@ -3,8 +3,10 @@ import sys
 
 sys.path.insert(1, os.path.join(sys.path[0], "../.."))
 
+import numpy
 import pyarrow
 
+from opteryx.compiled.structures.hash_table import FlatHashTable
 from opteryx.compiled.structures.hash_table import hash_join_map
 
 def test_hash_join_map_with_null_values():
@@ -98,6 +100,57 @@ def test_hash_join_map_large_null_values():
     assert hash_table.get(hash(49999) * 31 + hash('x')) == [99999]
     assert hash_table.get(hash(None)) == []
 
+def test_flat_hash_table_probe():
+    # 5 and 21 share a bucket, as does 37 which isn't in the table
+    hashes = numpy.array([5, 6, 5, 21], dtype=numpy.int64)
+    null_keys = numpy.array([False, True, False, False]).view(numpy.uint8)
+
+    hash_table = FlatHashTable(hashes, null_keys)
+    key_positions, row_ids = hash_table.probe(numpy.array([5, 6, 21, 37], dtype=numpy.int64))
+
+    # rows with null keys aren't in the table, chains are in row order
+    assert key_positions.tolist() == [0, 0, 1, 2, 3], key_positions
+    assert row_ids.tolist() == [0, 2, -1, 3, -1], row_ids
+
+def test_flat_hash_table_parallel_build():
+    # filling the table from several threads gives the same table as one thread
+    hashes = numpy.arange(10_000, dtype=numpy.int64) % 1_000
+    null_keys = (numpy.arange(10_000) % 7 == 0).view(numpy.uint8)
+    keys = numpy.arange(1_100, dtype=numpy.int64)
+
+    serial = FlatHashTable(hashes, null_keys).probe(keys)
+    parallel = FlatHashTable(hashes, null_keys, 4).probe(keys)
+
+    assert serial[0].tolist() == parallel[0].tolist()
+    assert serial[1].tolist() == parallel[1].tolist()
+
+def test_flat_hash_table_parallel_build_more_workers_than_buckets():
+    # small tables are split into no more shards than they have buckets
+    hashes = numpy.array([3, 3, 1], dtype=numpy.int64)
+    null_keys = numpy.zeros(3, dtype=numpy.uint8)
+    keys = numpy.array([1, 2, 3], dtype=numpy.int64)
+
+    key_positions, row_ids = FlatHashTable(hashes, null_keys, 64).probe(keys)
+    assert key_positions.tolist() == [0, 1, 2, 2], key_positions
+    assert row_ids.tolist() == [2, -1, 0, 1], row_ids
+
+def test_hashed_keys_null_probe_rows_never_match():
+    from opteryx.operators.outer_join_node import _HashedKeys
+    from opteryx.operators.outer_join_node import _vectorized_key_hashes
+
+    probe = pyarrow.table({"k": [1, None, 2]})
+    build = pyarrow.table({"k": [2, 1]})
+    keys = _HashedKeys(build, ["k"])
+
+    # put the hash the null probe row gets into the table, as a collision would
+    null_hash = _vectorized_key_hashes(probe, ["k"])[1]
+    hashes = numpy.append(_vectorized_key_hashes(build, ["k"]), null_hash)
+    keys.hash_table = FlatHashTable(hashes, numpy.zeros(3, dtype=numpy.uint8))
+
+    probe_rows, build_rows = keys.probe(probe, ["k"])
+    assert probe_rows.tolist() == [0, 1, 2], probe_rows
+    assert build_rows.tolist() == [1, -1, 0], build_rows
+
 if __name__ == "__main__":  # pragma: no cover
     from tests.tools import run_tests
 
@@ -0,0 +1,70 @@
+import os
+import sys
+
+sys.path.insert(1, os.path.join(sys.path[0], "../.."))
+
+import pyarrow
+import pytest
+from orso.schema import FlatColumn
+from orso.types import OrsoTypes
+
+from opteryx import EOS
+from opteryx.managers.expression import NodeType
+from opteryx.models import Node
+from opteryx.models import QueryProperties
+from opteryx.operators import HeapSortNode
+
+
+def _heap_sort(limit=2):
+    column = FlatColumn(name="a", type=OrsoTypes.VARCHAR)
+    node = HeapSortNode(
+        QueryProperties(qid="heap_sort", variables={}),
+        order_by=[(Node(NodeType.IDENTIFIER, schema_column=column), "ascending")],
+        limit=limit,
+    )
+    return node, column.identity
+
+
+def test_heap_sort_worker_stopped_at_eos():
+    node, identity = _heap_sort()
+    list(node(pyarrow.table({identity: ["c", "a", "b"]}), None))
+    result = list(node(EOS, None))
+
+    assert result[0].column(identity).to_pylist() == ["a", "b"]
+    assert node._sorter is None
+
+
+def test_heap_sort_worker_stopped_on_error():
+    node, _ = _heap_sort()
+
+    # a morsel without the sort column fails, and the worker is stopped
+    with pytest.raises(KeyError):
+        list(node(pyarrow.table({"other": [1]}), None))
+    assert node._sorter is None
+
+
+def test_heap_sort_worker_stopped_when_closed_early():
+    node, identity = _heap_sort()
+    generator = node.execute(pyarrow.table({identity: ["c", "a", "b"]}))
+    next(generator)
+    generator.close()
+    assert node._sorter is None
+
+
+def test_heap_sort_rechecks_sort_types():
+    node, identity = _heap_sort()
+
+    # fixed width blobs are promoted to variable width ones when the morsels are merged
+    list(node(pyarrow.table({identity: pyarrow.array([b"cd", b"ab"], pyarrow.binary(2))}), None))
+    assert not node._use_pyarrow_sort
+    list(node(pyarrow.table({identity: pyarrow.array([b"b"], pyarrow.binary())}), None))
+    assert node._use_pyarrow_sort
+
+    result = list(node(EOS, None))
+    assert result[0].column(identity).to_pylist() == [b"ab", b"b"]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    from tests.tools import run_tests
+
+    run_tests()
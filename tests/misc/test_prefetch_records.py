@@ -0,0 +1,70 @@
+"""
+Test the background prefetching of records used by the document store connectors.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(1, os.path.join(sys.path[0], "../.."))
+
+from opteryx.connectors.base.base_connector import prefetch_records
+
+
+def test_prefetch_preserves_records():
+    records = ({"id": i} for i in range(1234))
+    assert list(prefetch_records(records, batch_size=100)) == [{"id": i} for i in range(1234)]
+
+
+def test_prefetch_empty():
+    assert list(prefetch_records(iter([]))) == []
+
+
+def test_prefetch_raises_errors():
+    def failing():
+        yield {"id": 1}
+        raise ValueError("broken stream")
+
+    with pytest.raises(ValueError):
+        list(prefetch_records(failing(), batch_size=1))
+
+
+def test_prefetch_raises_base_exceptions():
+    # these aren't Exceptions, but the consumer mustn't take the partial read as complete
+    def exiting():
+        yield {"id": 1}
+        yield {"id": 2}
+        raise SystemExit()
+
+    with pytest.raises(SystemExit):
+        list(prefetch_records(exiting(), batch_size=1))
+
+
+def test_prefetch_small_results_not_threaded():
+    existing = set(threading.enumerate())
+    assert list(prefetch_records(({"id": i} for i in range(10)), batch_size=100)) == [
+        {"id": i} for i in range(10)
+    ]
+    assert not [thread for thread in threading.enumerate() if thread not in existing]
+
+
+def test_prefetch_stops_when_abandoned():
+    existing = set(threading.enumerate())
+    reader = prefetch_records(({"id": i} for i in range(1_000_000)), batch_size=10)
+    next(reader)
+    (fetcher,) = [
+        thread
+        for thread in threading.enumerate()
+        if thread not in existing and thread.name == "opteryx-prefetch"
+    ]
+    reader.close()
+    fetcher.join(timeout=1)
+    assert not fetcher.is_alive()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    from tests.tools import run_tests
+
+    run_tests()
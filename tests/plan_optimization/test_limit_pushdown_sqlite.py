@@ -20,6 +20,10 @@ STATEMENTS = [
     ("SELECT name FROM sqlite.planets;", 9),
     # push limit
     ("SELECT name FROM sqlite.planets LIMIT 1;", 1),
+    # push the limit and offset, the offset is skipped after the read
+    ("SELECT name FROM sqlite.planets LIMIT 3 OFFSET 2;", 5),
+    # an offset alone isn't pushed
+    ("SELECT name FROM sqlite.planets OFFSET 2;", 9),
     # test with filter
     ("SELECT name FROM sqlite.planets WHERE gravity > 1;", 8),
     # pushable filter and limit should push the limit
@@ -20,6 +20,9 @@ STATEMENTS = [
         ("SELECT * FROM $planets WHERE id * 0 = 1", "optimization_constant_fold_reduce"),
         ("SELECT id ^ 1 = 1 FROM $planets LIMIT 10", "optimization_limit_pushdown"),
         ("SELECT name FROM $astronauts WHERE name = 'Neil A. Armstrong'", "optimization_predicate_pushdown"),
+        ("SELECT name FROM $satellites WHERE id = 5 AND name LIKE 'C%'", "optimization_predicate_ordering"),
+        ("SELECT name FROM $satellites ORDER BY name LIMIT 2 OFFSET 1", "optimization_fuse_operators_heap_sort"),
+        ("SELECT name FROM $satellites WHERE id = 5 OR id = 6 OR id = 7", "optimization_predicate_rewriter_or_to_in"),
         ("SELECT name FROM $planets WHERE name LIKE '%'", "optimization_constant_fold_reduce"), # rewritten to `name is not null`
         ("SELECT name FROM $planets WHERE name ILIKE '%'", "optimization_constant_fold_reduce"), # rewritten to `name is not null`
     ]
@@ -0,0 +1,26 @@
+import datetime
+import os
+import sys
+
+sys.path.insert(1, os.path.join(sys.path[0], "../.."))
+
+
+def test_ungrouped_min_max_of_dates_are_timestamps():
+    """
+    Aggregates without a GROUP BY used to read the column through numpy, which returned
+    date64 columns as datetime64[ms], so MIN and MAX of dates are timestamps.
+    """
+    import opteryx
+
+    result = opteryx.query_to_arrow(
+        "SELECT MIN(birth_date) AS earliest, MAX(birth_date) AS latest FROM $astronauts"
+    ).to_pylist()[0]
+
+    assert result["earliest"] == datetime.datetime(1921, 7, 18), result
+    assert result["latest"] == datetime.datetime(1978, 10, 14), result
+
+
+if __name__ == "__main__":  # pragma: no cover
+    from tests.tools import run_tests
+
+    run_tests()
@@ -34,6 +34,11 @@ response is right.
 
 These tests only test the shape of the response, more specific tests would be needed to
 test the body of the response.
+
+The battery can be run in parallel with pytest-xdist, using loadscope so the statements
+in each module stay on one worker and share that module's setup:
+
+    python -m pytest -n auto --dist loadscope tests/sql_battery/
 """
 import os
 import pytest
@@ -436,6 +441,13 @@ STATEMENTS = [
         ("SELECT * FROM $satellites WHERE id = 5 OR name = 'Europa'", 1, 8, None),
         ("SELECT * FROM $satellites WHERE id = 5 OR name = 'Moon'", 2, 8, None),
         ("SELECT * FROM $satellites WHERE id < 3 AND (name = 'Europa' OR name = 'Moon')", 1, 8, None),
+        # OR chains of equalities, integers and strings are rewritten to IN lists, other types aren't
+        ("SELECT * FROM $satellites WHERE id = 5 OR id = 6 OR id = 5", 2, 8, None),
+        ("SELECT * FROM $satellites WHERE name = 'Europa' OR name = 'Moon'", 2, 8, None),
+        ("SELECT * FROM $planets WHERE gravity = 9.8 OR gravity = 3.7", 3, 20, None),
+        ("SELECT * FROM $planets WHERE surfacePressure = 0 OR surfacePressure = 1", 2, 20, None),
+        ("SELECT * FROM $astronauts WHERE birth_date = '1940-01-27' OR birth_date = '1930-08-05'", 2, 19, None),
+        ("SELECT * FROM sqlite.planets WHERE gravity = 9.8 OR gravity = 3.7", 3, 20, None),
         ("SELECT * FROM $satellites WHERE id BETWEEN 5 AND 8", 4, 8, None),
         ("SELECT * FROM $satellites WHERE id NOT BETWEEN 5 AND 8", 173, 8, None),
         ("SELECT * FROM $satellites WHERE ((id BETWEEN 5 AND 10) AND (id BETWEEN 10 AND 12)) OR name = 'Moon'", 2, 8, None),
@@ -743,6 +755,11 @@ STATEMENTS = [
         ("SELECT birth_date FROM $astronauts", 357, 1, None),
         ("SELECT YEAR(birth_date) FROM $astronauts", 357, 1, None),
         ("SELECT YEAR(birth_date) FROM $astronauts WHERE YEAR(birth_date) < 1930", 14, 1, None),
+        # dates have no time part, these are always zero
+        ("SELECT HOUR(birth_date) FROM $astronauts", 357, 1, None),
+        ("SELECT MINUTE(birth_date) FROM $astronauts", 357, 1, None),
+        ("SELECT SECOND(birth_date) FROM $astronauts", 357, 1, None),
+        ("SELECT name FROM $astronauts WHERE HOUR(birth_date) = 0 AND MINUTE(birth_date) = 0 AND SECOND(birth_date) = 0", 357, 1, None),
 
         ("SELECT RANDOM() FROM $planets", 9, 1, None),
         ("SELECT NOW() FROM $planets", 9, 1, None),
@@ -1029,6 +1046,9 @@ STATEMENTS = [
         ("SELECT DISTINCT $planets.id, $satellites.id FROM $planets LEFT OUTER JOIN $satellites ON $satellites.planetId = $planets.id", 179, 2, None),
         ("SELECT DISTINCT $planets.id, $satellites.id FROM $planets LEFT JOIN $satellites ON $satellites.planetId = $planets.id", 179, 2, None),
         ("SELECT planetId FROM $satellites LEFT JOIN $planets ON $satellites.planetId = $planets.id", 177, 1, None),
+        ("SELECT * FROM (SELECT NULLIF(planetId, 5) AS pid FROM $satellites) AS s LEFT JOIN $planets ON $planets.id = s.pid", 177, 21, None),
+        ("SELECT * FROM (SELECT NULLIF(planetId, 5) AS pid FROM $satellites) AS s RIGHT JOIN (SELECT NULLIF(id, 5) AS id FROM $planets) AS p ON p.id = s.pid", 113, 2, None),
+        ("SELECT * FROM (SELECT NULLIF(planetId, 5) AS pid FROM $satellites) AS s FULL JOIN (SELECT NULLIF(id, 5) AS id FROM $planets) AS p ON p.id = s.pid", 180, 2, None),
         ("SELECT * FROM $planets LEFT JOIN $planets USING(id)", 9, 40, AmbiguousDatasetError),
         ("SELECT * FROM $planets LEFT OUTER JOIN $planets USING(id)", 9, 40, AmbiguousDatasetError),
         ("SELECT * FROM $planets LEFT JOIN $planets FOR TODAY USING(id)", 9, 40, AmbiguousDatasetError),
@@ -1544,6 +1564,8 @@ STATEMENTS = [
         ("SELECT * FROM $planets AS P LEFT SEMI JOIN (SELECT id FROM $satellites WHERE name != 'Moon') AS S ON S.id = P.id;", 8, 20, None),
         ("SELECT * FROM $planets AS P LEFT SEMI JOIN $satellites AS S ON S.id = P.id WHERE P.name != 'Earth';", 8, 20, None),
         ("SELECT * FROM GENERATE_SERIES(1, 10) AS G LEFT SEMI JOIN $satellites AS S ON S.id = G;", 10, 1, None),
+        ("SELECT * FROM (SELECT NULLIF(planetId, 5) AS pid FROM $satellites) AS S LEFT SEMI JOIN $planets AS P ON P.id = S.pid", 110, 1, None),
+        ("SELECT * FROM (SELECT NULLIF(planetId, 5) AS pid FROM $satellites) AS S LEFT ANTI JOIN (SELECT * FROM $planets WHERE id > 6) AS P ON P.id = S.pid", 131, 1, None),
         ("EXPLAIN ANALYZE FORMAT JSON SELECT * FROM $planets AS a INNER JOIN (SELECT id FROM $planets) AS b USING (id);", 3, 6, None),
         ("SELECT DISTINCT ON (planetId) planetId, name FROM $satellites ", 7, 2, None),
         ("SELECT 8 DIV 4", 1, 1, None),
@@ -2249,13 +2271,11 @@ STATEMENTS = [
 ]
 # fmt:on
 
+# some statements appear more than once in the battery, running them again tests nothing new
+STATEMENTS = list(dict.fromkeys(STATEMENTS))
 
-@pytest.mark.parametrize("statement, rows, columns, exception", STATEMENTS)
-def test_sql_battery(statement:str, rows:int, columns:int, exception: Optional[Exception]):
-    """
-    Test an battery of statements
-    """
 
+def register_stores():
     #    opteryx.register_store("tests", DiskConnector)
     #    opteryx.register_store("mabellabs", AwsS3Connector)
     from opteryx.connectors import DiskConnector, SqlConnector
@@ -2271,6 +2291,19 @@ def test_sql_battery(statement:str, rows:int, columns:int, exception: Optional[E
         connection="sqlite:///testdata/sqlite/database.db",
     )
 
+
+@pytest.fixture(scope="module", autouse=True)
+def stores():
+    # register once for the whole battery rather than for every statement, this
+    # runs as the module starts so other modules' registrations don't leak in
+    register_stores()
+
+
+@pytest.mark.parametrize("statement, rows, columns, exception", STATEMENTS)
+def test_sql_battery(statement:str, rows:int, columns:int, exception: Optional[Exception]):
+    """
+    Test an battery of statements
+    """
     try:
         # query to arrow is the fastest way to query
         result = opteryx.query_to_arrow(statement, memberships=["Apollo 11", "opteryx"])
@@ -2308,6 +2341,8 @@ if __name__ == "__main__":  # pragma: no cover
     nl:str = "\n"
     failures = []
 
+    register_stores()
+
     print(f"RUNNING BATTERY OF {len(STATEMENTS)} SHAPE TESTS")
     for index, (statement, rows, cols, err) in enumerate(STATEMENTS):
         printable = statement
@@ -65,6 +65,19 @@ def test_skip_on_error():
     cache._consecutive_failures = 10
     assert cache.get(b"key") is None
 
+@skip_if(is_arm() or is_windows() or is_mac())
+def test_get_and_set_many():
+    from opteryx.managers.cache import ValkeyCache
+
+    cache = ValkeyCache()
+    cache.set_many({b"many_one": b"1", b"many_two": b"2"})
+    assert cache.get_many([b"many_one", b"many_missing", b"many_two"]) == [b"1", None, b"2"]
+    assert cache.get_many([]) == []
+    assert cache.errors == 0
+
+    cache._consecutive_failures = 10
+    assert cache.get_many([b"many_one", b"many_two"]) == [None, None]
+
 if __name__ == "__main__":  # pragma: no cover
     from tests.tools import run_tests
     